@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the buckling reliability analysis: crude Monte Carlo against FORM and importance
+sampling, from a likely failure to a rare one, with the number of samples each method needs.
+
+Run from the root of the repository with: python -m Benchmarks.buckling_reliability [--samples N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+from Mechanics.BucklingReliability import BucklingReliability
+
+
+def get_model(load: float) -> BucklingReliability:
+    """ Pinned-pinned 40 mm steel column, 1.5 m long, with scatter in every variable.
+    """
+    return BucklingReliability({'P': [load, 0.1], 'l': [1.5, 0.01], 'E': [207, 0.05, 'lognormal'],
+                                'Sy': [300, 0.08, 'lognormal'], 'C': [1, 0.05, 'uniform'], 'd': [0.04, 0.01]})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.buckling_reliability")
+    parser.add_argument("--samples", type=int, default=10000000, help="Number of crude Monte Carlo samples.")
+    args = parser.parse_args()
+
+    print("{:<10} {:<22} {:>12} {:>26} {:>8} {:>10} {:>10}".format("Load [kN]", "Method", "pf", "Interval", "CoV",
+                                                                  "Samples", "Time"))
+    for load in [100, 80, 60]:
+        model = get_model(load)
+        for name, method in [("Monte Carlo", lambda: model.monte_carlo(args.samples)),
+                             ("FORM", model.form),
+                             ("Importance sampling", lambda: model.importance_sampling(20000))]:
+            start = timer()
+            result = method()
+            elapsed = timer() - start
+            interval = "[{:.3e}, {:.3e}]".format(result["pf_lower"], result["pf_upper"]) if "pf_lower" in result else ""
+            print("{:<10} {:<22} {:>12.4e} {:>26} {:>8.3g} {:>10} {:>8.3f} s".format(
+                load, name, result["pf"], interval, result.get("cov", float("nan")), result.get("samples", ""),
+                elapsed))
+            if not result.get("converged", result.get("form", {}).get("converged", True)):
+                print("{:<10} {:<22} FORM did not converge".format("", ""))
+
+
+if __name__ == "__main__":
+    main()
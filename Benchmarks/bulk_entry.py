@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of bulk entries: many stress states pasted as a block, read from a file, and parsed row by
+row (the path taken when a block has invalid rows).
+
+Run from the root of the repository with: python -m Benchmarks.bulk_entry [--rows N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from timeit import default_timer as timer
+
+import numpy as np
+
+import InputSource
+from EntryManager import EntryManager, parse_rows
+
+# Number of rows of the benchmark.
+ROWS = 100000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.bulk_entry")
+    parser.add_argument("--rows", type=int, default=ROWS, help="Number of rows.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    states = rng.uniform(-500, 500, (args.rows, 2))
+    separators = np.array([", ", ";", " ", "\t"])[rng.integers(0, 4, args.rows)]
+    rows = [repr(a) + separator + repr(b) for (a, b), separator in zip(states.tolist(), separators)]
+    manager = EntryManager(__file__)
+
+    start = timer()
+    with InputSource.use_source(InputSource.ListInput(rows)), contextlib.redirect_stdout(io.StringIO()):
+        values = manager.get_list_of_tuples("Stress state", args.rows, "float")
+    print("Rows typed or pasted one by one:  {:>10.4f} s".format(timer() - start))
+    assert np.array_equal(np.array(values), states)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "states.txt")
+        with open(filename, "w") as f:
+            f.write("\n".join(rows))
+        start = timer()
+        with InputSource.use_source(InputSource.ListInput(["@" + filename])), \
+                contextlib.redirect_stdout(io.StringIO()):
+            values = manager.get_array("Stress states")
+        print("Rows read from a file:            {:>10.4f} s".format(timer() - start))
+        assert np.array_equal(values, states)
+
+    start = timer()
+    values, bad_rows = parse_rows(rows + ["1, a"], ["float", "float"])
+    print("Rows parsed one by one:           {:>10.4f} s ({} invalid row found)".format(timer() - start,
+                                                                                    len(bad_rows)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the finite element buckling solver: mesh convergence of the first critical load
+against Euler's formula for prismatic columns and against a fine-mesh solution for a stepped and a
+tapered column, and time of the sparse eigensolver against a dense one. The reference of the
+non-uniform columns is a Richardson extrapolation of the 64 and 128 element solutions (the error
+decreases as h^4); much finer meshes only add round-off, as K grows as 1/h^3.
+
+Run from the root of the repository with: python -m Benchmarks.column_buckling_fe
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics.NonUniformColumn import NonUniformColumn
+
+E = 207  # GPa
+MESHES = [4, 8, 16, 32, 64, 128, 256, 512]
+
+
+def get_cases() -> dict:
+    """
+    Returns:
+        dict: (segments, boundary conditions, exact first critical load or None) by name.
+    """
+    EI = E*1e9*np.pi/64*0.04**4
+    return {"Prismatic pinned-pinned": ([[1.5, 0.04, 0.04]], ("pinned", "pinned"), np.pi**2*EI/1.5**2),
+            "Prismatic fixed-free": ([[1.5, 0.04, 0.04]], ("fixed", "free"), np.pi**2*EI/(4*1.5**2)),
+            "Stepped fixed-pinned": ([[0.5, 0.05, 0.05], [1.0, 0.04, 0.04]], ("fixed", "pinned"), None),
+            "Tapered pinned-pinned": ([[1.5, 0.06, 0.03]], ("pinned", "pinned"), None)}
+
+
+def main() -> None:
+    print("{:<24} {:>9} {:>16} {:>14} {:>10}".format("Case", "Elements", "P_cr [kN]", "Relative error", "Time"))
+    for name, (segments, conditions, exact) in get_cases().items():
+        if exact is None:
+            coarse, fine = [NonUniformColumn(segments, E, *conditions, elements=n).solve(1)[0][0] for n in (64, 128)]
+            exact = fine + (fine - coarse)/15
+        for elements in MESHES:
+            start = timer()
+            load = NonUniformColumn(segments, E, *conditions, elements=elements).solve(1)[0][0]
+            elapsed = timer() - start
+            print("{:<24} {:>9} {:>16.6f} {:>14.2e} {:>7.2f} ms".format(name, elements, load/1000,
+                                                                       abs(load - exact)/exact, 1000*elapsed))
+        print()
+
+    import scipy.linalg
+    print("{:>9} {:>14} {:>14}".format("Elements", "Sparse (eigsh)", "Dense (eigh)"))
+    for elements in [100, 500, 1000, 2000]:
+        column = NonUniformColumn([[1.5, 0.06, 0.03]], E, "fixed", "pinned", elements)
+        start = timer()
+        column.solve(3)
+        sparse = timer() - start
+        start = timer()
+        scipy.linalg.eigh(column.KG.toarray(), column.K.toarray(), eigvals_only=True)
+        dense = timer() - start
+        print("{:>9} {:>12.3f} s {:>12.3f} s".format(elements, sparse, dense))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the secant formula solver: the design chart family solved in a single vectorized
+bracketing call, against scipy's brentq called once per point, with the residual of the secant
+formula at the solutions.
+
+Run from the root of the repository with: python -m Benchmarks.eccentric_columns [--curves N] [--points N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics import EccentricColumn
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.eccentric_columns")
+    parser.add_argument("--curves", type=int, default=100, help="Number of eccentricity ratios.")
+    parser.add_argument("--points", type=int, default=5000, help="Number of slenderness ratios per curve.")
+    args = parser.parse_args()
+    E, Sy = 207e9, 300e6
+    ratios = np.linspace(0.01, 2, args.curves).tolist()
+
+    start = timer()
+    chart = EccentricColumn.get_design_chart(E, Sy, ratios, 250, points=args.points)
+    vectorized = timer() - start
+    residual = EccentricColumn.get_max_stress(chart["unit_load"], chart["eccentricity_ratios"][:, None],
+                                              chart["slenderness"][None, :], E) - Sy
+    print("Vectorized: {} points in {:.3f} s, max |sigma_max - Sy|/Sy = {:.2e}".format(
+        chart["unit_load"].size, vectorized, np.max(np.abs(residual))/Sy))
+
+    from scipy.optimize import brentq
+    sample = [(r, lk) for r in chart["eccentricity_ratios"][::max(1, args.curves//10)]
+              for lk in chart["slenderness"][::max(1, args.points//100)]]
+    start = timer()
+    for r, lk in sample:
+        brentq(EccentricColumn.secant_residual, 0, min(Sy, np.pi**2*E/lk**2), args=(r, lk, E, Sy, 1), xtol=1e-2)
+    per_point = (timer() - start)/len(sample)
+    print("brentq:     {:.1f} us per point, i.e, about {:.3f} s for the whole chart ({:.1f}x)".format(
+        1e6*per_point, per_point*chart["unit_load"].size, per_point*chart["unit_load"].size/vectorized))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the failure envelopes: number of points drawn per diagram in MPa and in psi, against
+the former sampling of every line every 0.1 units, and point-in-envelope and distance queries on
+large arrays of stress states.
+
+Run from the root of the repository with: python -m Benchmarks.failure_envelopes [--states N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics import FailureTheories
+
+
+def get_theories(Sy: float) -> list:
+    return [FailureTheories.MaximumShearStress(Sy, Sy, Sy, 'MSST'),
+            FailureTheories.DistortionEnergy(Sy, Sy, Sy, 'DET'),
+            FailureTheories.CoulombMohr(Sy, Sy, 1.5*Sy, 'MCT')]
+
+
+def count_former_points(theory: FailureTheories.FailureTheory) -> int:
+    """ Number of points the diagram used to draw for a theory.
+    """
+    points = 0
+    for eqn in theory.no_failure_region_equations():
+        if eqn[0] == 'Equation':
+            points += len(np.arange(eqn[2], eqn[3], 0.1))
+        elif eqn[0] == 'Ellipse':
+            points += eqn[1].shape[1]
+        else:
+            points += 2
+    return points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.failure_envelopes")
+    parser.add_argument("--states", type=int, default=1000000, help="Number of stress states of the queries.")
+    args = parser.parse_args()
+
+    print("{:<10} {:<6} {:>16} {:>16} {:>14}".format("Sy", "Theory", "Former points", "Envelope points",
+                                                      "Envelope time"))
+    for Sy in [300, 60000]:
+        for theory in get_theories(Sy):
+            start = timer()
+            envelope = theory.envelope()
+            elapsed = timer() - start
+            print("{:<10} {:<6} {:>16} {:>16} {:>11.3f} ms".format(Sy, theory.label, count_former_points(theory),
+                                                                    len(envelope), 1000*elapsed))
+
+    rng = np.random.default_rng(0)
+    sigma_1, sigma_2 = rng.uniform(-600, 600, (2, args.states))
+    print("\nQueries on {} stress states (Sy = 300):\n".format(args.states))
+    for theory in get_theories(300):
+        start = timer()
+        inside = theory.contains(sigma_1, sigma_2)
+        contains_time = timer() - start
+        start = timer()
+        distance = theory.distance_to_envelope(sigma_1, sigma_2)
+        distance_time = timer() - start
+        agreement = np.mean(inside == (theory.safety_factor(sigma_1, sigma_2) >= 1))
+        print("{:<6} contains: {:>8.3f} s   distance: {:>8.3f} s   inside: {:>5.1%}   agrees with n >= 1: {:.4%}"
+              .format(theory.label, contains_time, distance_time, np.mean(distance <= 0), agreement))
+
+
+if __name__ == "__main__":
+    main()
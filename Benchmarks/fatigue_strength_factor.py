@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the fatigue strength factor of Mechanics.MaterialDefiner.
+
+Run from the root of the repository with: python -m Benchmarks.fatigue_strength_factor
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from timeit import default_timer as timer
+from Mechanics import MaterialDefiner
+import numpy as np
+
+# Number of materials to construct.
+N = 100000
+
+
+def main(n: int = N) -> None:
+    """ Times the construction of n materials one by one and the computation of f for the same n
+        ultimate tensile strengths in a single vectorized call.
+    """
+    rng = np.random.default_rng(0)
+    Sut = rng.uniform(60, 200, n)
+
+    start = timer()
+    materials = [MaterialDefiner.Material(0.8*s, s, s, 'kpsi') for s in Sut.tolist()]
+    construction_time = timer() - start
+
+    start = timer()
+    f = MaterialDefiner.get_fatigue_strength_factor(Sut, 'kpsi')
+    vectorized_time = timer() - start
+
+    assert np.allclose(f, [m.f for m in materials])
+
+    print("Fatigue strength factor for " + str(n) + " materials:\n")
+    print("\tConstructing Material objects: {:.6} s ({:.4} us/material)".format(construction_time,
+                                                                                  construction_time/n*1e6))
+    print("\tVectorized get_fatigue_strength_factor: {:.6} s ({:.4} us/material)".format(vectorized_time,
+                                                                                         vectorized_time/n*1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the direct stiffness solver on lattice trusses and frames from a few hundred to tens
+of thousands of members: assembly, sparse LU factorization, the solve of every load case with the
+same factorization, and the member checks. Load cases solved one by one with scipy's spsolve (a
+new factorization each time) are timed for comparison.
+
+Run from the root of the repository with: python -m Benchmarks.frame_analysis [--cases N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics.FrameAnalysis import FrameModel
+
+
+def get_lattice(columns: int, rows: int, structure: str, cases: int) -> dict:
+    """ Cantilevered lattice of square bays with one diagonal per bay, fixed on its left side and
+        loaded at random top nodes.
+
+    Args:
+        columns (int): Number of bays along x.
+        rows (int): Number of bays along y.
+        structure (str): truss or frame.
+        cases (int): Number of load cases.
+
+    Returns:
+        dict: Model.
+    """
+    x, y = np.meshgrid(np.arange(columns + 1), np.arange(rows + 1), indexing='ij')
+    nodes = np.column_stack([x.ravel(), y.ravel()]).astype(float)
+    index = np.arange(len(nodes)).reshape(columns + 1, rows + 1)
+    elements = np.vstack([np.column_stack([index[:-1, :].ravel(), index[1:, :].ravel()]),
+                          np.column_stack([index[:, :-1].ravel(), index[:, 1:].ravel()]),
+                          np.column_stack([index[:-1, :-1].ravel(), index[1:, 1:].ravel()])])
+    dofs = 2 if structure == "truss" else 3
+    supports = [[int(node)] + [1]*dofs for node in index[0]]
+    rng = np.random.default_rng(0)
+    load_cases = {str(case): [[int(node), 0, -10] + [0]*(dofs - 2) for node in rng.choice(index[1:, -1], 3)]
+                  for case in range(cases)}
+    return {"type": structure, "nodes": nodes.tolist(), "elements": elements.tolist(),
+            "sections": [{"E": 207, "Sy": 300, "d": 0.05}], "supports": supports, "load_cases": load_cases}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.frame_analysis")
+    parser.add_argument("--cases", type=int, default=10, help="Number of load cases.")
+    args = parser.parse_args()
+    from scipy.sparse.linalg import spsolve
+
+    print("{:<7} {:>9} {:>9} {:>10} {:>14} {:>10} {:>10} {:>10} {:>16}".format(
+        "Type", "Members", "DOFs", "Assembly", "Factorization", "Solve", "Checks", "Total", "spsolve per case"))
+    for structure in ["truss", "frame"]:
+        for columns, rows in [(20, 5), (100, 20), (500, 20), (1000, 25)]:
+            model = FrameModel(get_lattice(columns, rows, structure, args.cases))
+            start = timer()
+            model.solve()
+            total = timer() - start
+
+            K = model.K[model.free_dofs][:, model.free_dofs]
+            F = model.get_load_vectors()[model.free_dofs, 0]
+            start = timer()
+            spsolve(K, F)
+            per_case = timer() - start
+            print("{:<7} {:>9} {:>9} {:>8.3f} s {:>12.3f} s {:>8.3f} s {:>8.3f} s {:>8.3f} s {:>14.3f} s".format(
+                structure, len(model.L), len(model.free_dofs), model.timings["assembly"],
+                model.timings["factorization"], model.timings["solve"], model.timings["member checks"], total,
+                per_case))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Import-time benchmark of every module of the project, measured with python -X importtime.
+
+Run from the root of the repository with: python -m Benchmarks.import_time [--output FILE]
+
+Each module is imported in a fresh interpreter. The report shows the cumulative import time of the
+module, the slowest dependency it pulls in and whether it imports the CLI (main or introduction),
+which library modules must not do. With --output, the results are appended as a JSON line, so the
+import time of each package can be tracked over time.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from glob import glob
+from os.path import basename, splitext
+from typing import List
+
+# Packages whose modules are benchmarked, besides the top-level library modules.
+PACKAGES = ["Calculus", "DataStructures", "ExceptionHandling", "LinearAlgebra", "Mechanics"]
+
+# Top-level modules which are used as a library.
+TOP_LEVEL_MODULES = ["EntryManager"]
+
+# Modules of the command-line interface.
+CLI_MODULES = ["main", "introduction"]
+
+
+def get_modules() -> List[str]:
+    """
+    Returns:
+        List[str]: Dotted names of the modules to benchmark.
+    """
+    modules = list(TOP_LEVEL_MODULES)
+    for package in PACKAGES:
+        modules += [package + "." + splitext(basename(f))[0] for f in sorted(glob(package + "/*.py"))]
+    return modules
+
+
+def get_import_times(statement: str) -> dict:
+    """ Runs a statement in a fresh interpreter with -X importtime and parses its report.
+
+    Args:
+        statement (str): Python statement.
+
+    Returns:
+        dict: Cumulative import time in ms of every imported module, or None if the statement failed.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                             stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    if process.returncode != 0:
+        return None
+
+    imported = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported[name.strip()] = int(cumulative)/1000
+    return imported
+
+
+def measure(module: str, startup_modules: set) -> dict:
+    """ Imports a module in a fresh interpreter with -X importtime and parses its report.
+
+    Args:
+        module (str): Dotted name of the module.
+        startup_modules (set): Modules imported by the interpreter itself, which are not reported
+                               as dependencies.
+
+    Returns:
+        dict: module, cumulative import time in ms (None if the import failed), slowest dependency
+              and whether the CLI modules were imported.
+    """
+    imported = get_import_times("import " + module) or dict()
+    result = {"module": module, "ms": None, "slowest_dependency": None,
+              "imports_cli": any(name in imported for name in CLI_MODULES)}
+    if module in imported:
+        result["ms"] = imported.pop(module)
+        dependencies = [(ms, name) for name, ms in imported.items()
+                        if name not in startup_modules and not name.startswith(module + ".")]
+        if dependencies:
+            ms, name = max(dependencies)
+            result["slowest_dependency"] = name + " ({:.1f} ms)".format(ms)
+    return result
+
+
+def main(args: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.import_time")
+    parser.add_argument("modules", nargs="*", help="Modules to benchmark. Defaults to all of them.")
+    parser.add_argument("--output", help="JSON-lines file where the results are appended.")
+    options = parser.parse_args(args)
+
+    startup_modules = set(get_import_times("pass"))
+    results = [measure(module, startup_modules) for module in options.modules or get_modules()]
+
+    print("{:<56} {:>10}  {:<5}  {}".format("Module", "Time [ms]", "CLI", "Slowest dependency"))
+    for r in results:
+        ms = "failed" if r["ms"] is None else "{:.1f}".format(r["ms"])
+        print("{:<56} {:>10}  {:<5}  {}".format(r["module"], ms, "yes" if r["imports_cli"] else "no",
+                                                r["slowest_dependency"] or ""))
+
+    if options.output is not None:
+        with open(options.output, "a") as f:
+            f.write(json.dumps({"date": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                                "results": results}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the memoization layer on sweeps with repeated inputs: without cache, with the
+in-memory cache, and from the on-disk cache only (as a new process would see it).
+
+Run from the root of the repository with: python -m Benchmarks.memoization [--calls N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import tempfile
+from timeit import default_timer as timer
+
+import numpy as np
+
+import Memoization
+from LinearAlgebra import find_determinant_matrix
+from Mechanics import BucklingCalculator, FailureTheories
+
+
+def get_sweeps(calls: int) -> dict:
+    """
+    Args:
+        calls (int): Number of calls of every sweep.
+
+    Returns:
+        dict: Memoized function and list of (args, kwargs) of every call, by name of the sweep.
+    """
+    rng = np.random.default_rng(0)
+    diameters = rng.choice(np.linspace(0.02, 0.08, 50), calls).tolist()
+    lengths = rng.choice(np.linspace(0.5, 3, 20), calls).tolist()
+    strengths = rng.choice(np.arange(70, 200, 5.0), calls).tolist()
+    matrices = [rng.integers(-9, 10, (7, 7)).tolist() for _ in range(10)]
+    return {"Buckling (1000 distinct columns)": (BucklingCalculator.calculate,
+                                                  [((l, 207, 300), dict(d=d)) for l, d in zip(lengths, diameters)]),
+            "DET envelope (26 distinct Sy)": (FailureTheories.ellipse_envelope,
+                                              [((Sy,), dict()) for Sy in strengths]),
+            "Determinant 7x7 (10 distinct matrices)": (find_determinant_matrix.calculate,
+                                                       [((matrices[i % 10],), dict()) for i in range(calls//20)])}
+
+
+def run(function, calls: list) -> float:
+    start = timer()
+    for args, kwargs in calls:
+        function(*args, **kwargs)
+    return timer() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.memoization")
+    parser.add_argument("--calls", type=int, default=20000, help="Number of calls of every sweep.")
+    args = parser.parse_args()
+
+    print("{:<45} {:>10} {:>10} {:>10} {:>10}".format("Sweep", "Calls", "No cache", "Memory", "Disk"))
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (function, calls) in get_sweeps(args.calls).items():
+            uncached = run(function.__wrapped__, calls)
+            memory = run(function, calls)
+            statistics = function.cache.get_statistics()
+            disk = float("nan")
+            if function.cache.disk:
+                # The disk cache is filled first, and then read as a new process would, with an
+                # empty in-memory cache.
+                Memoization.set_disk_cache_directory(directory)
+                function.cache.clear()
+                run(function, calls)
+                function.cache.clear()
+                disk = run(function, calls)
+                Memoization.set_disk_cache_directory(None)
+            print("{:<45} {:>10} {:>8.3f} s {:>8.3f} s {:>8.3f} s".format(name, len(calls), uncached, memory, disk))
+            print("\t" + ", ".join(key + " = " + "{:.3g}".format(value) for key, value in statistics.items()
+                                   if key != "disk"))
+
+if __name__ == "__main__":
+    main()
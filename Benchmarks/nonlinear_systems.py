@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the nonlinear system solver: many independent 2x2 systems, each with its own
+parameters, solved at once by every method, against scipy's root called once per system.
+
+Run from the root of the repository with: python -m Benchmarks.nonlinear_systems [--systems N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Calculus.solve_nonlinear_system import METHODS, solve_system
+
+
+def F(x: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ x1^2 + x2^2 = a and exp(x1) + x2 = b.
+    """
+    return np.stack([x[:, 0]**2 + x[:, 1]**2 - a, np.exp(x[:, 0]) + x[:, 1] - b], axis=-1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.nonlinear_systems")
+    parser.add_argument("--systems", type=int, default=100000, help="Number of systems.")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(3, 5, args.systems), rng.uniform(-1, 1, args.systems)
+    x0 = np.tile([1., -1.], (args.systems, 1))
+
+    for method in METHODS:
+        start = timer()
+        result = solve_system(F, x0, method, args=(a, b))
+        batched = timer() - start
+        print("{}: {} systems in {:.3f} s, {:.1%} converged, at most {} iterations, {} calls to F".format(
+            method, args.systems, batched, np.mean(result["converged"]), np.max(result["iterations"]),
+            result["evaluations"]))
+
+    from scipy.optimize import root
+    sample = range(0, args.systems, max(1, args.systems//1000))
+    start = timer()
+    for i in sample:
+        root(lambda x: F(x[None, :], a[i], b[i])[0], x0[i])
+    per_system = (timer() - start)/len(sample)
+    print("scipy.optimize.root: {:.1f} us per system, i.e, about {:.2f} s for every system".format(
+        1e6*per_system, per_system*args.systems))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the polynomial root solver: all the roots of many random polynomials of the same degree
+found from a single batched eigenvalue call on their companion matrices, against numpy's roots called
+once per polynomial, with the largest residual |p(x)|/sum(|c_i||x|^i) of the polished roots.
+
+Run from the root of the repository with: python -m Benchmarks.polynomial_roots [--polynomials N] [--degree N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Calculus.find_root_equations import find_polynomial_roots, get_polynomial_coefficients, get_real_roots
+
+# Polynomials with known real roots, which are checked before timing: complex pairs whose real part is
+# also a root, and multiple real roots.
+KNOWN_REAL_ROOTS = {"x*(x**2 + 4)": [0], "(x - 1)*(x**2 - 2*x + 2)": [1], "(x - 1)**3*(x + 2)": [-2, 1, 1, 1],
+                    "(x - 3)**2*(x**2 + 1)": [3, 3]}
+
+
+def get_residual(coefficients: np.ndarray, roots: np.ndarray) -> float:
+    """ Largest backward error |p(x)|/sum(|c_i||x|^i) of the roots of every polynomial.
+    """
+    powers = roots[..., None]**np.arange(coefficients.shape[1] - 1, -1, -1)
+    p = np.einsum('mnk,mk->mn', powers, coefficients)
+    bound = np.einsum('mnk,mk->mn', np.abs(powers), np.abs(coefficients))
+    return float(np.max(np.abs(p)/bound))
+
+
+def check_real_roots() -> None:
+    """ Checks that the real roots of KNOWN_REAL_ROOTS are found, and only them.
+    """
+    for argument, expected in KNOWN_REAL_ROOTS.items():
+        coefficients = get_polynomial_coefficients(argument)
+        real_roots = get_real_roots(coefficients, find_polynomial_roots(coefficients))
+        assert real_roots.size == len(expected) and np.allclose(real_roots, expected, atol=1e-4), \
+            argument + ": expected real roots " + str(expected) + ", got " + str(real_roots)
+    print("Real roots of {} known polynomials: OK".format(len(KNOWN_REAL_ROOTS)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.polynomial_roots")
+    parser.add_argument("--polynomials", type=int, default=20000, help="Number of polynomials.")
+    parser.add_argument("--degree", type=int, default=6, help="Degree of the polynomials.")
+    args = parser.parse_args()
+    check_real_roots()
+    coefficients = np.random.default_rng(0).normal(size=(args.polynomials, args.degree + 1))
+
+    start = timer()
+    roots = find_polynomial_roots(coefficients)
+    batched = timer() - start
+    print("Batched: {} polynomials of degree {} in {:.3f} s, max backward error = {:.1e}".format(
+        args.polynomials, args.degree, batched, get_residual(coefficients, roots)))
+
+    start = timer()
+    reference = np.array([np.roots(c) for c in coefficients])
+    looped = timer() - start
+    print("np.roots: {:.3f} s ({:.1f}x), max backward error = {:.1e}".format(
+        looped, looped/batched, get_residual(coefficients, reference)))
+
+
+if __name__ == "__main__":
+    main()
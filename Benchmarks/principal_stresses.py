@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the principal stress pipeline: closed-form eigenvalues against np.linalg.eigvalsh on
+random, plane, hydrostatic and nearly repeated stress states, and streaming of a stress tensor file
+from disk in chunks.
+
+Run from the root of the repository with: python -m Benchmarks.principal_stresses [--tensors N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import os
+import tempfile
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics import PrincipalStresses
+
+
+def get_tensors(n: int, rng: np.random.Generator) -> dict:
+    """
+    Args:
+        n (int): Number of tensors of every case.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        dict: Array of shape (n, 6) of every case, by name.
+    """
+    random = rng.uniform(-300, 300, (n, 6))
+    plane = random.copy()
+    plane[:, [2, 4, 5]] = 0
+    hydrostatic = np.zeros((n, 6))
+    hydrostatic[:, :3] = rng.uniform(-300, 300, (n, 1))
+    repeated = hydrostatic.copy()
+    repeated[:, 3] = 1e-6*rng.uniform(-1, 1, n)
+    return {"Random": random, "Plane stress": plane, "Hydrostatic": hydrostatic, "Nearly repeated": repeated}
+
+
+def to_matrices(tensors: np.ndarray) -> np.ndarray:
+    sx, sy, sz, txy, tyz, tzx = tensors.T
+    return np.stack([np.stack([sx, txy, tzx], -1), np.stack([txy, sy, tyz], -1),
+                     np.stack([tzx, tyz, sz], -1)], -2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.principal_stresses")
+    parser.add_argument("--tensors", type=int, default=1000000, help="Number of stress tensors of every case.")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+
+    print("{:<16} {:>14} {:>14} {:>10} {:>22}".format("Case", "Closed form", "eigvalsh", "Speedup",
+                                                      "Max error / |sigma|max"))
+    for name, tensors in get_tensors(args.tensors, rng).items():
+        start = timer()
+        closed_form = np.stack(PrincipalStresses.get_principal_stresses(*tensors.T), axis=1)
+        closed_time = timer() - start
+        start = timer()
+        reference = np.linalg.eigvalsh(to_matrices(tensors))[:, ::-1]
+        reference_time = timer() - start
+        error = np.max(np.abs(closed_form - reference))/np.max(np.abs(reference))
+        print("{:<16} {:>12.3f} s {:>12.3f} s {:>9.1f}x {:>22.2e}".format(name, closed_time, reference_time,
+                                                                         reference_time/closed_time, error))
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "tensors.csv")
+        np.savetxt(filename, get_tensors(args.tensors, rng)["Random"], delimiter=",", fmt="%.6f",
+                   header="sx,sy,sz,txy,tyz,tzx", comments="")
+        pipeline = PrincipalStresses.PrincipalStressPipeline(Sy=600)
+        start = timer()
+        pipeline.process_file(filename, output=os.path.join(directory, "principal.csv"))
+        elapsed = timer() - start
+        summary = pipeline.get_summary()
+        print("\nStreamed {} tensors from CSV (with CSV output) in {:.3f} s".format(summary["count"], elapsed))
+        print("\tLargest von Mises stress = {:.6g} at tensor {}, safety factors: MSST = {:.3f}, DET = {:.3f}"
+              .format(summary["von_mises_max"]["value"], summary["von_mises_max"]["index"],
+                      summary["safety_factor"]["MSST"], summary["safety_factor"]["DET"]))
+
+        filename = os.path.join(directory, "tensors.npy")
+        np.save(filename, get_tensors(args.tensors, rng)["Random"])
+        pipeline = PrincipalStresses.PrincipalStressPipeline(Sy=600)
+        start = timer()
+        pipeline.process_file(filename)
+        print("Streamed {} tensors from memory-mapped .npy in {:.3f} s".format(pipeline.count, timer() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Replays recorded sessions of every menu tool in this process, at full speed, and stress-tests the
+entries of EntryManager with long streams of invalid answers.
+
+Run from the root of the repository with:
+    python -m Benchmarks.replay_sessions [--sessions DIR] [--repeat N] [--invalid N]
+
+Sessions are the sample sessions of Benchmarks.startup_time, plus every <function>.txt file in DIR
+(one answer per line, as saved by python main.py --record). Plots are rendered with the
+non-interactive Agg backend, and the tools run inside a temporary directory, so plots and logs do
+not end up in the repository.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from timeit import default_timer as timer
+
+import numpy as np
+
+# Number of invalid answers of the stress test. It is far beyond the default recursion limit.
+INVALID_ANSWERS = 20000
+
+
+def replay(module, answers: list) -> float:
+    """ Runs the main() function of a tool with the given answers. Its output is discarded.
+
+    Args:
+        module (module): Module of the tool.
+        answers (list): Answers of the session.
+
+    Raises:
+        EOFError: If the tool asks for more answers than those in the session.
+
+    Returns:
+        float: Wall time in seconds.
+    """
+    import InputSource
+    source = InputSource.ListInput(answers)
+    start = timer()
+    with InputSource.use_source(source), contextlib.redirect_stdout(io.StringIO()):
+        module.main()
+    return timer() - start
+
+
+def stress_test(n: int) -> dict:
+    """ Feeds n invalid answers, followed by a valid one, to every entry of EntryManager.
+
+    Args:
+        n (int): Number of invalid answers.
+
+    Returns:
+        dict: Wall time in seconds of each entry.
+    """
+    import InputSource
+    from EntryManager import EntryManager
+    manager = EntryManager(__file__)
+    cases = {"get_simple_numerical_entry": (lambda: manager.get_simple_numerical_entry("x", "float"), "a", "1.5"),
+             "get_menu_option": (lambda: manager.get_menu_option("", "", [1, 2], False, False), "3", "1"),
+             "get_str_input": (lambda: manager.get_str_input("Unit", ["mpa", "kpsi"]), "psi", "mpa"),
+             "get_list": (lambda: manager.get_list("Values", "int"), "1 a", "1 2"),
+             "get_list_of_tuples": (lambda: manager.get_list_of_tuples("Point", 1), "1, a", "1, 2")}
+    times = dict()
+    for name, (entry, invalid, valid) in cases.items():
+        source = InputSource.ListInput([invalid]*n + [valid])
+        start = timer()
+        with InputSource.use_source(source), contextlib.redirect_stdout(io.StringIO()):
+            entry()
+        times[name] = timer() - start
+        assert source.remaining == 0
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.replay_sessions")
+    parser.add_argument("--sessions", help="Directory with recorded sessions, named <function>.txt.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of replays of every session.")
+    parser.add_argument("--invalid", type=int, default=INVALID_ANSWERS, help="Invalid answers of the stress test.")
+    args = parser.parse_args()
+
+    from Benchmarks.startup_time import SAMPLE_SESSIONS
+    import InputSource
+    sessions = {function: InputSource.split_session(session) for function, session in SAMPLE_SESSIONS.items()}
+    if args.sessions is not None:
+        for filename in sorted(os.listdir(args.sessions)):
+            if filename.endswith(".txt"):
+                sessions[filename[:-4]] = InputSource.FileInput(os.path.join(args.sessions, filename)).answers
+
+    with open("options.json") as f:
+        options = json.load(f)["options"]
+
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    sys.path.insert(0, os.path.abspath("."))
+    root = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        history = os.path.join(directory, "history.npy")
+        np.save(history, 100*np.sin(np.linspace(0, 200*np.pi, 100000)))
+
+        from importlib import import_module
+        print("{:<72} {:>12}  {:>12}".format("Option", "First replay", "Best replay"))
+        for area in options:
+            for option in options[area]:
+                name = area + " -> " + option['name']
+                answers = sessions.get(option['function'])
+                if answers is None:
+                    print("{:<72} {:>12}".format(name, "skipped"))
+                    continue
+
+                answers = [answer.format(history=history) for answer in answers]
+                try:
+                    module = import_module(area + "." + option['function'])
+                    times = [replay(module, answers) for _ in range(args.repeat)]
+                    print("{:<72} {:>10.4f} s  {:>10.4f} s".format(name, times[0], min(times)))
+                except (Exception, SystemExit) as e:
+                    print("{:<72} {:>12}  {}".format(name, "failed", type(e).__name__ + ": " + str(e)))
+
+        print("\nStress test: " + str(args.invalid) + " invalid answers followed by a valid one.\n")
+        for entry, elapsed in stress_test(args.invalid).items():
+            print("{:<72} {:>10.4f} s".format(entry, elapsed))
+
+        from ExceptionHandling.Logger import LOGGER
+        LOGGER.close()
+        os.chdir(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Load test of the HTTP/JSON service on localhost, with and without grouping of jobs.
+
+Run from the root of the repository with:
+    python -m Benchmarks.service_load [--requests N] [--connections C] [--workers W]
+
+The first request is a single job on a connection which is closed after its response, and its
+response is read till EOF, which checks that worker processes do not hold the connection open.
+Then every connection sends its requests one after another, with keep-alive. Requests cycle through
+sample parameters of the buckling, failure theories, root finding and determinant jobs, and one
+batch request is sent at the end.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import asyncio
+import json
+from timeit import default_timer as timer
+
+import numpy as np
+
+import server
+
+# Sample requests: (job, parameters).
+SAMPLE_REQUESTS = [
+    ("buckling", {"l": 2, "d": 0.05, "E": 207, "Sy": 300, "inf_bdry_condition": "fixed"}),
+    ("failure-theories", {"Sy": 300, "sigmas": [[100, 50], [-80, 120]], "Sc": 400}),
+    ("root", {"argument": "x**3 - 2*x - 5", "start_point": 2}),
+    ("determinant", {"matrix": [[1, 2, 3], [4, 5, 6], [7, 8, 10]]}),
+]
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                  payload=None) -> tuple:
+    """ Sends a request through an open connection and reads its response.
+
+    Returns:
+        tuple: Status and decoded JSON response.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write((method + " " + path + " HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n" +
+                  "Content-Length: " + str(len(body)) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def first_request(port: int, timeout: float = 60) -> float:
+    """ Sends a job through a new connection, with "Connection: close", before any worker process has
+        started, and reads its response till the server closes the connection.
+
+    Returns:
+        float: Time till EOF, in seconds.
+
+    Raises:
+        TimeoutError: If the connection is not closed within timeout seconds.
+    """
+    job, parameters = SAMPLE_REQUESTS[0]
+    body = json.dumps(parameters).encode()
+    reader, writer = await asyncio.open_connection(server.HOST, port)
+    start = timer()
+    writer.write(("POST /jobs/" + job + " HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n" +
+                  "Content-Length: " + str(len(body)) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+    try:
+        response = await asyncio.wait_for(reader.read(), timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError("The connection of the first request was not closed after its response")
+    finally:
+        writer.close()
+    if not response.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError("The first request failed: " + response.decode(errors="replace"))
+    return timer() - start
+
+
+async def client(port: int, n: int, offset: int, latencies: list) -> int:
+    """ Sends n requests through one connection.
+
+    Returns:
+        int: Number of failed requests.
+    """
+    reader, writer = await asyncio.open_connection(server.HOST, port)
+    failed = 0
+    for i in range(n):
+        job, parameters = SAMPLE_REQUESTS[(offset + i) % len(SAMPLE_REQUESTS)]
+        start = timer()
+        status, _ = await request(reader, writer, "POST", "/jobs/" + job, parameters)
+        latencies.append(timer() - start)
+        failed += status != 200
+    writer.close()
+    await writer.wait_closed()
+    return failed
+
+
+async def run(requests: int, connections: int, workers: int, max_batch_size: int) -> None:
+    service = server.JobServer(port=0, workers=workers, max_batch_size=max_batch_size)
+    port = await service.start()
+    first = await first_request(port)
+
+    # Warms up the worker processes.
+    reader, writer = await asyncio.open_connection(server.HOST, port)
+    await request(reader, writer, "POST", "/batch", [dict(job=job, **p) for job, p in SAMPLE_REQUESTS]*workers)
+
+    latencies = list()
+    start = timer()
+    failed = await asyncio.gather(*(client(port, requests//connections, i, latencies) for i in range(connections)))
+    elapsed = timer() - start
+
+    batch = [dict(job=job, **parameters) for job, parameters in SAMPLE_REQUESTS]*250
+    batch_start = timer()
+    status, outputs = await request(reader, writer, "POST", "/batch", batch)
+    batch_elapsed = timer() - batch_start
+    _, metrics = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    await writer.wait_closed()
+    await service.close()
+
+    latencies = 1000*np.array(latencies)
+    print("Grouping up to {} jobs:".format(max_batch_size))
+    print("\tFirst request, read till EOF: {:.3f} s".format(first))
+    print("\t{} requests through {} connections in {:.3f} s: {:.0f} requests/s, {} failed".format(
+        len(latencies), connections, elapsed, len(latencies)/elapsed, sum(failed)))
+    print("\tLatency: p50 = {:.2f} ms, p95 = {:.2f} ms, p99 = {:.2f} ms".format(*np.percentile(latencies, [50, 95, 99])))
+    print("\tBatch of {} jobs: {:.3f} s ({} failed)".format(len(batch), batch_elapsed,
+                                                           sum("error" in output for output in outputs)))
+    print("\tMean group size reported by /metrics: {:.1f}\n".format(metrics["mean_batch_size"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.service_load")
+    parser.add_argument("--requests", type=int, default=4000, help="Number of single-job requests.")
+    parser.add_argument("--connections", type=int, default=32, help="Concurrent connections.")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes.")
+    args = parser.parse_args()
+
+    for max_batch_size in [1, server.MAX_BATCH_SIZE]:
+        asyncio.run(run(args.requests, args.connections, args.workers, max_batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the shaft design solver: random sections and load cases sized by the vectorized
+fixed-point iteration, against the same iteration run section by section, with the fatigue safety
+factor of the resulting diameters (which must equal the design factor).
+
+Run from the root of the repository with: python -m Benchmarks.shaft_design [--sections N] [--seed N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics.ShaftDesign import CRITERIA, ShaftDesign
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.shaft_design")
+    parser.add_argument("--sections", type=int, default=100000, help="Number of sections (and load cases).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random sections.")
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+    N = args.sections
+    Sut = rng.uniform(60, 150, N)
+    sections = dict(Sut=Sut, Sy=Sut*rng.uniform(0.6, 0.9, N), Ma=rng.uniform(0.1, 20, N), Mm=rng.uniform(0, 5, N),
+                    Ta=rng.uniform(0, 5, N), Tm=rng.uniform(0, 20, N), Kt=rng.uniform(1, 3, N),
+                    Kts=rng.uniform(1, 2.5, N), r_d=rng.uniform(0.02, 0.1, N))
+
+    shaft = ShaftDesign(**sections)
+    for criterion in CRITERIA:
+        start = timer()
+        result = shaft.solve(criterion)
+        vectorized = timer() - start
+        nf = shaft.check(result["d"], criterion)["nf"]
+        print("DE-{}: {} sections in {:.3f} s, {} iterations, max |nf - n| = {:.2e}".format(
+            criterion.capitalize(), N, vectorized, result["iterations"], np.max(np.abs(nf - 1.5))))
+
+    sample = range(0, N, max(1, N//200))
+    start = timer()
+    for i in sample:
+        ShaftDesign(**{name: value[i] for name, value in sections.items()}).solve(CRITERIA[0])
+    per_section = (timer() - start)/len(sample)
+    print("Section by section: {:.1f} us per section, i.e, about {:.2f} s for every section ({:.0f}x)".format(
+        1e6*per_section, per_section*N, per_section*N/vectorized))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Startup benchmark of the main menu and of every registered option.
+
+Run from the root of the repository with: python -m Benchmarks.startup_time
+
+The app is started in a fresh interpreter and driven through its standard input:
+    - Time to menu: the app is started and closed right away from the menu.
+    - Time to first result: the app is started, the option is picked and a sample session is typed
+      in, and the app is closed once the option finishes.
+Plots are rendered with the non-interactive Agg backend, so plt.show() does not block. The app runs
+inside a temporary directory, so plots and logs do not end up in the repository.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from timeit import default_timer as timer
+from typing import Tuple
+
+import numpy as np
+
+# Sample answers of every option, keyed by the name of its function. Options without a sample
+# session are skipped. {history} is replaced by the path of a sample load history.
+SAMPLE_SESSIONS = {
+    "find_determinant_matrix": "3\n1 2 3\n4 5 6\n7 8 10\n",
+    "find_root_equations": "N\nx**2 - 2\n1\n\n\n",
+    "FailureTheoriesPlotter": "MPa\n300\n\n\n1\n2\n100, 50\n-80, 120\n",
+    "BucklingCalculator": "1\n0.05\n2\nfixed\npinned\n207\n300\n",
+    "ShearAndMomentsPlotter": "N\nm\n2\n0, 100\n2, -100\n",
+    "InfluenceLines": "kN\nm\n20\n1000\n3\n0, 35\n4.3, 145\n8.6, 145\n",
+    "FatigueDesign": "kpsi\n1\n100\n80\n\n\n1\n\n\n\n30\n10\n",
+    "raizdea": "kpsi\nbending\n100\n\n0.1\n1.7\n",
+    "RainflowCounter": "{history}\n\nmpa\n10\ny\n520\n300\n\n\n",
+    "PriorityQueueInsertDeleteSequenceChecker": "max\nPRIO*R**I*T*Y***QUE***U*E\n",
+    "StepByStepSortingChecker": "heapsort\nint\n5 3 8 1 9 2\n",
+}
+
+
+def run_app(stdin: str, directory: str) -> Tuple[float, bool]:
+    """ Runs main.py in a fresh interpreter with the given standard input.
+
+    Args:
+        stdin (str): Everything the user types.
+        directory (str): Working directory of the app. It must contain options.json.
+
+    Returns:
+        Tuple[float, bool]: Wall time in seconds and True if the app exited normally.
+    """
+    env = dict(os.environ, MPLBACKEND="Agg", TERM=os.environ.get("TERM", "dumb"))
+    start = timer()
+    process = subprocess.run([sys.executable, os.path.abspath("main.py")], input=stdin, capture_output=True,
+                             text=True, env=env, cwd=directory)
+    return timer() - start, process.returncode == 0
+
+
+def main() -> None:
+    with open("options.json") as f:
+        options = json.load(f)["options"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copy("options.json", directory)
+        history = os.path.join(directory, "history.npy")
+        np.save(history, 100*np.sin(np.linspace(0, 200*np.pi, 100000)))
+
+        time_to_menu, ok = run_app("q\n", directory)
+        print("Time to menu: {:.3f} s{}\n".format(time_to_menu, "" if ok else " (failed)"))
+        print("{:<72} {:>12}  {:>12}".format("Option", "First result", "Option only"))
+
+        for cont, area in enumerate(options.keys(), 1):
+            for option in options[area]:
+                name = area + " -> " + option['name']
+                session = SAMPLE_SESSIONS.get(option['function'])
+                if session is None:
+                    print("{:<72} {:>12}".format(name, "skipped"))
+                    continue
+
+                stdin = str(cont + option['id']) + "\n" + session.format(history=history) + "\nq\n"
+                elapsed, ok = run_app(stdin, directory)
+                if ok:
+                    print("{:<72} {:>10.3f} s  {:>10.3f} s".format(name, elapsed, elapsed - time_to_menu))
+                else:
+                    print("{:<72} {:>12}".format(name, "failed"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark of the stress-concentration charts: Kt of random shoulder fillets found by the cached
+bivariate spline in a single call, against a lookup of the two nearest curves of the chart and
+linear interpolation between them, geometry by geometry.
+
+Run from the root of the repository with: python -m Benchmarks.stress_concentration [--geometries N]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+from timeit import default_timer as timer
+
+import numpy as np
+
+from Mechanics.StressConcentration import CHARTS, get_stress_concentration_factor
+
+
+def lookup(r_d: float, D_d: float, chart: dict) -> float:
+    """ Kt by linear interpolation between the two curves of a chart nearest to D/d.
+    """
+    ratios = sorted(chart.keys())
+    upper = min(max(np.searchsorted(ratios, D_d), 1), len(ratios) - 1)
+    D0, D1 = ratios[upper - 1], ratios[upper]
+    K0, K1 = (chart[D][0]*r_d**chart[D][1] for D in (D0, D1))
+    return K0 + (K1 - K0)*(D_d - D0)/(D1 - D0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m Benchmarks.stress_concentration")
+    parser.add_argument("--geometries", type=int, default=1000000, help="Number of geometries.")
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    r_d = rng.uniform(0.01, 0.3, args.geometries)
+    D_d = rng.uniform(1.01, 2, args.geometries)
+    chart = CHARTS["shoulder"]["bending"]
+
+    start = timer()
+    get_stress_concentration_factor("shoulder", "bending", r_d[:1], D_d[:1])
+    first = timer() - start
+    start = timer()
+    Kt = get_stress_concentration_factor("shoulder", "bending", r_d, D_d)
+    vectorized = timer() - start
+    print("Spline: {} geometries in {:.3f} s (first call, which imports scipy and fits the spline: {:.1f} ms)".format(
+        args.geometries, vectorized, 1e3*first))
+
+    sample = range(0, args.geometries, max(1, args.geometries//10000))
+    start = timer()
+    reference = np.array([lookup(r_d[i], D_d[i], chart) for i in sample])
+    per_geometry = (timer() - start)/len(sample)
+    print("Lookup: {:.2f} us per geometry, i.e, about {:.2f} s for every geometry ({:.0f}x), "
+          "max |Kt - Kt_lookup| = {:.3f}".format(1e6*per_geometry, per_geometry*args.geometries,
+                                                  per_geometry*args.geometries/vectorized,
+                                                  np.max(np.abs(Kt[list(sample)] - reference))))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """
-Finds the roots of a certain function with Newton's, bisection or secant method.
+Finds the roots of a certain function with Newton's, bisection or secant method. All the roots of
+polynomials are found at once as the eigenvalues of their companion matrices.
 
 Created on December 13, 2019.
 
@@ -10,6 +11,20 @@ from math import *
 
 from ExceptionHandling import exceptions
 from random import randint
+import ast
+import math
+import numpy as np
+
+# Largest imaginary part of a real root of a polynomial, relative to its modulus.
+REAL_TOLERANCE = 1e-8
+
+# Largest imaginary part, relative to its modulus, of a root which may be a multiple real root split
+# by rounding (by about eps^(1/k) for multiplicity k, so up to k = 3).
+MULTIPLE_ROOT_TOLERANCE = np.finfo(float).eps**0.25
+
+# Highest degree (and exponent) of a polynomial whose roots are found with its companion matrix.
+# Functions of higher degree are solved with Newton's method.
+MAX_DEGREE = 100
 
 
 def find_root_newton(argument: str, start_point: float, tolerance: float, max_iterations: int) -> float:
@@ -52,6 +67,263 @@ def find_root_newton(argument: str, start_point: float, tolerance: float, max_it
     return x
 
 
+def find_roots_bracketed(function, a, b, args: tuple = (), tolerance: float = 1e-12,
+                         max_iterations: int = 100) -> np.ndarray:
+    """ Finds many roots at once with Chandrupatla's method, a bracketing method which mixes
+        bisection and inverse quadratic interpolation. Like bisection, it never leaves the bracket;
+        unlike it, it converges superlinearly on smooth functions. Each root keeps iterating only
+        until it converges, and the function is evaluated on all the unconverged roots in one call.
+
+        Parameters
+        ----------
+        function : Callable
+            Vectorized function, called as function(x, *args) with arrays.
+
+        a, b : float, np.ndarray
+            Ends of the brackets. function(a) and function(b) must have opposite signs.
+
+        args : tuple
+            Extra arguments of the function (floats or arrays broadcastable to the brackets).
+
+        tolerance : float
+            Absolute tolerance of the roots. Defaults to 1e-12.
+
+        max_iterations : int
+            Maximum number of iterations. Defaults to 100.
+
+        Returns
+        -------
+        x : np.ndarray
+            Roots, with the broadcast shape of a, b and args. NaN where the bracket does not
+            contain a sign change.
+    """
+    a, b, *args = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                      *[np.asarray(arg, dtype=float) for arg in args])
+    shape = a.shape
+    a, b = a.ravel().copy(), b.ravel().copy()
+    args = [arg.ravel() for arg in args]
+    fa, fb = function(a, *args), function(b, *args)
+    c, fc = a.copy(), fa.copy()
+    roots = np.full(a.shape, np.nan)
+
+    roots[fa == 0], roots[fb == 0] = a[fa == 0], b[fb == 0]
+    active = np.flatnonzero((np.sign(fa)*np.sign(fb) < 0))
+    t = np.full(a.shape, 0.5)
+    eps = np.finfo(float).eps
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        i = active
+        xt = a[i] + t[i]*(b[i] - a[i])
+        ft = function(xt, *[arg[i] for arg in args])
+
+        # The new point replaces the end of the bracket with the same sign; the old point is kept
+        # in c for the interpolation.
+        same = np.sign(ft) == np.sign(fa[i])
+        c[i] = np.where(same, a[i], b[i])
+        fc[i] = np.where(same, fa[i], fb[i])
+        b[i] = np.where(same, b[i], a[i])
+        fb[i] = np.where(same, fb[i], fa[i])
+        a[i], fa[i] = xt, ft
+
+        a_is_best = np.abs(fa[i]) < np.abs(fb[i])
+        xm = np.where(a_is_best, a[i], b[i])
+        fm = np.where(a_is_best, fa[i], fb[i])
+        tl = (2*eps*np.abs(xm) + tolerance/2)/np.abs(b[i] - c[i])
+        done = (tl > 0.5) | (fm == 0)
+        roots[i[done]] = xm[done]
+
+        # Inverse quadratic interpolation is used only where it is safe; bisection otherwise.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xi = (a[i] - b[i])/(c[i] - b[i])
+            phi = (fa[i] - fb[i])/(fc[i] - fb[i])
+            interpolated = fa[i]/(fb[i] - fa[i])*fc[i]/(fb[i] - fc[i]) + \
+                (c[i] - a[i])/(b[i] - a[i])*fa[i]/(fc[i] - fa[i])*fb[i]/(fc[i] - fb[i])
+        safe = (phi**2 < xi) & ((1 - phi)**2 < 1 - xi)
+        t[i] = np.clip(np.where(safe, interpolated, 0.5), tl, 1 - tl)
+        active = i[~done]
+
+    if active.size:
+        roots[active] = np.where(np.abs(fa[active]) < np.abs(fb[active]), a[active], b[active])
+    return roots.reshape(shape)
+
+
+def get_polynomial_coefficients(argument: str):
+    """ Detects whether an argument is a polynomial in x and extracts its coefficients. Sums,
+        differences, products, divisions by constants and constant non-negative integer powers of
+        polynomials are polynomials; subexpressions without x (e.g. sqrt(2)*pi) are constants.
+
+        Parameters
+        ----------
+        argument : str
+            Argument as a function of x.
+
+        Returns
+        -------
+        coefficients : np.ndarray or None
+            Coefficients from the highest degree down, without leading zeros. None if the argument
+            is not a polynomial in x, if its degree is higher than MAX_DEGREE, or if its coefficients
+            are not finite (e.g. x/0).
+    """
+    try:
+        tree = ast.parse(argument.strip(), mode='eval').body
+        coefficients = _get_polynomial(tree)
+    except (SyntaxError, ValueError, TypeError, ZeroDivisionError, NameError, OverflowError):
+        return None
+    if coefficients is None or not np.all(np.isfinite(coefficients)):
+        return None
+    coefficients = np.trim_zeros(coefficients[::-1], 'f')
+    return coefficients if coefficients.size else np.zeros(1)
+
+
+def _get_polynomial(node: ast.AST):
+    """ Coefficients of an expression tree, from the constant term up, or None if it is not a
+        polynomial in x or its degree is higher than MAX_DEGREE.
+    """
+    if not any(isinstance(child, ast.Name) and child.id == "x" for child in ast.walk(node)):
+        value = eval(compile(ast.Expression(node), "<polynomial>", "eval"), dict(vars(math)))
+        return np.array([float(value)])
+    if isinstance(node, ast.Name):
+        return np.array([0., 1.])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _get_polynomial(node.operand)
+        if operand is None:
+            return None
+        return -operand if isinstance(node.op, ast.USub) else operand
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    left = _get_polynomial(node.left)
+    if left is None:
+        return None
+    if isinstance(node.op, ast.Pow):
+        exponent = _get_polynomial(node.right)
+        if exponent is None or exponent.size > 1 or exponent[0] < 0 or exponent[0] != int(exponent[0]):
+            return None
+        if exponent[0] > MAX_DEGREE or (left.size - 1)*exponent[0] > MAX_DEGREE:
+            return None
+        return np.polynomial.polynomial.polypow(left, int(exponent[0]))
+
+    right = _get_polynomial(node.right)
+    if right is None:
+        return None
+    if isinstance(node.op, ast.Add):
+        return np.polynomial.polynomial.polyadd(left, right)
+    if isinstance(node.op, ast.Sub):
+        return np.polynomial.polynomial.polysub(left, right)
+    if isinstance(node.op, ast.Mult):
+        if left.size + right.size - 2 > MAX_DEGREE:
+            return None
+        return np.polynomial.polynomial.polymul(left, right)
+    if isinstance(node.op, ast.Div) and right.size == 1 and right[0] != 0:
+        return left/right[0]
+    return None
+
+
+def find_polynomial_roots(coefficients, polish_iterations: int = 3) -> np.ndarray:
+    """ Finds all the real and complex roots of one or many polynomials of the same degree as the
+        eigenvalues of their companion matrices, which are then polished with a few steps of
+        Newton's method. A step is only taken where it reduces |p(x)|.
+
+        Parameters
+        ----------
+        coefficients : np.ndarray
+            Coefficients from the highest degree down, with shape (n + 1,) for a single polynomial
+            or (m, n + 1) for m polynomials of degree n. Leading coefficients must not be zero.
+
+        polish_iterations : int
+            Number of Newton steps. Defaults to 3.
+
+        Returns
+        -------
+        roots : np.ndarray
+            Complex roots, with shape (n,) or (m, n).
+    """
+    coefficients = np.asarray(coefficients)
+    single = coefficients.ndim == 1
+    coefficients = np.atleast_2d(coefficients)
+    m, n = coefficients.shape[0], coefficients.shape[1] - 1
+    if n < 1:
+        return np.empty((0,) if single else (m, 0), dtype=complex)
+
+    # Companion matrix: ones on the subdiagonal and the normalized coefficients on the first row.
+    companion = np.zeros((m, n, n), dtype=coefficients.dtype)
+    companion[:, 1:, :-1] = np.eye(n - 1)
+    companion[:, 0, :] = -coefficients[:, 1:]/coefficients[:, :1]
+    roots = np.linalg.eigvals(companion).astype(complex)
+
+    for _ in range(polish_iterations):
+        p, dp = _evaluate_polynomials(coefficients, roots)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            polished = roots - p/dp
+        better = np.isfinite(polished) & (np.abs(_evaluate_polynomials(coefficients, polished)[0]) < np.abs(p))
+        roots = np.where(better, polished, roots)
+
+    return roots[0] if single else roots
+
+
+def _evaluate_polynomials(coefficients: np.ndarray, x: np.ndarray) -> tuple:
+    """ p(x) and p'(x) of m polynomials, each at its own n points, by Horner's rule.
+    """
+    p = np.broadcast_to(coefficients[:, :1], x.shape).astype(complex)
+    dp = np.zeros_like(p)
+    for c in coefficients[:, 1:].T:
+        dp = dp*x + p
+        p = p*x + c[:, None]
+    return p, dp
+
+
+def is_real_root(coefficients: np.ndarray, roots: np.ndarray, tolerance: float = REAL_TOLERANCE) -> np.ndarray:
+    """ Tells which roots of a polynomial are real. A root is real if its imaginary part is negligible,
+        or if it is small (below MULTIPLE_ROOT_TOLERANCE) and the polynomial vanishes at its real part
+        within rounding error; the latter catches multiple real roots, which the eigenvalues split into
+        complex pairs.
+
+        Parameters
+        ----------
+        coefficients : np.ndarray
+            Coefficients from the highest degree down.
+
+        roots : np.ndarray
+            Complex roots.
+
+        tolerance : float
+            Largest imaginary part of a real root, relative to its modulus. Defaults to REAL_TOLERANCE.
+
+        Returns
+        -------
+        real : np.ndarray
+            True where the root is real.
+    """
+    coefficients = np.atleast_2d(coefficients)
+    x = np.atleast_2d(roots.real)
+    p, _ = _evaluate_polynomials(coefficients, x)
+    bound, _ = _evaluate_polynomials(np.abs(coefficients), np.abs(x))
+    vanishes = (np.abs(p) <= 16*np.finfo(float).eps*bound.real).reshape(roots.shape)
+    scale = np.maximum(1, np.abs(roots))
+    return (np.abs(roots.imag) <= tolerance*scale) | (vanishes & (np.abs(roots.imag) <= MULTIPLE_ROOT_TOLERANCE*scale))
+
+
+def get_real_roots(coefficients: np.ndarray, roots: np.ndarray) -> np.ndarray:
+    """ Real roots of a polynomial, sorted.
+
+        Parameters
+        ----------
+        coefficients : np.ndarray
+            Coefficients from the highest degree down.
+
+        roots : np.ndarray
+            Complex roots.
+
+        Returns
+        -------
+        x : np.ndarray
+            Real roots.
+    """
+    return np.sort(roots[is_real_root(coefficients, roots)].real)
+
+
 def f(x: float, argument: str) -> float:
     """ Evaluates the function in x.
 
@@ -182,6 +454,43 @@ def obtain_max_iterations() -> int:
     return max_iterations
 
 
+def calculate(argument: str, start_point: float = 0.1, tolerance: float = 0.00001,
+              max_iterations: int = 100000) -> dict:
+    """ Non-interactive root finding with Newton's method.
+
+        Parameters
+        ----------
+        argument : str
+            Argument as a function of x.
+
+        start_point : float
+            Initial guess of the root. Defaults to 0.1.
+
+        tolerance : float
+            Indicates how accurate the root must be. Defaults to 0.00001.
+
+        max_iterations : int
+            Maximum number of iterations. Defaults to 100000.
+
+        Returns
+        -------
+        result : dict
+            {"root": root of the function, "f(root)": f evaluated at the root}. If the argument is a
+            polynomial, the root is the real root closest to the start point (None if there is no
+            real root), and all its roots are also returned as [real, imaginary] pairs.
+    """
+    coefficients = get_polynomial_coefficients(argument)
+    if coefficients is None or coefficients.size < 2:
+        root = find_root_newton(argument, start_point, tolerance, max_iterations)
+        return {"root": root, "f(root)": f(root, argument)}
+
+    roots = find_polynomial_roots(coefficients)
+    real_roots = get_real_roots(coefficients, roots)
+    root = float(real_roots[np.argmin(np.abs(real_roots - start_point))]) if real_roots.size else None
+    return {"root": root, "f(root)": f(root, argument) if root is not None else None,
+            "roots": [[float(z.real), float(z.imag)] for z in roots]}
+
+
 def main() -> None:
     """ Main method.
 
@@ -204,6 +513,16 @@ def main() -> None:
             break
 
     argument = obtain_argument()
+    coefficients = get_polynomial_coefficients(argument)
+    if coefficients is not None and coefficients.size > 1:
+        roots = find_polynomial_roots(coefficients)
+        print("\nf(x) is a polynomial of degree " + str(coefficients.size - 1) + ". Its roots are:\n")
+        for x in get_real_roots(coefficients, roots):
+            print("\tx = " + str(x))
+        for z in roots[~is_real_root(coefficients, roots)]:
+            print("\tx = " + str(z))
+        return
+
     start = obtain_start_point()
     error = obtain_tolerance()
     max_iterations = obtain_max_iterations()
@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+Solves systems of nonlinear equations, F(x) = 0, with Newton's, Broyden's or the Newton-Krylov
+method. Many independent systems of the same size are solved at once: every function evaluation,
+Jacobian and linear solve works on the whole batch, and each system stops iterating as soon as it
+converges.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from typing import Callable
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Methods of solution.
+METHODS = ["newton", "broyden", "newton-krylov"]
+
+# Sufficient decrease constant of the line search, and the smallest step it tries.
+ARMIJO = 1e-4
+MIN_STEP = 2**-20
+
+# Names which may be used in the equations.
+NAMESPACE = {name: getattr(np, name) for name in ["sin", "cos", "tan", "arcsin", "arccos", "arctan", "sinh",
+                                                  "cosh", "tanh", "exp", "log", "log10", "sqrt", "abs", "pi", "e"]}
+
+
+def make_system(equations: list) -> Callable:
+    """ Vectorized function of a system of equations written in terms of x1, x2, ..., xn.
+
+        Parameters
+        ----------
+        equations : list
+            Left-hand sides of the equations fi(x1, ..., xn) = 0, with numpy's functions (sin, exp, ...).
+
+        Returns
+        -------
+        F : Callable
+            F(x), which maps an array of shape (..., n) to an array of the same shape.
+    """
+    code = [compile(equation, "<equation>", "eval") for equation in equations]
+
+    def F(x: np.ndarray) -> np.ndarray:
+        variables = {"x" + str(i + 1): x[..., i] for i in range(x.shape[-1])}
+        return np.stack(np.broadcast_arrays(*[eval(c, NAMESPACE, variables) for c in code], x[..., 0])[:-1],
+                        axis=-1).astype(float)
+
+    return F
+
+
+def get_jacobian(F: Callable, x: np.ndarray, Fx: np.ndarray = None, args: tuple = ()) -> np.ndarray:
+    """ Jacobians of many systems by forward differences, with a single evaluation of F on every
+        perturbed point of every system.
+
+        Parameters
+        ----------
+        F : Callable
+            Vectorized function, called as F(x, *args), which maps an array of shape (m, n) to an
+            array of shape (m, n).
+
+        x : np.ndarray
+            Points, with shape (m, n).
+
+        Fx : np.ndarray
+            F(x), if it is already known.
+
+        args : tuple
+            Extra arguments of every system, with shape (m, ...).
+
+        Returns
+        -------
+        J : np.ndarray
+            Jacobians, with shape (m, n, n).
+    """
+    m, n = x.shape
+    Fx = F(x, *args) if Fx is None else Fx
+    h = np.sqrt(np.finfo(float).eps)*np.maximum(np.abs(x), 1)
+    h = (x + h) - x
+    perturbed = x[:, None, :] + h[:, None, :]*np.eye(n)
+    Fp = F(perturbed.reshape(m*n, n), *[np.repeat(arg, n, axis=0) for arg in args]).reshape(m, n, n)
+    return np.swapaxes((Fp - Fx[:, None, :])/h[:, :, None], 1, 2)
+
+
+def line_search(F: Callable, x: np.ndarray, p: np.ndarray, Fx: np.ndarray, args: tuple = ()) -> tuple:
+    """ Backtracking line search on the merit function ||F||^2/2. Steps are halved until the merit
+        decreases sufficiently or MIN_STEP is reached; all systems try their steps in one call.
+
+        Parameters
+        ----------
+        F : Callable
+            Vectorized function.
+
+        x, p, Fx : np.ndarray
+            Points, directions and F(x), with shape (m, n).
+
+        args : tuple
+            Extra arguments of every system, with shape (m, ...).
+
+        Returns
+        -------
+        result : tuple
+            New points, F at them, lengths of the steps relative to p (0 where the search failed) and
+            the number of calls to F.
+    """
+    merit = np.sum(Fx**2, axis=1)
+    alpha = np.ones(x.shape[0])
+    evaluations = 1
+    with np.errstate(over='ignore', invalid='ignore'):
+        x_new, F_new = x + p, F(x + p, *args)
+        pending = np.flatnonzero(~(np.sum(F_new**2, axis=1) <= (1 - 2*ARMIJO)*merit))
+        while pending.size and alpha[pending[0]] > MIN_STEP:
+            alpha[pending] /= 2
+            x_new[pending] = x[pending] + alpha[pending, None]*p[pending]
+            F_new[pending] = F(x_new[pending], *[arg[pending] for arg in args])
+            evaluations += 1
+            pending = pending[~(np.sum(F_new[pending]**2, axis=1) <= (1 - 2*ARMIJO*alpha[pending])*merit[pending])]
+
+    # Systems without a sufficient decrease stay where they were.
+    x_new[pending], F_new[pending] = x[pending], Fx[pending]
+    alpha[pending] = 0
+    return x_new, F_new, alpha, evaluations
+
+
+def solve_krylov(F: Callable, x: np.ndarray, Fx: np.ndarray, dimension: int, args: tuple = ()) -> np.ndarray:
+    """ Newton steps, J(x)p = -F(x), by GMRES without forming the Jacobians: every product J*v is a
+        directional finite difference of F. All systems run the Arnoldi process together.
+
+        Parameters
+        ----------
+        F : Callable
+            Vectorized function.
+
+        x, Fx : np.ndarray
+            Points and F(x), with shape (m, n).
+
+        dimension : int
+            Dimension of the Krylov subspace.
+
+        args : tuple
+            Extra arguments of every system, with shape (m, ...).
+
+        Returns
+        -------
+        p : np.ndarray
+            Newton steps, with shape (m, n).
+    """
+    m, n = x.shape
+    k = min(dimension, n)
+    beta = np.linalg.norm(Fx, axis=1)
+    V = np.zeros((m, k + 1, n))
+    H = np.zeros((m, k + 1, k))
+    V[:, 0] = -Fx/beta[:, None]
+    scale = np.sqrt(np.finfo(float).eps)*(1 + np.linalg.norm(x, axis=1))
+
+    for j in range(k):
+        w = (F(x + scale[:, None]*V[:, j], *args) - Fx)/scale[:, None]
+        for i in range(j + 1):
+            H[:, i, j] = np.sum(w*V[:, i], axis=1)
+            w = w - H[:, i, j, None]*V[:, i]
+        H[:, j + 1, j] = np.linalg.norm(w, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            V[:, j + 1] = np.where(H[:, j + 1, j, None] > 0, w/H[:, j + 1, j, None], 0)
+
+    rhs = np.zeros((m, k + 1))
+    rhs[:, 0] = beta
+    y = np.einsum('mij,mj->mi', np.linalg.pinv(H), rhs)
+    return np.einsum('mj,mjn->mn', y, V[:, :k])
+
+
+def solve_system(F: Callable, x0, method: str = "broyden", jacobian: Callable = None, args: tuple = (),
+                 tolerance: float = 1e-10, max_iterations: int = 100, krylov_dimension: int = 20) -> dict:
+    """ Solves one or many systems of nonlinear equations, F(x) = 0.
+
+        newton: The Jacobian (analytic, or by forward differences) is computed and solved at every
+            step.
+        broyden: The inverse of the Jacobian is computed once and then updated with Broyden's rank-one
+            formula (through Sherman-Morrison), so steps need neither Jacobians nor linear solves. It is
+            recomputed only when the line search fails.
+        newton-krylov: Newton steps by GMRES with directional differences of F, without forming the
+            Jacobian.
+
+        Every step is followed by a backtracking line search. A system stops iterating when it
+        converges, or when the line search fails (with a fresh Jacobian), i.e, at a local minimum of
+        ||F||.
+
+        Parameters
+        ----------
+        F : Callable
+            Vectorized function, called as F(x, *args), which maps an array of shape (m, n) to an
+            array of shape (m, n). It is only called on the systems which have not converged yet.
+
+        x0 : np.ndarray
+            Initial guess, with shape (n,) for a single system or (m, n) for m systems.
+
+        method : str
+            newton, broyden or newton-krylov. Defaults to broyden.
+
+        jacobian : Callable
+            Analytic Jacobian, called as jacobian(x, *args), which maps an array of shape (m, n) to an
+            array of shape (m, n, n). If None, Jacobians are found by forward differences.
+
+        args : tuple
+            Extra arguments of every system (e.g. its parameters), with shape (m, ...).
+
+        tolerance : float
+            Largest |Fi(x)| of a solution. Defaults to 1e-10.
+
+        max_iterations : int
+            Maximum number of iterations. Defaults to 100.
+
+        krylov_dimension : int
+            Dimension of the Krylov subspace of newton-krylov. Defaults to 20.
+
+        Returns
+        -------
+        result : dict
+            Solutions x, residuals max|Fi(x)|, whether every system converged, iterations taken by
+            each system and evaluations of F (counting a batched call once).
+    """
+    if method not in METHODS:
+        raise ValueError("Unknown method: " + method)
+    single = np.ndim(x0) == 1
+    x = np.atleast_2d(np.array(x0, dtype=float))
+    m, n = x.shape
+    args = tuple(np.broadcast_to(np.asarray(arg, dtype=float), (m,) + np.shape(arg)[1:]) if np.ndim(arg)
+                 else np.full(m, arg, dtype=float) for arg in args)
+    Fx = F(x, *args)
+    evaluations = 1
+    iterations = np.zeros(m, dtype=int)
+
+    def compute_jacobian(i: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        if jacobian is not None:
+            return jacobian(x[i], *[arg[i] for arg in args])
+        evaluations += 1
+        return get_jacobian(F, x[i], Fx[i], tuple(arg[i] for arg in args))
+
+    if method == "broyden":
+        # The inverse of a singular Jacobian is replaced by its pseudo-inverse.
+        H = np.linalg.pinv(compute_jacobian(np.arange(m)))
+        fresh = np.ones(m, dtype=bool)
+
+    active = np.flatnonzero(np.max(np.abs(Fx), axis=1) > tolerance)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        i = active
+        arguments = tuple(arg[i] for arg in args)
+        if method == "newton":
+            J = compute_jacobian(i)
+            try:
+                p = -np.linalg.solve(J, Fx[i][..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                p = -np.einsum('mij,mj->mi', np.linalg.pinv(J), Fx[i])
+        elif method == "broyden":
+            p = -np.einsum('mij,mj->mi', H[i], Fx[i])
+        else:
+            p = solve_krylov(F, x[i], Fx[i], krylov_dimension, arguments)
+            evaluations += min(krylov_dimension, n)
+
+        x_new, F_new, alpha, calls = line_search(F, x[i], p, Fx[i], arguments)
+        evaluations += calls
+
+        if method == "broyden":
+            s, y = x_new - x[i], F_new - Fx[i]
+            Hy = np.einsum('mij,mj->mi', H[i], y)
+            sH = np.einsum('mi,mij->mj', s, H[i])
+            denominator = np.sum(s*Hy, axis=1)
+            update = np.abs(denominator) > np.finfo(float).eps*np.linalg.norm(s, axis=1)*np.linalg.norm(Hy, axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                H_new = H[i] + (s - Hy)[:, :, None]*sH[:, None, :]/denominator[:, None, None]
+            H[i] = np.where(update[:, None, None], H_new, H[i])
+
+        x[i], Fx[i] = x_new, F_new
+        iterations[i] += 1
+
+        failed = alpha == 0
+        if method == "broyden":
+            # A failed line search means that the updated Jacobian is no longer a good model, unless
+            # it had just been computed.
+            reset = i[failed & ~fresh[i]]
+            failed &= fresh[i]
+            fresh[i] = False
+            if reset.size:
+                H[reset] = np.linalg.pinv(compute_jacobian(reset))
+                fresh[reset] = True
+
+        active = i[(np.max(np.abs(Fx[i]), axis=1) > tolerance) & ~failed]
+
+    residual = np.max(np.abs(Fx), axis=1)
+    result = {"x": x, "residual": residual, "converged": residual <= tolerance, "iterations": iterations,
+              "evaluations": evaluations}
+    if single:
+        result.update({"x": x[0], "residual": float(residual[0]), "converged": bool(residual[0] <= tolerance),
+                       "iterations": int(iterations[0])})
+    return result
+
+
+def calculate(equations: list, x0: list, method: str = "broyden", tolerance: float = 1e-10,
+              max_iterations: int = 100) -> dict:
+    """ Non-interactive solution of a system of nonlinear equations.
+
+        Parameters
+        ----------
+        equations : list
+            Left-hand sides of the equations fi(x1, ..., xn) = 0.
+
+        x0 : list
+            Initial guess.
+
+        method : str
+            newton, broyden or newton-krylov. Defaults to broyden.
+
+        tolerance : float
+            Largest |fi(x)| of the solution. Defaults to 1e-10.
+
+        max_iterations : int
+            Maximum number of iterations. Defaults to 100.
+
+        Returns
+        -------
+        result : dict
+            {"x": solution, "residual": max|fi(x)|, "converged": bool, "iterations": int}.
+    """
+    if len(equations) != len(x0):
+        raise ValueError("There must be as many equations as unknowns")
+    result = solve_system(make_system(equations), x0, method, tolerance=tolerance, max_iterations=max_iterations)
+    return {"x": result["x"].tolist(), "residual": result["residual"], "converged": result["converged"],
+            "iterations": result["iterations"]}
+
+
+def main() -> None:
+    """ Main method.
+
+        Solves a system of nonlinear equations, F(x) = 0.
+    """
+    print("* Please, input valid data at all times! *\n")
+    n = Entry_Manager.get_simple_numerical_entry("Number of equations (and unknowns: x1, x2, ...)", "int", '+')
+    print("\nEquations fi(x1, ..., x" + str(n) + ") = 0:\n")
+    equations = []
+    while len(equations) < n:
+        equation = input("\tf" + str(len(equations) + 1) + " = ").strip()
+        try:
+            make_system([equation])(np.ones((1, n)))
+            equations.append(equation)
+        except Exception:
+            print("Invalid entry: " + equation)
+
+    x0 = Entry_Manager.get_list("\nInitial guess (" + str(n) + " values)", "float")
+    while len(x0) != n:
+        x0 = Entry_Manager.get_list("Initial guess (" + str(n) + " values)", "float")
+    method = Entry_Manager.get_str_input("Method", METHODS, "broyden")
+
+    result = calculate(equations, x0, method)
+    print("\nResults:\n")
+    for i, value in enumerate(result["x"]):
+        print("\tx" + str(i + 1) + " = " + str(value))
+    print("\n\tmax|fi(x)| = {:.3e} after {} iterations".format(result["residual"], result["iterations"]))
+    if not result["converged"]:
+        print("\n--> The method did not converge. Try another initial guess or method.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,117 @@ Created on April 8, 2020.
 from typing import Union, List, Tuple
 from ExceptionHandling import exceptions
 from os.path import basename
+import InputSource
+import re
+
+# Separators between the values of a row: any mix of commas, semicolons, spaces and tabs.
+DELIMITERS = re.compile(r"[,;\s]+")
+
+# Translation table which turns commas and semicolons into spaces, so that numpy can split a block
+# of rows on whitespace.
+DELIMITERS_TO_SPACES = str.maketrans(",;", "  ")
+
+# Converters of the supported type values.
+CONVERTERS = {"float": float, "int": int, "str": str}
+
+
+def split_row(row: str) -> List[str]:
+    """ Splits a row into its values.
+
+    Args:
+        row (str): Values separated by commas, semicolons, spaces or tabs.
+
+    Returns:
+        List[str]: Values. Empty if the row is blank.
+    """
+    row = row.strip()
+    return DELIMITERS.split(row) if row else list()
+
+
+def parse_rows(rows: List[str], types: List[str]):
+    """ Parses many rows at once.
+
+        If every value is a float (or every value is an int), the whole block is parsed in a single
+        pass by numpy. Otherwise, or if that fails, each row is parsed on its own so that every
+        invalid row can be reported.
+
+    Args:
+        rows (List[str]): Rows, with their values separated by commas, semicolons, spaces or tabs.
+        types (List[str]): Type value of each element of a row (float, int or str).
+
+    Returns:
+        np.ndarray, List[tuple]: Array of shape (len(rows), len(types)) if all types are float or
+                                 int, or a list of tuples otherwise; and the invalid rows as a list
+                                 of (line number, row, reason), starting at 1.
+    """
+    import numpy as np
+    homogeneous = len(set(types)) == 1 and types[0] in ["float", "int"]
+    if homogeneous and rows:
+        from io import StringIO
+        text = "\n".join(rows).translate(DELIMITERS_TO_SPACES)
+        try:
+            values = np.loadtxt(StringIO(text), dtype=CONVERTERS[types[0]], ndmin=2, comments=None)
+            if values.shape == (len(rows), len(types)):
+                return values, list()
+        except ValueError:
+            pass
+
+    values, bad_rows = list(), list()
+    for number, row in enumerate(rows, 1):
+        raw_list = split_row(row)
+        if len(raw_list) != len(types):
+            bad_rows.append((number, row, "expected " + str(len(types)) + " values and got " + str(len(raw_list))))
+            continue
+        try:
+            values.append(tuple(CONVERTERS[t](value) for t, value in zip(types, raw_list)))
+        except ValueError:
+            position = next(i for i, (t, value) in enumerate(zip(types, raw_list)) if not is_valid(value, t))
+            bad_rows.append((number, row, "expected " + types[position] + " in position " + str(position + 1) +
+                             " and got '" + raw_list[position] + "'"))
+
+    if homogeneous and not bad_rows:
+        values = np.array(values, dtype=CONVERTERS[types[0]]).reshape(len(rows), len(types))
+    return values, bad_rows
+
+
+def is_valid(value: str, type_value: str) -> bool:
+    """
+    Args:
+        value (str): Value.
+        type_value (str): float, int or str.
+
+    Returns:
+        bool: True if value can be parsed to type_value.
+    """
+    try:
+        CONVERTERS[type_value](value)
+        return True
+    except ValueError:
+        return False
+
 
 class EntryManager:
     """ Powerful manager to get and parse entries made by the user. In case there is an exception,
         it is logged on with the help of ExceptionHandling.
+
+        Entries are read from the active input source (see InputSource), so sessions can be replayed
+        from a file or a list. Invalid entries are asked for again in a loop until a valid one is made
+        or the source runs out of answers (EOFError).
     """
     def __init__(self, filename: str = None) -> None:
         self.file__ = basename(filename) if filename is not None else basename(__file__)
 
+    def input(self, msg: str) -> str:
+        """ Reads one entry from the active input source.
+
+        Args:
+            msg (str): Message to be shown before the user inputs a value.
+
+        Returns:
+            str: Entry made by the user.
+        """
+        return InputSource.read(msg)
+
     def get_simple_numerical_entry(self, msg: str, type_value: str, sign: str = '+', default_value: Union[int, float] = None) -> float:
         """ Gets an entry from the user and parses it to int or float depending on type_value parameter.
         
@@ -27,38 +130,33 @@ class EntryManager:
         Returns:
             float, int: Entry made by the user.
         """
-        entry_str = ""
-        entry = None
-        try:
-            entry_str = input(msg + ' = ')
-            if entry_str.strip() == "" and default_value is not None:
-                entry = default_value
-            elif entry_str.strip() == "":
-                raise Exception("Empty string")
-            else:
-                if type_value == "float":
-                    entry = float(entry_str)  
-                elif type_value == "int":
+        while True: # Loops till entry receives a valid value.
+            entry_str = self.input(msg + ' = ')
+            try:
+                if entry_str.strip() == "" and default_value is not None:
+                    entry = default_value
+                elif entry_str.strip() == "":
+                    raise Exception("Empty string")
+                elif type_value == "float":
+                    entry = float(entry_str)
+                else:
                     entry = int(entry_str)
-            
-            if entry <= 0 and sign == '+':
-                raise Exception("Expected a positive non-zero value.")
-        except Exception as e:
-            if e.__cause__ is None:
-                ef = exceptions.InvalidEntryError("Invalid entry, could not perform parsing. Expected: " + type_value + \
-                    sign + " and got: " + entry_str, self.file__)
-            else:
-                ef = exceptions.InvalidEntryError("Invalid entry, could not perform parsing. Expected: " + type_value + \
-                    sign + ". Original message: " + e.__cause__, self.file__)
-            del ef
-            # Recursion till entry receives a valid value.
-            entry = self.get_simple_numerical_entry(msg, type_value, sign, default_value)
-        
-        return entry
+
+                if entry <= 0 and sign == '+':
+                    raise Exception("Expected a positive non-zero value.")
+                return entry
+            except Exception as e:
+                if e.__cause__ is None:
+                    ef = exceptions.InvalidEntryError("Invalid entry, could not perform parsing. Expected: " + type_value + \
+                        sign + " and got: " + entry_str, self.file__)
+                else:
+                    ef = exceptions.InvalidEntryError("Invalid entry, could not perform parsing. Expected: " + type_value + \
+                        sign + ". Original message: " + str(e.__cause__), self.file__)
+                del ef
 
     def get_menu_option(self, title: str, options: str, valid_options: List[int], show_title: bool = True, show_options: bool = True) -> int:
-        """ Gets a menu options and parses it to int. It continues to call itself recursively until the
-            user inputs a valid entry.
+        """ Gets a menu options and parses it to int. It continues to ask for it until the user inputs
+            a valid entry.
         
         Args:
             title (str): Title of the menu.
@@ -75,20 +173,20 @@ class EntryManager:
         if show_options:
             print(options + '\n')
 
-        option_str = input("Option: ")
-        option = None
-        if option_str.strip() not in [str(i) for i in valid_options]:
+        valid_strs = [str(i) for i in valid_options]
+        option_str = self.input("Option: ")
+        while option_str.strip() not in valid_strs:
             ef = exceptions.InvalidEntryError("Invalid entry. Expected any of: " + str(valid_options) \
                  + " and got: " + option_str, basename(__file__))
-            option = self.get_menu_option(title, options, valid_options, False, False)
             del ef
-        else:
-            option = int(option_str)
+            option_str = self.input("Option: ")
 
-        return option
+        return int(option_str)
 
     def get_list_of_tuples(self, input_name: str, n: int, type_value: str = "float", type_values: List[str] = None, unpack_n: int = 2) -> List[Tuple[Union[float, int]]]:
         """ Gets a list of tuples inputted by the user. Supported type values are: float, int and str.
+            Values may be separated by commas, semicolons, spaces or tabs. All rows are parsed at once
+            (see get_rows), so they can be pasted as a block, or read from a file with @<file>.
         
         Args:
             input_name (str): Name of the coordinate or message to be shown before the user inputs a value.
@@ -103,65 +201,103 @@ class EntryManager:
             unpack_n (int, optional): Number of elements to unpack. Defaults to 2.
         
         Returns:
-            List[Tuple[Union[float, int]]]: [description]
+            List[Tuple[Union[float, int]]]: One tuple per entry.
+        """
+        types = [type_value]*unpack_n if type_value is not None else list(type_values)
+        values = self.get_rows(input_name, n, types)
+        if isinstance(values, list):
+            return values
+        return [tuple(row) for row in values.tolist()]
+
+    def get_array(self, input_name: str, unpack_n: int = 2, type_value: str = "float", n: int = None):
+        """ Gets a block of rows in one go, i.e, pasted from a spreadsheet, and parses it into an array.
+            The block ends with an empty line (or after n rows). Instead of the rows, @<file> reads
+            every row of a text file.
+
+        Args:
+            input_name (str): Name of each row.
+            unpack_n (int, optional): Number of values per row. Defaults to 2.
+            type_value (str, optional): float or int. Defaults to "float".
+            n (int, optional): Number of expected rows. Defaults to None, i.e, any number of rows.
+
+        Returns:
+            np.ndarray: Array of shape (number of rows, unpack_n).
+        """
+        print("\t" + input_name + " (one per line, end with an empty line, or @<file> to read a file):")
+        return self.get_rows(input_name, n, [type_value]*unpack_n, prompt_each_row=False)
+
+    def get_rows(self, input_name: str, n: int, types: List[str], prompt_each_row: bool = True):
+        """ Reads rows till there are n rows (or an empty line if n is None) and parses all of them at
+            once. Every invalid row is reported with its line number, and only those rows are asked
+            for again. If the first answer is @<file>, the rows are read from the file.
+
+        Args:
+            input_name (str): Name of each row.
+            n (int): Number of expected rows. None if the rows end with an empty line.
+            types (List[str]): Type value of each element of a row.
+            prompt_each_row (bool, optional): True if every row is asked for with its own prompt.
+                                              Defaults to True.
+
+        Returns:
+            np.ndarray, List[tuple]: See parse_rows.
+        """
+        def prompt(number: int) -> str:
+            return "\t" + input_name + " " + str(number) + ": " if prompt_each_row else ""
+
+        rows = list()
+        while n is None or len(rows) < n:
+            row = self.input(prompt(len(rows) + 1))
+            if not rows and row.strip().startswith('@'):
+                rows = self.read_rows_file(row.strip()[1:].strip(), n)
+                if rows is not None:
+                    break
+                rows = list()
+            elif n is None and row.strip() == "":
+                break
+            else:
+                rows.append(row)
+
+        values, bad_rows = parse_rows(rows, types)
+        while bad_rows:
+            error_message = "Found " + str(len(bad_rows)) + " invalid rows"
+            print("\t" + error_message + ":")
+            for number, row, reason in bad_rows:
+                print("\t\tLine " + str(number) + ": '" + row + "' (" + reason + ")")
+            ef = exceptions.InvalidEntryError(error_message + ". First one: line " + str(bad_rows[0][0]) + ", " +
+                                              bad_rows[0][2], self.file__)
+            del ef
+            print("\tPlease, input those rows again:")
+            for number, _, _ in bad_rows:
+                rows[number - 1] = self.input("\t" + input_name + " " + str(number) + ": ")
+            values, bad_rows = parse_rows(rows, types)
+
+        return values
+
+    def read_rows_file(self, filename: str, n: int = None) -> Union[List[str], None]:
+        """ Reads the rows of a text file. Blank lines and lines starting with # are skipped.
+
+        Args:
+            filename (str): Name of the file.
+            n (int, optional): Number of expected rows. Defaults to None, i.e, any number of rows.
+
+        Returns:
+            Union[List[str], None]: Rows of the file, or None if it could not be read or it does not
+                                    have n rows.
         """
-        l = list()
-        # Gets each x, y tuple and appends it to ss.
-        for i in range(n):
-            exception_occurred = True
-            while exception_occurred: # Continues looping as long as there is an invalid entry.
-                str_x_y = input('\t' + input_name + " " + str(i+1) + ": ")
-                try:
-                    raw_list = str_x_y.split(", ")
-                    if len(raw_list) != unpack_n: # The number of values to unpack must be unpack_n
-                        error_message = "\tThe number of values separated by a comma must be " + str(unpack_n)
-                        print(error_message + ".")
-                        e = exceptions.InvalidEntryError(error_message, self.file__)
-                        del e
-                    else:
-                        if type_value is not None:
-                            try: # x and y must be float or int.
-                                if type_value == "float":
-                                    t = tuple(float(x) for x in raw_list)
-                                elif type_value == "int":
-                                    t = tuple(int(x) for x in raw_list)
-                                else: # type_value is "str".
-                                    t = tuple(raw_list)
-                                l.append(tuple(t))
-                                exception_occurred = False
-                            except:
-                                error_message = "\tInvalid entry. Expected: " + type_value
-                                print(error_message + ".")
-                                e = exceptions.InvalidEntryError(error_message + " and got: " + raw_list, self.file__)
-                                exception_occurred = True
-                                del e
-                        else:
-                            t = list()
-                            for i in range(unpack_n):
-                                try:
-                                    if type_values[i] == "float":
-                                        current_value = float(raw_list[i])
-                                    elif type_value[i] == "int":
-                                        current_value = int(raw_list[i])
-                                    else: # type_value[i] is str.
-                                        current_value = raw_list[i]
-                                    t.append(current_value)
-                                    exception_occurred = False
-                                except:
-                                    error_message = "Invalid entry. Expected: " + type_value[i] + " and got " + raw_list[i] + \
-                                        " in position " + str(i) 
-                                    print(error_message + ".")
-                                    e = exceptions.InvalidEntryError(error_message, self.file__)
-                                    exception_occurred = True
-                                    del e
-                            l.append(tuple(t))
-                except Exception as e:
-                    if e.__cause__ is not None:
-                        ef = exceptions.Bug("An unexpected error ocurred. Original message: " + e.__cause__, self.file__)
-                    else:
-                        ef = exceptions.Bug("An unexpected error ocurred.", self.file__)
-                    del ef
-        return l
+        try:
+            with open(filename) as f:
+                rows = [row for row in f.read().splitlines() if row.strip() and not row.lstrip().startswith('#')]
+        except OSError as e:
+            error_message = "Could not read " + filename + ": " + str(e)
+        else:
+            if n is None or len(rows) == n:
+                return rows
+            error_message = filename + " has " + str(len(rows)) + " rows, but " + str(n) + " were expected"
+
+        print("\t" + error_message + ".")
+        ef = exceptions.InvalidEntryError(error_message, self.file__)
+        del ef
+        return None
 
     def get_str_input(self, msg: str, valid_inputs: list, default: str = None) -> str:
         complete_msg = msg + " (" + str(valid_inputs)[1:-1]
@@ -171,38 +307,35 @@ class EntryManager:
         
         complete_msg += "): "
 
-        raw_str = input(complete_msg)
+        raw_str = self.input(complete_msg)
+        while raw_str.strip().lower() not in valid_inputs:
+            if raw_str.strip() == "" and default is not None:
+                return default
 
-        if raw_str.strip() == "" and default is not None:
-            return default
-
-        if raw_str.strip().lower() not in valid_inputs:
             error_message = "Invalid entry. Expected any of: " + str(valid_inputs) + " and got: " + raw_str
             ef = exceptions.InvalidEntryError(error_message, basename(__file__))
             print(error_message + ".")
             del ef
-            raw_str = self.get_str_input(msg, valid_inputs)
+            raw_str = self.input(complete_msg)
 
         return raw_str.strip().lower()
 
     def get_list(self, msg: str, type_value: str = 'str') -> list:
-        raw_str = input(msg + ": ")
-        raw_list = raw_str.split(" ")
-        l = list()
+        while True:
+            raw_str = self.input(msg + ": ")
+            raw_list = raw_str.split() if type_value in ["str", "mixed"] else split_row(raw_str)
 
-        if type_value == "str" or type_value == "mixed":
-            l = raw_list
+            if type_value == "str" or type_value == "mixed":
+                return raw_list
 
-        try:
-            if type_value == "float":
-                l = [float(char) for char in raw_list]
-            elif type_value == "int":
-                l = [int(char) for char in raw_list]
-        except:
-            error_message = "\tInvalid entry. Expected: " + type_value
-            print(error_message + ".")
-            e = exceptions.InvalidEntryError(error_message + " and got: " + str(raw_list), self.file__)
-            l = self.get_list(msg, type_value)
-            del e
-
-        return l
\ No newline at end of file
+            try:
+                if type_value == "float":
+                    return [float(char) for char in raw_list]
+                elif type_value == "int":
+                    return [int(char) for char in raw_list]
+                return list()
+            except:
+                error_message = "\tInvalid entry. Expected: " + type_value
+                print(error_message + ".")
+                e = exceptions.InvalidEntryError(error_message + " and got: " + str(raw_list), self.file__)
+                del e
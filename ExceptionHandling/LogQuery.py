@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Queries and summarizes the error log.
+
+Usage (from the root of the repository):
+    python -m ExceptionHandling.LogQuery [--by code module] [--code 2] [--error InvalidEntryError]
+                                         [--module EntryManager.py] [--since 2026-10-01] [--legacy]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import gzip
+import json
+import re
+from collections import Counter
+from os.path import isfile
+from typing import Iterator, List
+
+from ExceptionHandling.Logger import BACKUP_COUNT, LOG_FILE
+
+# Legacy free-text log written before records were structured.
+LEGACY_LOG_FILE = "log.txt"
+
+# Entry of the legacy log file.
+LEGACY_ENTRY = re.compile(r"^\w+, (?P<date>.+?) GMT\+5 \(Error code: (?P<code>\d+)\): (?P<message>.*?)"
+                          r"(?:\. Error occurred in: (?P<module>.+))?$")
+
+# Fields by which records can be aggregated, and the key of each one inside a record.
+FIELDS = {"code": "error_code", "error": "error", "module": "module", "date": "timestamp"}
+
+
+def log_files(filename: str = LOG_FILE, backup_count: int = BACKUP_COUNT) -> List[str]:
+    """
+    Returns:
+        List[str]: Existing log files, from the oldest rotated one to the current one.
+    """
+    files = [filename + "." + str(i) + ".gz" for i in range(backup_count, 0, -1)] + [filename]
+    return [f for f in files if isfile(f)]
+
+
+def read_records(files: List[str]) -> Iterator[dict]:
+    """ Reads error records one line at a time, so logs are never loaded whole into memory.
+
+    Args:
+        files (List[str]): JSON-lines log files (gzip-compressed if they end in .gz) or legacy
+                           free-text log files.
+
+    Yields:
+        dict: Error records.
+    """
+    for filename in files:
+        opener = gzip.open if filename.endswith(".gz") else open
+        with opener(filename, "rt", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line.startswith("{"):
+                    # Truncated or corrupt lines (e.g. after a crash mid-write) are skipped.
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get("event") == "error":
+                        yield record
+                else:
+                    match = LEGACY_ENTRY.match(line.rstrip("\n"))
+                    if match is not None:
+                        yield {"timestamp": match.group("date"), "error_code": int(match.group("code")),
+                               "error": None, "module": match.group("module"), "message": match.group("message")}
+
+
+def summarize(records: Iterator[dict], by: List[str], code: int = None, error: str = None, module: str = None,
+              since: str = None) -> Counter:
+    """ Counts the records that pass the filters, grouped by the given fields.
+
+    Args:
+        records (Iterator[dict]): Error records.
+        by (List[str]): Fields to group by (keys of FIELDS). 'date' groups by day.
+        code (int, optional): Only records with this error code.
+        error (str, optional): Only records of this exception class.
+        module (str, optional): Only records that occurred in this file.
+        since (str, optional): Only records from this ISO date on (structured records only).
+
+    Returns:
+        Counter: Number of records of every group.
+    """
+    counter = Counter()
+    for record in records:
+        if code is not None and record["error_code"] != code:
+            continue
+        if error is not None and record["error"] != error:
+            continue
+        if module is not None and record["module"] != module:
+            continue
+        if since is not None and (record["error"] is None or record["timestamp"] < since):
+            continue
+        counter[tuple(str(record[FIELDS[field]])[:10] if field == "date" else record[FIELDS[field]]
+                      for field in by)] += 1
+    return counter
+
+
+def main(args: List[str] = None) -> None:
+    """ Prints the number of logged errors grouped by error code and file (or the requested fields).
+    """
+    parser = argparse.ArgumentParser(prog="python -m ExceptionHandling.LogQuery", description=__doc__.split("\n")[1])
+    parser.add_argument("--by", nargs="+", choices=list(FIELDS.keys()), default=["code", "module"])
+    parser.add_argument("--code", type=int)
+    parser.add_argument("--error")
+    parser.add_argument("--module")
+    parser.add_argument("--since", help="ISO date, i.e, 2026-10-01")
+    parser.add_argument("--file", default=LOG_FILE)
+    parser.add_argument("--legacy", action="store_true", help="Include the legacy " + LEGACY_LOG_FILE)
+    parser.add_argument("--top", type=int, default=20)
+    options = parser.parse_args(args)
+
+    files = log_files(options.file)
+    if options.legacy and isfile(LEGACY_LOG_FILE):
+        files.insert(0, LEGACY_LOG_FILE)
+
+    counter = summarize(read_records(files), options.by, options.code, options.error, options.module, options.since)
+
+    print("{:>8}  ".format("Count") + "  ".join("{:<24}".format(field) for field in options.by))
+    for group, count in counter.most_common(options.top):
+        print("{:>8}  ".format(count) + "  ".join("{:<24}".format(str(value)) for value in group))
+    print("\nTotal: " + str(sum(counter.values())) + " errors in " + str(len(files)) + " file(s).")
+
+
+if __name__ == "__main__":
+    main()
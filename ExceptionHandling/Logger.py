@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import List, Tuple
+
+# Name of the log file. Each line is a JSON record.
+LOG_FILE = "log.jsonl"
+
+# Size at which the log file is rotated, in bytes.
+MAX_BYTES = 5*1024*1024
+
+# Number of rotated (gzip-compressed) log files that are kept: log.jsonl.1.gz is the newest.
+BACKUP_COUNT = 5
+
+# Maximum number of records written at once by the background writer.
+BATCH_SIZE = 512
+
+# Seconds between checks that the writer thread is still alive while flushing.
+FLUSH_INTERVAL = 0.1
+
+
+class Logger:
+    """ Writes log records to the log file from a background thread.
+
+        Records are put in a queue, which is cheap for the caller, and the writer thread takes them
+        out in batches and writes them through a single handle that stays open for the whole
+        session. Timestamps are only formatted by the writer. Pending records are flushed when the
+        interpreter exits.
+
+        Every record is a JSON line with the keys: timestamp, event, error_code, error, module and
+        message. When the file would grow beyond max_bytes, it is compressed into filename.1.gz
+        (older backups are shifted up to backup_count) and a new file is started.
+    """
+
+    def __init__(self, filename: str = LOG_FILE, max_bytes: int = MAX_BYTES, backup_count: int = BACKUP_COUNT) -> None:
+        """
+        Args:
+            filename (str, optional): Log file. Defaults to LOG_FILE.
+            max_bytes (int, optional): Size at which the log file is rotated. Defaults to MAX_BYTES.
+            backup_count (int, optional): Number of rotated files kept. Defaults to BACKUP_COUNT.
+        """
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.lock = threading.Lock()
+        self.reset()
+        atexit.register(self.close)
+
+    def reset(self) -> None:
+        """ Forgets the queue, writer thread and handle, and starts a new session. Used on creation
+            and in forked children, which do not inherit the writer thread of their parent.
+        """
+        self.queue = queue.Queue()
+        self.thread = None
+        self.handle = None
+
+        # True if the session_start record has already been queued.
+        self.session_started = False
+
+    def log(self, error_code: int, error: str, message: str, filename: str = None) -> None:
+        """ Queues a log entry. The writer thread is started, and the session_start record written,
+            on the first one. If the writer thread has died, the entry is written right away.
+
+        Args:
+            error_code (int): Error code of the exception.
+            error (str): Name of the exception class.
+            message (str): Exception message.
+            filename (str, optional): File where the error occurred. Defaults to None.
+        """
+        start_session = False
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.write_records, name="Logger", daemon=True)
+                    self.thread.start()
+                    start_session = not self.session_started
+                    self.session_started = True
+
+        record = (time.time(), error_code, error, message, filename, start_session)
+        if self.thread.is_alive():
+            self.queue.put(record)
+        else:
+            # The writer thread died (e.g. the log file could not be opened), so nothing would take
+            # records out of the queue.
+            self.write_now(record)
+
+    def write_now(self, record: Tuple) -> None:
+        """ Writes a record from the calling thread, used if the writer thread is not running. The
+            record is dropped if the log file cannot be written either.
+
+        Args:
+            record (Tuple): Record as queued by log().
+        """
+        with self.lock:
+            try:
+                with open(self.filename, "a", encoding="utf-8") as f:
+                    f.write("".join(self.format_records([record])))
+            except OSError:
+                pass
+
+    def write_records(self) -> None:
+        """ Body of the writer thread. Waits for a record, takes every other pending record (up to
+            BATCH_SIZE) and writes them at once. A None record stops the thread.
+        """
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not None and len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            records = batch[:-1] if stop else batch
+            if records:
+                text = "".join(self.format_records(records))
+                if self.handle is None:
+                    self.handle = open(self.filename, "a", encoding="utf-8")
+                if self.handle.tell() > 0 and self.handle.tell() + len(text.encode("utf-8")) > self.max_bytes:
+                    self.rotate()
+                self.handle.write(text)
+                self.handle.flush()
+
+            for _ in batch:
+                self.queue.task_done()
+
+            if stop:
+                return
+
+    @staticmethod
+    def format_records(records: List[Tuple]) -> List[str]:
+        """ Formats queued records as JSON lines.
+
+        Args:
+            records (List[Tuple]): Records as queued by log().
+
+        Returns:
+            List[str]: Lines to write.
+        """
+        lines = list()
+        for timestamp, error_code, error, message, filename, start_session in records:
+            date = datetime.fromtimestamp(timestamp).astimezone().isoformat(timespec="milliseconds")
+            if start_session:
+                lines.append(json.dumps({"timestamp": date, "event": "session_start", "pid": os.getpid()}) + '\n')
+
+            lines.append(json.dumps({"timestamp": date, "event": "error", "error_code": error_code,
+                                     "error": error, "module": filename, "message": message}) + '\n')
+        return lines
+
+    def rotate(self) -> None:
+        """ Compresses the current log file into filename.1.gz, shifting older backups, and opens
+            a new, empty log file.
+        """
+        self.handle.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            if os.path.isfile(self.filename + "." + str(i) + ".gz"):
+                os.replace(self.filename + "." + str(i) + ".gz", self.filename + "." + str(i + 1) + ".gz")
+
+        if self.backup_count > 0:
+            with open(self.filename, "rb") as source, gzip.open(self.filename + ".1.gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+        self.handle = open(self.filename, "w", encoding="utf-8")
+
+    def flush(self) -> None:
+        """ Blocks until every queued record has been written, or until the writer thread dies (e.g.
+            if the log file could not be opened), so that it never blocks forever.
+        """
+        thread = self.thread
+        if thread is None:
+            return
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks and thread.is_alive():
+                self.queue.all_tasks_done.wait(FLUSH_INTERVAL)
+
+    def close(self) -> None:
+        """ Writes pending records, stops the writer thread and closes the log file.
+        """
+        with self.lock:
+            if self.thread is not None:
+                self.queue.put(None)
+                self.thread.join()
+                self.thread = None
+            if self.handle is not None:
+                self.handle.close()
+                self.handle = None
+
+
+# Logger shared by all exceptions.
+LOGGER = Logger()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=LOGGER.reset)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Sources of the answers typed by the user.
+
+Every entry of the app is read through the active input source, which is the terminal by default.
+A session can be recorded to a text file (one answer per line) and replayed later from that file or
+from an in-memory list, at full speed and without a terminal. While a session is replayed,
+builtins.input is also redirected, so the tools which call input() directly are replayed as well.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import builtins
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List
+
+
+class InputSource:
+    """ Terminal input. Base class of every input source.
+    """
+
+    def read(self, prompt: str = "") -> str:
+        """ Reads one answer.
+
+        Args:
+            prompt (str, optional): Message shown before the answer. Defaults to "".
+
+        Raises:
+            EOFError: If there are no answers left.
+
+        Returns:
+            str: Answer, without the trailing new line.
+        """
+        return TERMINAL_INPUT(prompt)
+
+
+class ListInput(InputSource):
+    """ Answers taken from an in-memory list, in order.
+    """
+
+    def __init__(self, answers: Iterable[str], echo: bool = False) -> None:
+        """
+        Args:
+            answers (Iterable[str]): Answers, in the order they are asked for.
+            echo (bool, optional): True if the prompt and the answer are printed, as if they were
+                                   typed. Defaults to False.
+        """
+        self.answers = list(answers)
+        self.position = 0
+        self.echo = echo
+
+    def read(self, prompt: str = "") -> str:
+        if self.position >= len(self.answers):
+            raise EOFError("No answers left after " + str(self.position) + " entries.")
+        answer = self.answers[self.position]
+        self.position += 1
+        if self.echo:
+            print(prompt + answer)
+        return answer
+
+    @property
+    def remaining(self) -> int:
+        """
+        Returns:
+            int: Number of answers which have not been read.
+        """
+        return len(self.answers) - self.position
+
+
+class FileInput(ListInput):
+    """ Answers taken from a session file, one answer per line.
+    """
+
+    def __init__(self, filename: str, echo: bool = False) -> None:
+        """
+        Args:
+            filename (str): Session file.
+            echo (bool, optional): True if the prompt and the answer are printed. Defaults to False.
+        """
+        with open(filename) as f:
+            super().__init__(f.read().splitlines(), echo)
+        self.filename = filename
+
+
+class RecordingInput(InputSource):
+    """ Reads from another source and appends every answer to a session file, which can be replayed
+        later with FileInput.
+    """
+
+    def __init__(self, filename: str, source: InputSource = None) -> None:
+        """
+        Args:
+            filename (str): Session file. It is overwritten.
+            source (InputSource, optional): Source of the answers. Defaults to the terminal.
+        """
+        self.source = source if source is not None else InputSource()
+        self.file = open(filename, "w")
+
+    def read(self, prompt: str = "") -> str:
+        answer = self.source.read(prompt)
+        self.file.write(answer + "\n")
+        self.file.flush()
+        return answer
+
+
+# input() as it was when the module was imported, so the terminal can still be read while
+# builtins.input is redirected.
+TERMINAL_INPUT = builtins.input
+
+# Input source every entry is read from.
+ACTIVE_SOURCE = InputSource()
+
+
+def read(prompt: str = "") -> str:
+    """ Reads one answer from the active input source.
+
+    Args:
+        prompt (str, optional): Message shown before the answer. Defaults to "".
+
+    Returns:
+        str: Answer.
+    """
+    return ACTIVE_SOURCE.read(prompt)
+
+
+def split_session(session: str) -> List[str]:
+    """ Splits the text of a session, as it would be typed, into answers.
+
+    Args:
+        session (str): Answers separated by new lines.
+
+    Returns:
+        List[str]: Answers.
+    """
+    return session.splitlines()
+
+
+@contextmanager
+def use_source(source: InputSource) -> Iterator[InputSource]:
+    """ Makes source the active input source, and redirects builtins.input to it, inside a with block.
+
+    Args:
+        source (InputSource): Input source.
+
+    Yields:
+        InputSource: The same source.
+    """
+    global ACTIVE_SOURCE
+    previous_source, previous_input = ACTIVE_SOURCE, builtins.input
+    ACTIVE_SOURCE = source
+    builtins.input = source.read
+    try:
+        yield source
+    finally:
+        ACTIVE_SOURCE = previous_source
+        builtins.input = previous_input
@@ -5,6 +5,7 @@ Created on December 14, 2019.
 @author: Camilo Martínez
 """
 from LinearAlgebra import obtain_square_matrix
+from Memoization import memoize
 
 
 def det(matrix: list, mul: float) -> float:
@@ -42,6 +43,23 @@ def det(matrix: list, mul: float) -> float:
         return total
 
 
+@memoize(disk=True)
+def calculate(matrix: list) -> dict:
+    """ Non-interactive calculation of the determinant.
+
+        Parameters
+        ----------
+        matrix : list
+            The matrix in the form of a list of lists.
+
+        Returns
+        -------
+            result : dict
+                {"determinant": determinant of matrix}.
+    """
+    return {"determinant": det(matrix, 1)}
+
+
 def main():
     """ Main method. """
     matrix = obtain_square_matrix.main()
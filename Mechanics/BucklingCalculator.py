@@ -7,6 +7,43 @@ Created on April 8, 2020.
 from typing import List
 import numpy as np
 import math
+from Memoization import memoize
+
+
+def get_euler_critical_stress(C, E, lk):
+    """ sigma_cr = C*pi^2*E/(l/k)^2 (Euler's Theory). Works on floats or numpy arrays.
+    """
+    return C*(np.pi**2)*E/(lk**2)
+
+
+def get_johnson_critical_stress(C, E, Sy, lk):
+    """ sigma_cr = Sy - 1/CE * (Sy*(l/k)/(2*pi))^2 (Johnson's Theory). Works on floats or numpy arrays.
+    """
+    return Sy - 1/(C*E)*(Sy*lk/(2*np.pi))**2
+
+
+def get_minimum_slenderness(C, E, Sy):
+    """ (l/k)_1 = (2*pi^2*CE/Sy)^(1/2). Works on floats or numpy arrays.
+    """
+    return np.sqrt(2*(np.pi**2)*C*E/Sy)
+
+
+def get_critical_stress(C, E, Sy, lk):
+    """ Critical stress by the recommended theory: Euler's if l/k > (l/k)_1, Johnson's otherwise.
+        Works on floats or numpy arrays, so many columns are evaluated at once.
+
+    Args:
+        C (float, np.ndarray): End-condition constant.
+        E (float, np.ndarray): Young's modulus of material.
+        Sy (float, np.ndarray): Yield strength of column material.
+        lk (float, np.ndarray): Slenderness of column, l/k.
+
+    Returns:
+        float, np.ndarray: Critical stress.
+    """
+    return np.where(lk > get_minimum_slenderness(C, E, Sy), get_euler_critical_stress(C, E, lk),
+                    get_johnson_critical_stress(C, E, Sy, lk))
+
 
 class BucklingCalculator:
     """ Calculates various buckling parameters and finally determines whether buckling
@@ -99,7 +136,7 @@ class BucklingCalculator:
         Returns:
             float: sigma_cr.
         """
-        return self.C*(np.pi**2)*self.E/(self.lk**2)
+        return get_euler_critical_stress(self.C, self.E, self.lk)
 
     def calculate_johnson_critical_stress(self) -> float:
         """ Calculates the critical stress for buckling according to Johnson's theory.
@@ -109,7 +146,7 @@ class BucklingCalculator:
         Returns:
             float: sigma_cr.
         """
-        return self.Sy - 1/(self.C*self.E)*(self.Sy*self.l/(2*np.pi*self.k))**2
+        return get_johnson_critical_stress(self.C, self.E, self.Sy, self.l/self.k)
 
     def euler_theory_is_valid(self) -> bool:
         """        
@@ -144,8 +181,7 @@ class BucklingCalculator:
         Returns:
             float: Minimum slenderness.
         """
-        lk1 = np.sqrt(2*(np.pi**2)*self.C*self.E/self.Sy)
-        return float(lk1)
+        return float(get_minimum_slenderness(self.C, self.E, self.Sy))
 
     def calculate_area(self) -> float:
         """ Calculates the cross-sectional area.
@@ -263,6 +299,39 @@ class BucklingCalculator:
         
         return s
 
+@memoize()
+def calculate(l: float, E: float, Sy: float, d: float = None, b: float = None, h: float = None,
+              inf_bdry_condition: str = "pinned", sup_bdry_condition: str = "pinned", req_conservativeness: int = 3,
+              axis: str = 'x') -> dict:
+    """ Non-interactive calculation of the buckling parameters of a column.
+
+    Args:
+        l (float): Length of column [m].
+        E (float): Young's modulus of material [GPa].
+        Sy (float): Yield strength of column material [MPa].
+        d (float, optional): Diameter of a circular cross-section [m].
+        b (float, optional): Width of a square cross-section [m]. Used if d is not given.
+        h (float, optional): Height of a square cross-section [m]. Used if d is not given.
+        inf_bdry_condition (str, optional): Fixed or Pinned. Defaults to "pinned".
+        sup_bdry_condition (str, optional): Fixed, Pinned or Free. Defaults to "pinned".
+        req_conservativeness (int, optional): 1 for theoretical-, 2 for conservative- and 3 for recommended value.
+                                              Defaults for 3.
+        axis (str, optional): 'x' for x axis, 'y' for y axis.
+
+    Returns:
+        dict: Geometrical properties [m], critical stresses [Pa] and loads [N] and the recommended theory.
+    """
+    cross_section = ['circular', [d]] if d is not None else ['square', [b, h]]
+    BC = BucklingCalculator(inf_bdry_condition, sup_bdry_condition, l, cross_section, E, Sy, req_conservativeness, axis)
+    critical_stress = BC.euler_critical_stress if BC.euler_theory_is_valid() else BC.johnson_critical_stress
+    return {"A": BC.A, "I": BC.I, "k": float(BC.k), "lk": BC.lk, "lk1": BC.lk1, "C": BC.C,
+            "euler_critical_stress": float(BC.euler_critical_stress),
+            "euler_critical_load": float(BC.euler_critical_stress*BC.A),
+            "johnson_critical_stress": float(BC.johnson_critical_stress),
+            "johnson_critical_load": float(BC.johnson_critical_stress*BC.A),
+            "recommended_theory": BC.get_recommended_theory(),
+            "critical_load": float(critical_stress*BC.A)}
+
 def main():
     cross_section_type = int(input("Type of cross-sectional area (circular: 1, square: 2, I-shaped: 3, T-shaped: 4): "))
     if cross_section_type == 1:
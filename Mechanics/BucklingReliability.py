@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from ExceptionHandling import exceptions
+from Mechanics.BucklingCalculator import get_critical_stress
+from timeit import default_timer as timer
+from typing import Dict, List, Tuple, Union
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Number of samples drawn and evaluated at once. Memory use is about 100 bytes per sample and variable.
+BLOCK_SIZE = 100000
+
+# Supported distributions of the random variables.
+DISTRIBUTIONS = ["normal", "lognormal", "uniform"]
+
+# Variables of the limit state, with their units.
+VARIABLES = {'P': 'kN', 'l': 'm', 'E': 'GPa', 'Sy': 'MPa', 'C': '', 'd': 'm', 'b': 'm', 'h': 'm'}
+
+
+class RandomVariable:
+    """ Random variable defined by its mean, coefficient of variation and distribution, mapped from a
+        standard normal variable u so that Monte Carlo, FORM and importance sampling share the same
+        model.
+    """
+
+    def __init__(self, mean: float, cov: float = 0, distribution: str = "normal") -> None:
+        """
+        Args:
+            mean (float): Mean.
+            cov (float, optional): Coefficient of variation (standard deviation/mean). Defaults to 0,
+                                   i.e, a deterministic value.
+            distribution (str, optional): normal, lognormal or uniform. Defaults to "normal".
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise exceptions.InvalidEntryError("Unknown distribution " + str(distribution) + ". Expected any of: " +
+                                               str(DISTRIBUTIONS))
+        self.mean = float(mean)
+        self.cov = float(cov)
+        self.distribution = distribution
+        self.std = abs(self.mean)*self.cov
+        if distribution == "lognormal":
+            self.zeta = np.sqrt(np.log(1 + self.cov**2))
+            self.lamda = np.log(self.mean) - self.zeta**2/2
+        elif distribution == "uniform":
+            # Same mean and standard deviation, so the half-width is sqrt(3) standard deviations.
+            self.half_width = np.sqrt(3)*self.std
+
+    @property
+    def is_random(self) -> bool:
+        return self.std > 0
+
+    def from_standard_normal(self, u: np.ndarray) -> np.ndarray:
+        """ Maps standard normal values to values of the variable, x = F^-1(Phi(u)).
+
+        Args:
+            u (np.ndarray): Standard normal values.
+
+        Returns:
+            np.ndarray: Values of the variable.
+        """
+        if self.distribution == "normal":
+            return self.mean + self.std*u
+        elif self.distribution == "lognormal":
+            return np.exp(self.lamda + self.zeta*u)
+        from scipy.special import ndtr
+        return self.mean + self.half_width*(2*ndtr(u) - 1)
+
+    def __repr__(self) -> str:
+        return "{}(mean={:.6g}, cov={:.3g})".format(self.distribution, self.mean, self.cov)
+
+
+def make_variable(value: Union[float, list, RandomVariable]) -> RandomVariable:
+    """
+    Args:
+        value (Union[float, list, RandomVariable]): A number (deterministic), [mean, cov] or
+                                                    [mean, cov, distribution].
+
+    Returns:
+        RandomVariable: Random variable.
+    """
+    if isinstance(value, RandomVariable):
+        return value
+    if isinstance(value, (list, tuple)):
+        return RandomVariable(*value)
+    return RandomVariable(value)
+
+
+def get_wilson_interval(failures: int, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """ Wilson score interval of a binomial proportion. Unlike the normal approximation, it stays
+        meaningful when few or no failures are observed.
+
+    Args:
+        failures (int): Number of failures.
+        n (int): Number of samples.
+        confidence (float, optional): Confidence level. Defaults to 0.95.
+
+    Returns:
+        Tuple[float, float]: Lower and upper bounds of the probability of failure.
+    """
+    from scipy.special import ndtri
+    z = ndtri((1 + confidence)/2)
+    p = failures/n
+    denominator = 1 + z**2/n
+    center = (p + z**2/(2*n))/denominator
+    half_width = z/denominator*np.sqrt(p*(1 - p)/n + z**2/(4*n**2))
+    return float(max(0.0, center - half_width)), float(min(1.0, center + half_width))
+
+
+class BucklingReliability:
+    """ Probability of buckling of a column given the scatter in load, length, end fixity, material
+        and dimensions. Failure happens when the load exceeds the critical load by the recommended
+        theory (Euler or Johnson), i.e, when g = P_cr - P <= 0.
+
+        Refer to Chapter 4-11 - 4-15 of Shigley's Mechanical Engineering Design (pags. 175-183).
+    """
+
+    def __init__(self, variables: Dict[str, Union[float, list, RandomVariable]]) -> None:
+        """
+        Args:
+            variables (Dict[str, Union[float, list, RandomVariable]]): Variables of the column (see
+                make_variable), by name: P [kN], l [m], E [GPa], Sy [MPa], C, and either d [m] for a
+                circular cross-section or b and h [m] for a rectangular one. The column buckles about
+                the weaker axis.
+        """
+        self.variables = {name: make_variable(value) for name, value in variables.items() if value is not None}
+        self.circular = 'd' in self.variables
+        required = ['P', 'l', 'E', 'Sy', 'C'] + (['d'] if self.circular else ['b', 'h'])
+        missing = [name for name in required if name not in self.variables]
+        if missing:
+            raise exceptions.InvalidEntryError("Missing variables: " + ", ".join(missing))
+        self.variables = {name: self.variables[name] for name in required}
+        self.random = [name for name, variable in self.variables.items() if variable.is_random]
+
+    def to_physical(self, u: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Args:
+            u (np.ndarray): Array of shape (n, number of random variables) in standard normal space.
+
+        Returns:
+            Dict[str, np.ndarray]: Values of every variable (arrays of length n, or floats if they are
+                                   deterministic).
+        """
+        values = {name: variable.mean for name, variable in self.variables.items()}
+        for i, name in enumerate(self.random):
+            values[name] = self.variables[name].from_standard_normal(u[:, i])
+        return values
+
+    def limit_state(self, u: np.ndarray) -> np.ndarray:
+        """ g = P_cr - P, for many samples at once.
+
+        Args:
+            u (np.ndarray): Array of shape (n, number of random variables) in standard normal space.
+
+        Returns:
+            np.ndarray: g [N] of every sample. Negative values are failures.
+        """
+        x = self.to_physical(u)
+        if self.circular:
+            A = np.pi/4*x['d']**2
+            k = x['d']/4
+        else:
+            A = x['b']*x['h']
+            k = np.minimum(x['b'], x['h'])/np.sqrt(12)
+        critical_stress = get_critical_stress(x['C'], x['E']*1e9, x['Sy']*1e6, x['l']/k)
+        return np.broadcast_to(critical_stress*A - x['P']*1e3, (len(u),))
+
+    def monte_carlo(self, samples: int = 1000000, seed: int = 0, confidence: float = 0.95,
+                    block_size: int = BLOCK_SIZE) -> dict:
+        """ Crude Monte Carlo. Samples are drawn and evaluated in blocks, so memory does not grow with
+            the number of samples, and the result only depends on the seed.
+
+        Args:
+            samples (int, optional): Number of samples. Defaults to 1000000.
+            seed (int, optional): Seed. Defaults to 0.
+            confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+            block_size (int, optional): Samples per block. Defaults to BLOCK_SIZE.
+
+        Returns:
+            dict: Probability of failure, its Wilson interval and coefficient of variation, number of
+                  samples and failures.
+        """
+        rng = np.random.default_rng(seed)
+        failures = 0
+        for start in range(0, samples, block_size):
+            n = min(block_size, samples - start)
+            failures += int(np.count_nonzero(self.limit_state(rng.standard_normal((n, len(self.random)))) <= 0))
+
+        pf = failures/samples
+        lower, upper = get_wilson_interval(failures, samples, confidence)
+        return {"method": "monte-carlo", "pf": pf, "pf_lower": lower, "pf_upper": upper,
+                "cov": float(np.sqrt((1 - pf)/(pf*samples))) if failures else float("inf"),
+                "samples": samples, "failures": failures}
+
+    def form(self, tolerance: float = 1e-6, max_iterations: int = 100) -> dict:
+        """ First-order reliability method, by the Hasofer-Lind-Rackwitz-Fiessler iteration. The
+            gradient of g is taken by finite differences, evaluating all the perturbed points in one
+            vectorized call.
+
+        Args:
+            tolerance (float, optional): Tolerance of the design point. Defaults to 1e-6.
+            max_iterations (int, optional): Maximum number of iterations. Defaults to 100.
+
+        Returns:
+            dict: Reliability index beta, probability of failure Phi(-beta), design point in standard
+                  normal and physical space, sensitivities alpha of every random variable, number
+                  of iterations and whether the iteration converged.
+        """
+        from scipy.special import ndtr
+        m = len(self.random)
+        if m == 0:
+            g = float(self.limit_state(np.zeros((1, 0)))[0])
+            return {"method": "form", "beta": float("inf") if g > 0 else -float("inf"), "pf": float(g <= 0),
+                    "design_point": {}, "alpha": {}, "iterations": 0, "converged": True}
+
+        u = np.zeros(m)
+        g0 = abs(float(self.limit_state(u[None])[0])) or 1.0
+        step = 1e-6
+        converged = False
+        for iteration in range(1, max_iterations + 1):
+            points = np.vstack([u, u + step*np.eye(m)])
+            g = self.limit_state(points)
+            gradient = (g[1:] - g[0])/step
+            norm = np.linalg.norm(gradient)
+            if norm == 0:
+                break
+            u_next = (gradient @ u - g[0])/norm**2*gradient
+            converged = np.linalg.norm(u_next - u) < tolerance*max(1.0, np.linalg.norm(u_next)) and \
+                abs(g[0]) < tolerance*g0
+            u = u_next
+            if converged:
+                break
+
+        g = float(self.limit_state(u[None])[0])
+        beta = float(np.linalg.norm(u))*(1 if self.limit_state(np.zeros((1, m)))[0] > 0 else -1)
+        alpha = -u/np.linalg.norm(u) if np.linalg.norm(u) > 0 else u
+        x = self.to_physical(u[None])
+        return {"method": "form", "beta": beta, "pf": float(ndtr(-beta)), "g_design_point": g,
+                "design_point": {name: float(np.ravel(x[name])[0]) for name in self.random},
+                "design_point_u": u.tolist(),
+                "alpha": {name: float(a) for name, a in zip(self.random, alpha)}, "iterations": iteration,
+                "converged": bool(converged)}
+
+    def importance_sampling(self, samples: int = 10000, seed: int = 0, confidence: float = 0.95,
+                            block_size: int = BLOCK_SIZE, design_point: List[float] = None) -> dict:
+        """ Importance sampling around the FORM design point: samples are drawn from a standard normal
+            centered at the design point u*, and weighted by phi(u)/phi(u - u*). Rare failures then
+            need orders of magnitude fewer samples than crude Monte Carlo.
+
+        Args:
+            samples (int, optional): Number of samples. Defaults to 10000.
+            seed (int, optional): Seed. Defaults to 0.
+            confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+            block_size (int, optional): Samples per block. Defaults to BLOCK_SIZE.
+            design_point (List[float], optional): Design point in standard normal space. Defaults to
+                                                  None, i.e, it is found by FORM.
+
+        Returns:
+            dict: Probability of failure, its (normal) confidence interval and coefficient of
+                  variation, number of samples and failures, and the FORM results used. If FORM did
+                  not converge, the estimate is still unbiased, but it may be much less precise, and
+                  a warning is added.
+        """
+        from scipy.special import ndtri
+        form = self.form() if design_point is None else None
+        center = np.asarray(form["design_point_u"] if design_point is None else design_point, dtype=float)
+        rng = np.random.default_rng(seed)
+        total, total_squares, failures = 0.0, 0.0, 0
+        for start in range(0, samples, block_size):
+            n = min(block_size, samples - start)
+            u = center + rng.standard_normal((n, len(self.random)))
+            failed = self.limit_state(u) <= 0
+            weights = np.exp(-u[failed] @ center + center @ center/2)
+            total += float(weights.sum())
+            total_squares += float((weights**2).sum())
+            failures += int(np.count_nonzero(failed))
+
+        pf = total/samples
+        std = np.sqrt(max(total_squares/samples - pf**2, 0)/samples)
+        z = float(ndtri((1 + confidence)/2))
+        output = {"method": "importance-sampling", "pf": pf, "pf_lower": float(max(0.0, pf - z*std)),
+                  "pf_upper": float(min(1.0, pf + z*std)), "cov": float(std/pf) if pf > 0 else float("inf"),
+                  "samples": samples, "failures": failures}
+        if form is not None:
+            output["form"] = form
+            if not form["converged"]:
+                output["warning"] = "FORM did not converge; samples are centered at its last iterate"
+        return output
+
+    def get_results(self, result: dict) -> str:
+        """
+        Args:
+            result (dict): Result of any of the methods.
+
+        Returns:
+            str: Report of the result.
+        """
+        s = "\nRandom variables:\n"
+        for name, variable in self.variables.items():
+            s += "\t" + name + (" [" + VARIABLES[name] + "]" if VARIABLES[name] else "") + ": " + \
+                (repr(variable) if variable.is_random else "{:.6g} (deterministic)".format(variable.mean)) + "\n"
+        s += "\nMethod: " + result["method"] + "\n"
+        s += "\tProbability of failure = {:.4e}\n".format(result["pf"])
+        if "pf_lower" in result:
+            s += "\tConfidence interval = [{:.4e}, {:.4e}]\n".format(result["pf_lower"], result["pf_upper"])
+            s += "\tCoefficient of variation of the estimate = {:.3g}\n".format(result["cov"])
+            s += "\tSamples = {}, failures = {}\n".format(result["samples"], result["failures"])
+        if "warning" in result:
+            s += "\tWarning: " + result["warning"] + "\n"
+        form = result if result["method"] == "form" else result.get("form")
+        if form is not None:
+            s += "\tReliability index, beta = {:.4f} ({} iterations{})\n".format(
+                form["beta"], form["iterations"], "" if form["converged"] else ", did not converge")
+            s += "\tDesign point: " + ", ".join("{} = {:.6g}".format(name, value)
+                                                for name, value in form["design_point"].items()) + "\n"
+            s += "\tSensitivities: " + ", ".join("alpha_{} = {:.3f}".format(name, value)
+                                                 for name, value in form["alpha"].items()) + "\n"
+        return s
+
+
+def calculate(P: list, l: list, E: list, Sy: list, d: list = None, b: list = None, h: list = None, C: list = None,
+              method: str = "monte-carlo", samples: int = 1000000, seed: int = 0, confidence: float = 0.95) -> dict:
+    """ Non-interactive calculation of the probability of buckling of a column. Every variable is a
+        number (deterministic), [mean, cov] (normal) or [mean, cov, distribution].
+
+    Args:
+        P (list): Axial load [kN].
+        l (list): Length of column [m].
+        E (list): Young's modulus of material [GPa].
+        Sy (list): Yield strength of column material [MPa].
+        d (list, optional): Diameter of a circular cross-section [m].
+        b (list, optional): Width of a rectangular cross-section [m]. Used if d is not given.
+        h (list, optional): Height of a rectangular cross-section [m]. Used if d is not given.
+        C (list, optional): End-condition constant. Defaults to 1 (pinned-pinned).
+        method (str, optional): monte-carlo, form or importance-sampling. Defaults to "monte-carlo".
+        samples (int, optional): Number of samples. Defaults to 1000000.
+        seed (int, optional): Seed. Defaults to 0.
+        confidence (float, optional): Confidence level of the interval. Defaults to 0.95.
+
+    Returns:
+        dict: Results of the method.
+    """
+    model = BucklingReliability({'P': P, 'l': l, 'E': E, 'Sy': Sy, 'C': 1 if C is None else C,
+                                 'd': d, 'b': b if d is None else None, 'h': h if d is None else None})
+    if method == "form":
+        return model.form()
+    elif method == "importance-sampling":
+        return model.importance_sampling(samples, seed, confidence)
+    return model.monte_carlo(samples, seed, confidence)
+
+
+def get_variable(name: str, units: str) -> RandomVariable:
+    """ Asks for the mean, coefficient of variation and distribution of a variable.
+    """
+    label = name + (" [" + units + "]" if units else "")
+    mean = Entry_Manager.get_simple_numerical_entry("Mean of " + label, "float")
+    cov = Entry_Manager.get_simple_numerical_entry("\tCoefficient of variation of " + name + " (DF = 0)", "float", '-', 0)
+    distribution = "normal"
+    if cov > 0:
+        distribution = Entry_Manager.get_str_input("\tDistribution of " + name, DISTRIBUTIONS, "normal")
+    return RandomVariable(mean, cov, distribution)
+
+
+def main():
+    """ Reliability mode of the buckling calculator: probability that a column buckles given the
+        scatter in its properties.
+    """
+    print("* Please, input valid data at all times! *\n")
+    variables = dict()
+    cross_section_type = Entry_Manager.get_menu_option("", "Type of cross-sectional area:\n1. Circular.\n2. Rectangular.",
+                                                       [1, 2], False)
+    for name in (['d'] if cross_section_type == 1 else ['b', 'h']) + ['l', 'E', 'Sy', 'P']:
+        variables[name] = get_variable(name, VARIABLES[name])
+    print("\nEnd-condition constant, C (pinned-pinned: 1, fixed-free: 1/4, fixed-pinned: 1 to 2, fixed-fixed: 1 to 4)."
+          " Uncertain fixity can be modelled as uniform.")
+    variables['C'] = get_variable('C', '')
+    model = BucklingReliability(variables)
+
+    method = Entry_Manager.get_menu_option("", "\nMethod:\n1. Monte Carlo.\n2. FORM.\n"
+                                               "3. Importance sampling around the FORM design point (rare failures).",
+                                           [1, 2, 3], False)
+    start = timer()
+    if method == 2:
+        result = model.form()
+    else:
+        samples = Entry_Manager.get_simple_numerical_entry("Number of samples (DF = " +
+                                                           ("1000000" if method == 1 else "10000") + ")", "int", '+',
+                                                           1000000 if method == 1 else 10000)
+        seed = Entry_Manager.get_simple_numerical_entry("Seed (DF = 0)", "int", '-', 0)
+        if method == 1:
+            result = model.monte_carlo(samples, seed)
+        else:
+            result = model.importance_sampling(samples, seed)
+    elapsed = timer() - start
+    print(model.get_results(result))
+    print("Time = {:.4} s".format(elapsed))
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from Calculus.find_root_equations import find_roots_bracketed
+from EntryManager import EntryManager
+from Mechanics.BucklingCalculator import get_euler_critical_stress
+from Mechanics.plotting import get_pyplot
+from typing import List
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Eccentricity ratios, ec/k^2, of the curves of the design chart (Figure 4-18 of Shigley's).
+CHART_ECCENTRICITY_RATIOS = [0.1, 0.3, 0.6, 1.0]
+
+# Number of slenderness ratios of each curve of the design chart.
+CHART_POINTS = 500
+
+
+def get_max_stress(unit_load, eccentricity_ratio, slenderness, E, C=1):
+    """ Maximum compressive stress of an eccentrically loaded column by the secant formula.
+
+        sigma_max = P/A*(1 + ec/k^2*sec(l/(2k)*(P/(CAE))^(1/2)))
+
+        Works on floats or numpy arrays. At or above the Euler load the stress is unbounded (inf).
+
+    Args:
+        unit_load (float, np.ndarray): P/A.
+        eccentricity_ratio (float, np.ndarray): ec/k^2.
+        slenderness (float, np.ndarray): l/k.
+        E (float, np.ndarray): Young's modulus of material.
+        C (float, np.ndarray, optional): End-condition constant. Defaults to 1.
+
+    Returns:
+        float, np.ndarray: sigma_max.
+    """
+    angle = slenderness/2*np.sqrt(unit_load/(C*E))
+    with np.errstate(divide='ignore'):
+        return np.where(angle < np.pi/2, unit_load*(1 + eccentricity_ratio/np.cos(angle)), np.inf)
+
+
+def secant_residual(unit_load, eccentricity_ratio, slenderness, E, Sy, C):
+    """ Secant formula with sigma_max = Sy, multiplied by the cosine so that it stays finite up to
+        the Euler load, where the secant goes to infinity. The cosine is positive below the Euler
+        load, so the root is the same.
+    """
+    cosine = np.cos(slenderness/2*np.sqrt(unit_load/(C*E)))
+    return unit_load*(cosine + eccentricity_ratio) - Sy*cosine
+
+
+def get_allowable_unit_load(eccentricity_ratio, slenderness, E, Sy, C=1, tolerance: float = 1e-10) -> np.ndarray:
+    """ Largest unit load, P/A, for which the secant formula gives sigma_max = Sy. The formula is
+        implicit in P/A, so it is solved with a bracketing root finder, for every combination of
+        eccentricity and slenderness at once: the arguments broadcast like numpy arrays, i.e,
+        eccentricity_ratio[:, None] and slenderness[None, :] give a whole chart in one call.
+
+        The root is always bracketed by 0 and min(Sy, Euler's critical stress).
+
+    Args:
+        eccentricity_ratio (float, np.ndarray): ec/k^2.
+        slenderness (float, np.ndarray): l/k.
+        E (float, np.ndarray): Young's modulus of material.
+        Sy (float, np.ndarray): Yield strength of column material.
+        C (float, np.ndarray, optional): End-condition constant. Defaults to 1.
+        tolerance (float, optional): Relative tolerance of P/A. Defaults to 1e-10.
+
+    Returns:
+        np.ndarray: Allowable P/A, with the broadcast shape of the arguments.
+    """
+    eccentricity_ratio, slenderness, E, Sy, C = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float) for value in (eccentricity_ratio, slenderness, E, Sy, C)])
+    with np.errstate(divide='ignore'):
+        euler = get_euler_critical_stress(C, E, slenderness)
+    upper = np.asarray(np.minimum(Sy, euler))
+
+    # Without eccentricity, the column takes the smallest of the yield and Euler stresses.
+    unit_load = upper.copy()
+    eccentric = np.asarray(eccentricity_ratio > 0)
+    unit_load[eccentric] = find_roots_bracketed(secant_residual, 0, upper[eccentric],
+                                                (eccentricity_ratio[eccentric], slenderness[eccentric],
+                                                 E[eccentric], Sy[eccentric], C[eccentric]),
+                                                tolerance*np.max(Sy, initial=1))
+    return unit_load
+
+
+class EccentricColumn:
+    """ Allowable load of an eccentrically loaded column by the secant formula.
+
+        Refer to Chapter 4-13 of Shigley's Mechanical Engineering Design (pags. 180-181).
+    """
+
+    def __init__(self, l: float, cross_section: List, E: float, Sy: float, e: float, C: float = 1) -> None:
+        """
+        Args:
+            l (float): Length of column [m].
+            cross_section (List[str, List[float]]): 'circular' and [d], or 'square' and [b, h] [m].
+                                                    The column bends about the weaker axis.
+            E (float): Young's modulus of material [GPa].
+            Sy (float): Yield strength of column material [MPa].
+            e (float): Eccentricity of the load [m]. Only its magnitude matters.
+            C (float, optional): End-condition constant. Defaults to 1.
+        """
+        self.l = l
+        self.E = E*1e9
+        self.Sy = Sy*1e6
+        self.e = e
+        self.C = C
+        if cross_section[0] == "circular":
+            d = cross_section[1][0]
+            self.A = np.pi/4*d**2
+            self.k = d/4
+            self.c = d/2
+        else:
+            b, h = cross_section[1]
+            self.A = b*h
+            self.k = min(b, h)/np.sqrt(12)
+            self.c = min(b, h)/2
+
+        self.lk = l/self.k
+        self.eccentricity_ratio = abs(e)*self.c/self.k**2
+        self.unit_load = float(get_allowable_unit_load(self.eccentricity_ratio, self.lk, self.E, self.Sy, C))
+        self.allowable_load = self.unit_load*self.A
+
+    def get_load_factor(self, P: float) -> float:
+        """
+        Args:
+            P (float): Applied load [N].
+
+        Returns:
+            float: Allowable load/P. The secant formula is not linear in P, so this is the safety
+                   factor on the load, not on the stress.
+        """
+        return self.allowable_load/P
+
+    def get_results(self, P: float = None) -> str:
+        """
+        Args:
+            P (float, optional): Applied load [N]. Defaults to None.
+
+        Returns:
+            str: String which contains a report with all the results.
+        """
+        s = "\nGeometrical properties:\n"
+        s += "\tA = " + str(self.A) + ' m^2\n'
+        s += "\tk = " + str(self.k) + ' m\n'
+        s += "\tc = " + str(self.c) + ' m\n'
+        s += "\tl/k = " + str(self.lk) + '\n'
+        s += "\tec/k^2 = " + str(self.eccentricity_ratio) + '\n'
+        s += "\nSecant formula:\n"
+        s += "\tAllowable unit load, P/A = " + str(self.unit_load/1e6) + ' MPa\n'
+        s += "\tAllowable load = " + str(self.allowable_load/1000) + ' kN\n'
+        s += "\tEuler's critical load = " + str(get_euler_critical_stress(self.C, self.E, self.lk)*self.A/1000) + ' kN\n'
+        if P is not None:
+            s += "\tMaximum stress under P = " + \
+                str(get_max_stress(P/self.A, self.eccentricity_ratio, self.lk, self.E, self.C)/1e6) + ' MPa\n'
+            s += "\tLoad factor = " + str(self.get_load_factor(P)) + '\n'
+        return s
+
+
+def get_design_chart(E: float, Sy: float, eccentricity_ratios: List[float] = None, max_slenderness: float = 250,
+                     C: float = 1, points: int = CHART_POINTS) -> dict:
+    """ Allowable unit load against slenderness for a family of eccentricity ratios, all solved in a
+        single vectorized call.
+
+    Args:
+        E (float): Young's modulus of material.
+        Sy (float): Yield strength of column material.
+        eccentricity_ratios (List[float], optional): ec/k^2 of each curve. Defaults to
+                                                     CHART_ECCENTRICITY_RATIOS.
+        max_slenderness (float, optional): Largest l/k. Defaults to 250.
+        C (float, optional): End-condition constant. Defaults to 1.
+        points (int, optional): Number of slenderness ratios. Defaults to CHART_POINTS.
+
+    Returns:
+        dict: slenderness (points), eccentricity_ratios, unit_load (eccentricity_ratios x points)
+              and the Euler curve.
+    """
+    ratios = np.asarray(eccentricity_ratios or CHART_ECCENTRICITY_RATIOS, dtype=float)
+    slenderness = np.linspace(max_slenderness/points, max_slenderness, points)
+    return {"slenderness": slenderness, "eccentricity_ratios": ratios,
+            "unit_load": get_allowable_unit_load(ratios[:, None], slenderness[None, :], E, Sy, C),
+            "euler": np.minimum(get_euler_critical_stress(C, E, slenderness), Sy)}
+
+
+def plot_design_chart(chart: dict, units: str) -> None:
+    """ Plots the design chart of the secant formula (see get_design_chart).
+
+    Args:
+        chart (dict): Design chart.
+        units (str): Units of stress.
+    """
+    plt = get_pyplot()
+    plt.figure(figsize=(8, 6), dpi=80)
+    plt.plot(chart["slenderness"], chart["euler"], 'k--', label="Euler (ec/k$^2$ = 0)")
+    for ratio, unit_load in zip(chart["eccentricity_ratios"], chart["unit_load"]):
+        plt.plot(chart["slenderness"], unit_load, label="ec/k$^2$ = {:g}".format(ratio))
+    plt.xlabel('l/k')
+    plt.ylabel('P/A [' + units + ']')
+    plt.xlim(0, chart["slenderness"][-1])
+    plt.ylim(0, None)
+    plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+    plt.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
+    plt.minorticks_on()
+    plt.legend(loc='upper right')
+    plt.savefig('Grafica.jpg', dpi=1200)
+    plt.show()
+
+
+def calculate(l: list, E: float, Sy: float, e: list, d: float = None, b: float = None, h: float = None,
+              C: float = 1, P: float = None) -> dict:
+    """ Non-interactive calculation of the allowable load of an eccentrically loaded column. Several
+        lengths and eccentricities can be given at once.
+
+    Args:
+        l (list): Length of column [m], or a list of lengths.
+        E (float): Young's modulus of material [GPa].
+        Sy (float): Yield strength of column material [MPa].
+        e (list): Eccentricity of the load [m], or a list of eccentricities. Only magnitudes matter.
+        d (float, optional): Diameter of a circular cross-section [m].
+        b (float, optional): Width of a square cross-section [m]. Used if d is not given.
+        h (float, optional): Height of a square cross-section [m]. Used if d is not given.
+        C (float, optional): End-condition constant. Defaults to 1.
+        P (float, optional): Applied load [kN]. Defaults to None.
+
+    Returns:
+        dict: Slenderness and eccentricity ratios, allowable unit load [Pa] and load [N] (arrays of
+              shape (lengths, eccentricities) if lists are given) and, if P is given, the maximum
+              stress [Pa] and load factor.
+    """
+    cross_section = ['circular', [d]] if d is not None else ['square', [b, h]]
+    column = EccentricColumn(1, cross_section, E, Sy, 0, C)
+    lk = np.asarray(l, dtype=float)/column.k
+    eccentricity_ratio = np.abs(np.asarray(e, dtype=float))*column.c/column.k**2
+    # Lengths along the first axes and eccentricities along the last ones.
+    lk_grid = lk.reshape(lk.shape + (1,)*eccentricity_ratio.ndim)
+    unit_load = get_allowable_unit_load(eccentricity_ratio, lk_grid, column.E, column.Sy, C)
+    result = {"A": column.A, "k": column.k, "c": column.c, "lk": lk, "eccentricity_ratio": eccentricity_ratio,
+              "allowable_unit_load": unit_load, "allowable_load": unit_load*column.A}
+    if P is not None:
+        result["max_stress"] = get_max_stress(P*1e3/column.A, eccentricity_ratio, lk_grid, column.E, C)
+        result["load_factor"] = unit_load*column.A/(P*1e3)
+    return {key: np.asarray(value).tolist() for key, value in result.items()}
+
+
+def main():
+    """ Allowable load of an eccentrically loaded column, or the design chart of the secant formula.
+    """
+    print("* Please, input valid data at all times! *\n")
+    option = Entry_Manager.get_menu_option("", "1. Allowable load of a column.\n2. Design chart of the secant formula.",
+                                           [1, 2], False)
+    E = Entry_Manager.get_simple_numerical_entry("Young's modulus, E [GPa]", "float")
+    Sy = Entry_Manager.get_simple_numerical_entry("Yield strength, Sy [MPa]", "float")
+    C = Entry_Manager.get_simple_numerical_entry("End-condition constant, C (DF = 1)", "float", '+', 1)
+
+    if option == 1:
+        cross_section_type = Entry_Manager.get_menu_option("", "Type of cross-sectional area:\n1. Circular.\n"
+                                                               "2. Rectangular.", [1, 2], False)
+        if cross_section_type == 1:
+            cross_section = ['circular', [Entry_Manager.get_simple_numerical_entry("Diameter [m]", "float")]]
+        else:
+            cross_section = ['square', [Entry_Manager.get_simple_numerical_entry("Width [m]", "float"),
+                                        Entry_Manager.get_simple_numerical_entry("Height [m]", "float")]]
+        l = Entry_Manager.get_simple_numerical_entry("Length of column [m]", "float")
+        e = Entry_Manager.get_simple_numerical_entry("Eccentricity of the load [m]", "float", '-')
+        P = Entry_Manager.get_simple_numerical_entry("Applied load [kN] (DF = none)", "float", '-', 0)
+        column = EccentricColumn(l, cross_section, E, Sy, e, C)
+        print(column.get_results(P*1e3 if P > 0 else None))
+    else:
+        ratios = Entry_Manager.get_list("Eccentricity ratios, ec/k^2 (DF = " +
+                                        " ".join(str(r) for r in CHART_ECCENTRICITY_RATIOS) + ")", "float")
+        max_slenderness = Entry_Manager.get_simple_numerical_entry("Largest l/k (DF = 250)", "float", '+', 250)
+        chart = get_design_chart(E*1e9, Sy*1e6, ratios or None, max_slenderness, C)
+        plot_design_chart({**chart, "unit_load": chart["unit_load"]/1e6, "euler": chart["euler"]/1e6}, "MPa")
+        print("\nYour plot was saved inside the current directory. Go check it out!")
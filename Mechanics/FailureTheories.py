@@ -4,10 +4,130 @@ Created on March 23, 2020.
 
 @author: Camilo Martínez
 """
+from abc import ABC, abstractmethod
 from typing import List, Any, Union
+from Memoization import memoize
 import numpy as np
 
-class FailureTheory:
+# Number of stress states processed at once by the point-in-envelope and distance queries.
+QUERY_BLOCK_SIZE = 8192
+
+# Largest distance between a curved envelope and the polygon which approximates it, as a fraction
+# of the yield strength. Linear envelopes are exact.
+ENVELOPE_TOLERANCE = 1e-3
+
+
+@memoize()
+def ellipse_envelope(Sy: float, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+    """ Polygon which approximates the distortion energy ellipse,
+        sigma_A^2 - sigma_A*sigma_B + sigma_B^2 = Sy^2, sampled where it curves the most.
+
+        The ellipse is x = a*cos(t), y = b*sin(t) rotated 45°, with a = sqrt(2)*Sy and
+        b = sqrt(2/3)*Sy. Starting from a coarse grid of t, every edge whose midpoint on the ellipse
+        is farther than tolerance*Sy from the edge is split in two, till none is.
+
+    Args:
+        Sy (float): Yield strength of material.
+        tolerance (float, optional): Largest distance between the ellipse and the polygon, as a
+                                     fraction of Sy. Defaults to ENVELOPE_TOLERANCE.
+
+    Returns:
+        np.ndarray: Vertices of the polygon, counterclockwise, of shape (n, 2). The first vertex is
+                    not repeated at the end.
+    """
+    a, b = np.sqrt(2)*Sy, np.sqrt(6)*Sy/3
+    c = np.cos(np.pi/4)
+
+    def point(t):
+        x, y = a*np.cos(t), b*np.sin(t)
+        return np.stack([c*(x - y), c*(x + y)], axis=-1)
+
+    t = np.linspace(0, 2*np.pi, 17)
+    while True:
+        P = point(t)
+        t_mid = (t[:-1] + t[1:])/2
+        chord = P[1:] - P[:-1]
+        offset = point(t_mid) - P[:-1]
+        deviation = np.abs(chord[:, 0]*offset[:, 1] - chord[:, 1]*offset[:, 0])/np.hypot(chord[:, 0], chord[:, 1])
+        split = deviation > tolerance*Sy
+        if not split.any():
+            return P[:-1]
+        t = np.insert(t, np.flatnonzero(split) + 1, t_mid[split])
+
+
+def polygon_contains(polygon: np.ndarray, sigma_1, sigma_2) -> np.ndarray:
+    """ Point-in-polygon test for a convex polygon.
+
+    Args:
+        polygon (np.ndarray): Vertices, counterclockwise, of shape (n, 2).
+        sigma_1 (float, np.ndarray): x coordinates of the points.
+        sigma_2 (float, np.ndarray): y coordinates of the points.
+
+    Returns:
+        np.ndarray: True for every point inside the polygon or on its boundary.
+    """
+    return line_distances(polygon, sigma_1, sigma_2)[0] <= 0
+
+
+def line_distances(polygon: np.ndarray, sigma_1, sigma_2):
+    """ Largest signed distance from every point to the lines which contain the edges of a convex
+        polygon (positive on the outer side of each edge), and the edge where it happens.
+
+    Args:
+        polygon (np.ndarray): Vertices, counterclockwise, of shape (n, 2).
+        sigma_1 (float, np.ndarray): x coordinates of the points.
+        sigma_2 (float, np.ndarray): y coordinates of the points.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Distances and edges, with the shape of sigma_1 and sigma_2.
+    """
+    sigma_1, sigma_2 = np.broadcast_arrays(np.asarray(sigma_1, dtype=float), np.asarray(sigma_2, dtype=float))
+    x, y = sigma_1.ravel(), sigma_2.ravel()
+    edge = np.roll(polygon, -1, axis=0) - polygon
+    normal = np.stack([edge[:, 1], -edge[:, 0]], axis=1)/np.hypot(edge[:, 0], edge[:, 1])[:, np.newaxis]
+    offset = np.einsum('ij,ij->i', normal, polygon)
+
+    # Points are processed in blocks small enough for the (points, edges) products to stay in cache.
+    distance = np.empty(x.size)
+    closest_edge = np.empty(x.size, dtype=int)
+    for i in range(0, x.size, QUERY_BLOCK_SIZE):
+        d = np.stack([x[i:i + QUERY_BLOCK_SIZE], y[i:i + QUERY_BLOCK_SIZE]], axis=1) @ normal.T
+        d -= offset
+        edges = d.argmax(axis=1)
+        closest_edge[i:i + QUERY_BLOCK_SIZE] = edges
+        distance[i:i + QUERY_BLOCK_SIZE] = d[np.arange(len(edges)), edges]
+    return distance.reshape(sigma_1.shape), closest_edge.reshape(sigma_1.shape)
+
+
+def signed_distance(polygon: np.ndarray, sigma_1, sigma_2) -> np.ndarray:
+    """ Distance from every point to the boundary of a convex polygon, negative inside.
+
+        Inside, the distance to the boundary is the distance to the closest line which contains an
+        edge. Outside, the closest point of the boundary lies on the edge whose line is the farthest
+        (or on one of its ends), so only that edge is checked.
+
+    Args:
+        polygon (np.ndarray): Vertices, counterclockwise, of shape (n, 2).
+        sigma_1 (float, np.ndarray): x coordinates of the points.
+        sigma_2 (float, np.ndarray): y coordinates of the points.
+
+    Returns:
+        np.ndarray: Signed distance of every point, with the shape of sigma_1 and sigma_2.
+    """
+    distance, closest_edge = line_distances(polygon, sigma_1, sigma_2)
+    outside = distance > 0
+    if outside.any():
+        sigma_1, sigma_2 = np.broadcast_arrays(np.asarray(sigma_1, dtype=float), np.asarray(sigma_2, dtype=float))
+        start = polygon[closest_edge[outside]]
+        edge = np.roll(polygon, -1, axis=0)[closest_edge[outside]] - start
+        relative = np.stack([sigma_1[outside], sigma_2[outside]], axis=-1) - start
+        t = np.clip(np.einsum('ij,ij->i', relative, edge)/np.einsum('ij,ij->i', edge, edge), 0, 1)
+        closest = relative - t[:, np.newaxis]*edge
+        distance[outside] = np.hypot(closest[:, 0], closest[:, 1])
+    return distance
+
+
+class FailureTheory(ABC):
     """ Parent class for all failure theories. 
     """
     def __init__(self, Sy: float, St: float, Sc: float, label: str) -> None:
@@ -22,7 +142,58 @@ class FailureTheory:
         self.St = St
         self.Sc = Sc
         self.label = label
-        
+
+    @abstractmethod
+    def envelope(self, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """ Polygon which bounds the region where failure does not occur.
+
+        Args:
+            tolerance (float, optional): Largest distance between a curved envelope and the polygon,
+                                         as a fraction of Sy. Defaults to ENVELOPE_TOLERANCE.
+
+        Returns:
+            np.ndarray: Vertices of the polygon, counterclockwise, of shape (n, 2).
+        """
+
+    def contains(self, sigma_1, sigma_2, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+            tolerance (float, optional): See envelope. Defaults to ENVELOPE_TOLERANCE.
+
+        Returns:
+            np.ndarray: True for every stress state inside the envelope, i.e, where failure does
+                        not occur.
+        """
+        return polygon_contains(self.envelope(tolerance), sigma_1, sigma_2)
+
+    def distance_to_envelope(self, sigma_1, sigma_2, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+            tolerance (float, optional): See envelope. Defaults to ENVELOPE_TOLERANCE.
+
+        Returns:
+            np.ndarray: Distance from every stress state to the envelope, negative inside.
+        """
+        return signed_distance(self.envelope(tolerance), sigma_1, sigma_2)
+
+    @staticmethod
+    def sort_principal_stresses(sigma_1, sigma_2):
+        """ Sorts two principal stresses of a plane stress state, so that sigma_A >= sigma_B.
+
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: sigma_A and sigma_B.
+        """
+        sigma_1, sigma_2 = np.asarray(sigma_1, dtype=float), np.asarray(sigma_2, dtype=float)
+        return np.maximum(sigma_1, sigma_2), np.minimum(sigma_1, sigma_2)
+
 class MaximumShearStress(FailureTheory):
     """ Maximum Shear Stress Theory for ductile materials or MSST.
     """
@@ -41,6 +212,26 @@ class MaximumShearStress(FailureTheory):
         eqns.append(['Equation', [1, self.Sy], -self.Sy, 0])
         eqns.append(['Equation', [1, -self.Sy], 0, self.Sy])
         return eqns
+
+    def envelope(self, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """ Exact hexagon. tolerance is not used.
+        """
+        Sy = self.Sy
+        return np.array([[Sy, 0], [Sy, Sy], [0, Sy], [-Sy, 0], [-Sy, -Sy], [0, -Sy]], dtype=float)
+
+    def safety_factor(self, sigma_1, sigma_2) -> np.ndarray:
+        """ n = Sy/max(|sigma_A|, |sigma_B|, |sigma_A - sigma_B|)
+
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+
+        Returns:
+            np.ndarray: Safety factor of each stress state.
+        """
+        sigma_A, sigma_B = self.sort_principal_stresses(sigma_1, sigma_2)
+        with np.errstate(divide='ignore'):
+            return self.Sy/np.maximum(np.maximum(np.abs(sigma_A), np.abs(sigma_B)), sigma_A - sigma_B)
     
 class DistortionEnergy(FailureTheory):
     """ Distortion Energy Theory for ductile materials or DET.
@@ -63,6 +254,32 @@ class DistortionEnergy(FailureTheory):
         
         return [['Ellipse', ellipse]]
 
+    def envelope(self, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """ Polygon sampled where the ellipse curves the most (see ellipse_envelope). It is cached
+            per Sy and tolerance.
+        """
+        return ellipse_envelope(self.Sy, tolerance)
+
+    def contains(self, sigma_1, sigma_2, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """ Exact test with the von Mises stress, sigma' <= Sy. tolerance is not used.
+        """
+        return self.safety_factor(sigma_1, sigma_2) >= 1
+
+    def safety_factor(self, sigma_1, sigma_2) -> np.ndarray:
+        """ n = Sy/sigma', where sigma' = (sigma_A^2 - sigma_A*sigma_B + sigma_B^2)^(1/2) is the
+            von Mises stress.
+
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+
+        Returns:
+            np.ndarray: Safety factor of each stress state.
+        """
+        sigma_1, sigma_2 = np.asarray(sigma_1, dtype=float), np.asarray(sigma_2, dtype=float)
+        with np.errstate(divide='ignore'):
+            return self.Sy/np.sqrt(sigma_1**2 - sigma_1*sigma_2 + sigma_2**2)
+
 class CoulombMohr(FailureTheory):
     """ Coulomb-Mohr Theory for ductile materials or MCT.
     """
@@ -80,4 +297,49 @@ class CoulombMohr(FailureTheory):
         eqns.append(['VerticalLine', -self.Sc, 0, -self.Sc])
         eqns.append(['Equation', [self.St/self.Sc, self.St], -self.Sc, 0])
         eqns.append(['Equation', [self.Sc/self.St, -self.Sc], 0, self.St])
-        return eqns
\ No newline at end of file
+        return eqns
+
+    def envelope(self, tolerance: float = ENVELOPE_TOLERANCE) -> np.ndarray:
+        """ Exact hexagon. tolerance is not used.
+        """
+        St, Sc = self.St, self.Sc
+        return np.array([[St, 0], [St, St], [0, St], [-Sc, 0], [-Sc, -Sc], [0, -Sc]], dtype=float)
+
+    def safety_factor(self, sigma_1, sigma_2) -> np.ndarray:
+        """ Case 1, sigma_A >= sigma_B >= 0:  n = St/sigma_A
+            Case 2, sigma_A >= 0 >= sigma_B:  1/n = sigma_A/St - sigma_B/Sc
+            Case 3, 0 >= sigma_A >= sigma_B:  n = -Sc/sigma_B
+
+            Sc is the magnitude of the compressive strength.
+
+        Args:
+            sigma_1 (float, np.ndarray): First principal stress.
+            sigma_2 (float, np.ndarray): Second principal stress.
+
+        Returns:
+            np.ndarray: Safety factor of each stress state.
+        """
+        sigma_A, sigma_B = self.sort_principal_stresses(sigma_1, sigma_2)
+        with np.errstate(divide='ignore'):
+            return 1/(np.maximum(sigma_A, 0)/self.St - np.minimum(sigma_B, 0)/self.Sc)
+
+
+def calculate(Sy: float, sigmas: list, St: float = None, Sc: float = None) -> dict:
+    """ Non-interactive calculation of the safety factor of plane stress states by every failure theory.
+
+    Args:
+        Sy (float): Yield strength of material.
+        sigmas (list): List of [sigma_1, sigma_2] principal stresses of each stress state.
+        St (float, optional): Tensile yield strength of material. Defaults to Sy.
+        Sc (float, optional): Compressive yield strength of material. Defaults to Sy.
+
+    Returns:
+        dict: Safety factor of each stress state by MSST, DET and MCT, and the minimum of the three.
+    """
+    St = Sy if St is None else St
+    Sc = Sy if Sc is None else Sc
+    sigma_1, sigma_2 = np.asarray(sigmas, dtype=float).reshape(-1, 2).T
+    results = {label: theory(Sy, St, Sc, label).safety_factor(sigma_1, sigma_2)
+               for label, theory in [('MSST', MaximumShearStress), ('DET', DistortionEnergy), ('MCT', CoulombMohr)]}
+    results['minimum'] = np.minimum.reduce(list(results.values()))
+    return results
@@ -9,17 +9,10 @@ from os.path import basename, isfile, splitext
 from os import getcwd, listdir
 from ExceptionHandling import exceptions
 from EntryManager import EntryManager
+from Mechanics.plotting import get_pyplot
 from typing import List, Tuple, Union
-from adjustText import adjust_text
-from matplotlib import rcParams
-import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 
-rcParams['font.family'] = "cmr10"
-rcParams['axes.unicode_minus'] = False
-rcParams.update({'font.size': 13})
-    
 # Entry manager. Required to handle user input.
 Entry_Manager = EntryManager(__file__)
 
@@ -45,52 +38,36 @@ class FailureTheoriesPlotter:
     def plot(self):
         """ Plots the diagram of failure theories.
         """
+        plt = get_pyplot()
         colors = ['r', 'b', 'k']
+        line_styles = {'MSST': '--', 'DET': '-', 'MCT': ':'}
         plt.figure(figsize=(8, 6), dpi=80)
-        added_label = False
         for i, failureTheory in enumerate([self.MSST, self.DET, self.CMT]):
-            for eqn in failureTheory.no_failure_region_equations():
-                if failureTheory.label == 'MSST':
-                    ls = '--'
-                elif failureTheory.label == 'MCT':
-                    ls = ':'
-                else:
-                    ls = '-'
-                    
-                if eqn[0] == 'HorizontalLine':
-                    if not added_label:
-                        plt.hlines(eqn[1], eqn[2], eqn[3], linestyle=ls, colors=colors[i], label=failureTheory.label)
-                        added_label = True
-                    else:
-                        plt.hlines(eqn[1], eqn[2], eqn[3], linestyle=ls, colors=colors[i])                        
-                elif eqn[0] == 'VerticalLine':
-                    plt.vlines(eqn[1], eqn[2], eqn[3], linestyle=ls, colors=colors[i])
-                elif eqn[0] == 'Equation':
-                    x = np.arange(eqn[2], eqn[3], 0.1)
-                    p = np.poly1d(eqn[1])
-                    y = p(x)
-                    plt.plot(x, y, color=colors[i], linestyle=ls)
-                elif eqn[0] == 'Ellipse':
-                    ellipse = eqn[1]
-                    plt.plot(ellipse[0,:], ellipse[1,:], label=failureTheory.label, linestyle=ls)
-                    
-            added_label = False
-        
+            # Closed polygon, with exact corners for the linear theories and adaptive sampling for
+            # the ellipse, so the number of points does not depend on the units.
+            envelope = failureTheory.envelope()
+            plt.plot(np.append(envelope[:, 0], envelope[0, 0]), np.append(envelope[:, 1], envelope[0, 1]),
+                     color=colors[i], linestyle=line_styles.get(failureTheory.label, '-'), label=failureTheory.label)
+
         if self.stress_conditions is not None:
-            x_sc, y_sc = tuple(zip(*self.stress_conditions))
-            plot_sc = []
-            
-            for i in range(len(x_sc)):
-                plot_sc.append(plt.scatter(x_sc[i], y_sc[i]))
-            
+            x_sc, y_sc = np.asarray(self.stress_conditions, dtype=float).reshape(-1, 2).T
+
             if self.names is not None:
+                plot_sc = []
+                for i in range(len(x_sc)):
+                    plot_sc.append(plt.scatter(x_sc[i], y_sc[i]))
                 legend1 = plt.legend(plot_sc, ['x = ' + str(self.names[i]) + ' m' for i in range(len(self.names))], loc='lower right')
                 plt.gca().add_artist(legend1)
+            else:
+                # A single call, so that large arrays of stress states are plotted at once. States
+                # outside any envelope are drawn in red.
+                safe = np.logical_and.reduce([theory.contains(x_sc, y_sc) for theory in [self.MSST, self.DET, self.CMT]])
+                plt.scatter(x_sc, y_sc, s=12 if len(x_sc) < 1000 else 2, c=np.where(safe, 'g', 'r'))
 
         plt.xlabel('$\sigma_1$ [' + self.units + ']')
         plt.ylabel('$\sigma_2$ [' + self.units + ']')
-        plt.grid(b=True, which='major', color='k', linestyle='-', alpha=0.2)
-        plt.grid(b=True, which='minor', color='k', linestyle='--', alpha=0.1)
+        plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+        plt.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
         plt.minorticks_on()
         plt.legend(loc='upper left')
         plt.savefig('Grafica.jpg', dpi=1200)
@@ -138,7 +115,7 @@ def get_stress_states_and_names() -> Union[Tuple[List[Tuple[float, float]], List
         print("")
         n = Entry_Manager.get_simple_numerical_entry("Number of stress states", "int", '+', __file__)
         print("")
-        print("Separate each value by a comma (,) and a space, i.e, 24.52, 3.4: ")
+        print("Separate each value by a comma, semicolon or space, i.e, 24.52, 3.4 (or type @<file> to read every row from a file): ")
         ss = Entry_Manager.get_list_of_tuples("Stress state", n, "float")
     elif option == 2:
         print("\nPlease copy and paste your data file inside the current directory, which is: ")
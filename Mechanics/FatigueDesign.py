@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from Mechanics.MaterialDefiner import Material
+from EntryManager import EntryManager
+from os.path import splitext
+from typing import Union
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Array-like of floats (or a single float).
+ArrayLike = Union[float, np.ndarray]
+
+# Surface factor parameters, ka = a*Sut^b (Table 6-2 of Shigley's Mechanical Engineering Design).
+# {finish: (a [kpsi], a [MPa], b)}
+SURFACE_FINISH = {"ground": (1.34, 1.58, -0.085),
+                  "machined": (2.70, 4.51, -0.265),
+                  "cold-drawn": (2.70, 4.51, -0.265),
+                  "hot-rolled": (14.4, 57.7, -0.718),
+                  "as-forged": (39.9, 272, -0.995)}
+
+# Load factor, kc (Eq. 6-26).
+LOADING = {"bending": 1, "axial": 0.85, "torsion": 0.59}
+
+# Columns of a load cases spreadsheet. Optional columns take the default value if missing.
+LOAD_CASE_COLUMNS = {"Sy": None, "Sut": None, "sigma_a": None, "sigma_m": 0,
+                     "surface": "machined", "d": None, "loading": "bending", "T": None,
+                     "reliability": 0.5, "kf": 1}
+
+
+def lookup(values: Union[str, np.ndarray], table: dict, column: int = None) -> np.ndarray:
+    """ Looks up a str, or each str of an array, inside a table. Every distinct value is only looked
+        up once.
+
+    Args:
+        values (Union[str, np.ndarray]): Key(s) of the table.
+        table (dict): Table to look up.
+        column (int, optional): Position inside each entry of the table, if entries are tuples.
+
+    Returns:
+        np.ndarray: Values of the table with the same shape as values.
+    """
+    keys, inverse = np.unique(np.char.lower(np.char.strip(np.asarray(values, dtype=str))), return_inverse=True)
+    entries = [table[key] if column is None else table[key][column] for key in keys]
+    return np.asarray(entries, dtype=float)[inverse].reshape(np.shape(values))
+
+
+def surface_factor(Sut: ArrayLike, surface: Union[str, np.ndarray], units: str) -> ArrayLike:
+    """ Surface factor, ka = a*Sut^b.
+
+    Args:
+        Sut (ArrayLike): Ultimate tensile strength.
+        surface (Union[str, np.ndarray]): ground, machined, cold-drawn, hot-rolled or as-forged.
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        ArrayLike: ka.
+    """
+    a = lookup(surface, SURFACE_FINISH, 0 if units == 'kpsi' else 1)
+    b = lookup(surface, SURFACE_FINISH, 2)
+    return a*np.power(Sut, b)
+
+
+def size_factor(d: ArrayLike, loading: Union[str, np.ndarray], units: str) -> ArrayLike:
+    """ Size factor, kb, of a rotating round section (Eq. 6-20). It is 1 for axial loading and when the
+        diameter is not given (NaN).
+
+        kb = 0.879*d^-0.107 (0.11 <= d <= 2 in) or 0.91*d^-0.157 (2 < d <= 10 in)
+        kb = 1.24*d^-0.107 (2.79 <= d <= 51 mm) or 1.51*d^-0.157 (51 < d <= 254 mm)
+
+    Args:
+        d (ArrayLike): Diameter [in if units is 'kpsi', mm otherwise]. For non-rotating sections use
+                       the equivalent diameter (Eq. 6-23).
+        loading (Union[str, np.ndarray]): bending, axial or torsion.
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        ArrayLike: kb.
+    """
+    d = np.asarray(d, dtype=float)
+    if units == 'kpsi':
+        lower, upper, small, large = 0.11, 2, 0.879*np.power(d, -0.107), 0.91*np.power(d, -0.157)
+    else:
+        lower, upper, small, large = 2.79, 51, 1.24*np.power(d, -0.107), 1.51*np.power(d, -0.157)
+
+    kb = np.where(d <= upper, small, large)
+    kb = np.where(np.isnan(d) | (d < lower), 1, kb)
+    return np.where(np.char.lower(np.asarray(loading, dtype=str)) == "axial", 1, kb)
+
+
+def load_factor(loading: Union[str, np.ndarray]) -> ArrayLike:
+    """ Load factor, kc. 1 for bending, 0.85 for axial and 0.59 for torsion.
+    """
+    return lookup(loading, LOADING)
+
+
+def temperature_factor(T: ArrayLike, units: str) -> ArrayLike:
+    """ Temperature factor, kd (Eq. 6-27). It is 1 when the temperature is not given (NaN).
+
+    kd = 0.975 + 0.432e-3 TF - 0.115e-5 TF^2 + 0.104e-8 TF^3 - 0.595e-12 TF^4, 70 <= TF <= 1000 °F
+
+    Args:
+        T (ArrayLike): Operating temperature [°F if units is 'kpsi', °C otherwise].
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        ArrayLike: kd.
+    """
+    TF = np.asarray(T, dtype=float)
+    if units != 'kpsi':
+        TF = 9/5*TF + 32
+
+    kd = 0.975 + TF*(0.432e-3 + TF*(-0.115e-5 + TF*(0.104e-8 + TF*(-0.595e-12))))
+    return np.where(np.isnan(TF), 1, kd)
+
+
+def reliability_factor(reliability: ArrayLike) -> ArrayLike:
+    """ Reliability factor, ke = 1 - 0.08*za (Eq. 6-28), where za is the transformation variate of the
+        standard normal distribution for the given reliability.
+
+    Args:
+        reliability (ArrayLike): Reliability, i.e, 0.99.
+
+    Returns:
+        ArrayLike: ke.
+    """
+    from scipy.special import ndtri
+    return 1 - 0.08*ndtri(reliability)
+
+
+class FatigueDesign:
+    """ Endurance limit with all the Marin factors, S-N curve and fatigue safety factors of a material.
+
+        Se = ka*kb*kc*kd*ke*kf*Se'
+
+        Every parameter may be an array, in which case each element is a different load case.
+        Refer to Chapter 6 of Shigley's Mechanical Engineering Design.
+    """
+
+    def __init__(self, material: Material, surface: Union[str, np.ndarray] = "machined", d: ArrayLike = np.nan,
+                 loading: Union[str, np.ndarray] = "bending", T: ArrayLike = np.nan,
+                 reliability: ArrayLike = 0.5, kf: ArrayLike = 1) -> None:
+        """
+        Args:
+            material (Material): Material. Its Sy and Sut may be arrays.
+            surface (Union[str, np.ndarray], optional): Surface finish. Defaults to "machined".
+            d (ArrayLike, optional): Diameter [in or mm]. Defaults to NaN, i.e, kb = 1.
+            loading (Union[str, np.ndarray], optional): bending, axial or torsion. Defaults to "bending".
+            T (ArrayLike, optional): Operating temperature [°F or °C]. Defaults to NaN, i.e, kd = 1.
+            reliability (ArrayLike, optional): Defaults to 0.5, i.e, ke = 1.
+            kf (ArrayLike, optional): Miscellaneous-effects factor. Defaults to 1.
+        """
+        self.material = material
+        self.units = material.units
+        self.ka = surface_factor(material.Sut, surface, self.units)
+        self.kb = size_factor(d, loading, self.units)
+        self.kc = load_factor(loading)
+        self.kd = temperature_factor(T, self.units)
+        self.ke = reliability_factor(reliability)
+        self.kf = np.asarray(kf, dtype=float)
+        self.Se = self.ka*self.kb*self.kc*self.kd*self.ke*self.kf*material.Se
+
+        # S-N curve, Sf = a*N^b (Eqs. 6-13 and 6-14).
+        fSut = material.f*np.asarray(material.Sut)
+        self.a = fSut**2/self.Se
+        self.b = -1/3*np.log10(fSut/self.Se)
+
+    def get_fatigue_strength(self, N: ArrayLike) -> ArrayLike:
+        """ Fatigue strength at N cycles, Sf = a*N^b. Valid for 10^3 <= N <= 10^6.
+        """
+        return self.a*np.power(N, self.b)
+
+    def get_life(self, sigma_a: ArrayLike) -> ArrayLike:
+        """ Number of cycles to failure for a completely reversed stress amplitude, N = (sigma_a/a)^(1/b).
+
+        Args:
+            sigma_a (ArrayLike): Completely reversed stress amplitude.
+
+        Returns:
+            ArrayLike: N. Infinite if sigma_a does not exceed the endurance limit.
+        """
+        sigma_a = np.asarray(sigma_a, dtype=float)
+        with np.errstate(divide='ignore'):
+            N = np.power(sigma_a/self.a, 1/self.b)
+        return np.where(sigma_a <= self.Se, np.inf, N)
+
+    def get_safety_factor(self, sigma_a: ArrayLike, sigma_m: ArrayLike = 0, criterion: str = "goodman") -> ArrayLike:
+        """ Fatigue safety factor against infinite life for fluctuating stresses. If the mean stress is
+            not positive, nf = Se/sigma_a.
+
+        Goodman:        1/nf = sigma_a/Se + sigma_m/Sut
+        Gerber:         nf = 1/2*(Sut/sigma_m)^2*sigma_a/Se*(-1 + sqrt(1 + (2*sigma_m*Se/(Sut*sigma_a))^2))
+        ASME-elliptic:  nf = (1/((sigma_a/Se)^2 + (sigma_m/Sy)^2))^(1/2)
+
+        Args:
+            sigma_a (ArrayLike): Alternating stress.
+            sigma_m (ArrayLike, optional): Mean stress. Defaults to 0.
+            criterion (str, optional): goodman, gerber or asme-elliptic. Defaults to "goodman".
+
+        Returns:
+            ArrayLike: nf.
+        """
+        sigma_a = np.asarray(sigma_a, dtype=float)
+        sigma_m = np.asarray(sigma_m, dtype=float)
+        Se, Sut, Sy = self.Se, np.asarray(self.material.Sut), np.asarray(self.material.Sy)
+        positive_mean = sigma_m > 0
+        sm = np.where(positive_mean, sigma_m, 1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if criterion == "goodman":
+                nf = 1/(sigma_a/Se + sm/Sut)
+            elif criterion == "gerber":
+                nf = 0.5*(Sut/sm)**2*sigma_a/Se*(-1 + np.sqrt(1 + (2*sm*Se/(Sut*sigma_a))**2))
+                nf = np.where(sigma_a == 0, Sut/sm, nf)
+            elif criterion == "asme-elliptic":
+                nf = np.sqrt(1/((sigma_a/Se)**2 + (sm/Sy)**2))
+            else:
+                raise ValueError("Unknown fatigue failure criterion: " + criterion)
+
+            return np.where(positive_mean, nf, Se/sigma_a)
+
+    def get_yield_safety_factor(self, sigma_a: ArrayLike, sigma_m: ArrayLike = 0) -> ArrayLike:
+        """ First-cycle yielding safety factor, ny = Sy/(sigma_a + |sigma_m|) (Langer line).
+        """
+        return np.asarray(self.material.Sy)/(np.asarray(sigma_a) + np.abs(sigma_m))
+
+    def get_results(self) -> str:
+        """
+        Returns:
+            str: String which contains a report with the Marin factors and the S-N curve. Only meant
+                 for scalar inputs.
+        """
+        s = "\nMarin factors:\n"
+        for name in ["ka", "kb", "kc", "kd", "ke", "kf"]:
+            s += "\t" + name + " = " + str(getattr(self, name)) + '\n'
+        s += "\nEndurance limit:\n"
+        s += "\tSe' = " + str(self.material.Se) + ' ' + self.units + '\n'
+        s += "\tSe = " + str(self.Se) + ' ' + self.units + '\n'
+        s += "\nS-N curve, Sf = a*N^b:\n"
+        s += "\tf = " + str(self.material.f) + '\n'
+        s += "\ta = " + str(self.a) + ' ' + self.units + '\n'
+        s += "\tb = " + str(self.b) + '\n'
+        return s
+
+
+def evaluate_load_cases(filename: str, units: str, output: str = None):
+    """ Evaluates every load case of a spreadsheet at once. Each row is a load case and the columns are
+        those of LOAD_CASE_COLUMNS (missing optional columns take their default values).
+
+    Args:
+        filename (str): xlsx, xls, csv or txt file.
+        units (str): 'kpsi' or 'MPa'.
+        output (str, optional): If given, results are written to this file (xlsx or csv).
+
+    Returns:
+        pandas.DataFrame: Load cases with the Marin factors, Se, a, b, N and the safety factors appended.
+    """
+    import pandas as pd
+    if splitext(filename)[1] in [".xlsx", ".xls"]:
+        df = pd.read_excel(filename)
+    else:
+        df = pd.read_csv(filename, sep=None, engine='python')
+
+    for column, default in LOAD_CASE_COLUMNS.items():
+        if column not in df.columns:
+            if default is None and column not in ["d", "T"]:
+                raise KeyError("Column " + column + " is missing in " + filename)
+            df[column] = np.nan if default is None else default
+
+    material = Material(df["Sy"].to_numpy(float), df["Sut"].to_numpy(float), np.nan, units)
+    design = FatigueDesign(material, df["surface"].to_numpy(str), df["d"].to_numpy(float),
+                           df["loading"].to_numpy(str), df["T"].to_numpy(float),
+                           df["reliability"].to_numpy(float), df["kf"].to_numpy(float))
+    sigma_a, sigma_m = df["sigma_a"].to_numpy(float), df["sigma_m"].to_numpy(float)
+
+    for name in ["ka", "kb", "kc", "kd", "ke"]:
+        df[name] = getattr(design, name)
+    df["Se"] = design.Se
+    df["a"] = design.a
+    df["b"] = design.b
+    df["N"] = design.get_life(sigma_a)
+    for criterion in ["goodman", "gerber", "asme-elliptic"]:
+        df["n_" + criterion] = design.get_safety_factor(sigma_a, sigma_m, criterion)
+    df["n_yield"] = design.get_yield_safety_factor(sigma_a, sigma_m)
+
+    if output is not None:
+        if splitext(output)[1] in [".xlsx", ".xls"]:
+            df.to_excel(output, index=False)
+        else:
+            df.to_csv(output, index=False)
+
+    return df
+
+
+def calculate(Sut: float, Sy: float, sigma_a: float, sigma_m: float = 0, units: str = 'kpsi',
+              surface: str = "machined", d: float = np.nan, loading: str = "bending", T: float = np.nan,
+              reliability: float = 0.5, kf: float = 1) -> dict:
+    """ Non-interactive fatigue analysis of a single load case.
+
+    Args:
+        Sut (float): Ultimate tensile strength.
+        Sy (float): Yield strength.
+        sigma_a (float): Alternating stress.
+        sigma_m (float, optional): Mean stress. Defaults to 0.
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+        surface, d, loading, T, reliability, kf: See FatigueDesign.
+
+    Returns:
+        dict: Marin factors, Se, S-N curve, life and safety factors.
+    """
+    design = FatigueDesign(Material(Sy, Sut, Sy, units), surface, d, loading, T, reliability, kf)
+    result = {name: float(getattr(design, name)) for name in ["ka", "kb", "kc", "kd", "ke", "kf", "Se", "a", "b"]}
+    result["N"] = float(design.get_life(sigma_a))
+    for criterion in ["goodman", "gerber", "asme-elliptic"]:
+        result["n_" + criterion] = float(design.get_safety_factor(sigma_a, sigma_m, criterion))
+    result["n_yield"] = float(design.get_yield_safety_factor(sigma_a, sigma_m))
+    return result
+
+
+def main():
+    """ Computes the endurance limit, S-N curve, life and fatigue safety factors of a single load case,
+        or of every load case of a spreadsheet.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units = Entry_Manager.get_str_input("Units", ["kpsi", "mpa"], "kpsi")
+    units = 'kpsi' if units == 'kpsi' else 'MPa'
+    title = "Please select one of the following options:"
+    options = "\t1. I want to input a single load case manually.\n\t2. I have a spreadsheet with load cases."
+    option = Entry_Manager.get_menu_option(title, options, [1, 2])
+
+    if option == 2:
+        print("\nColumns: " + ", ".join(LOAD_CASE_COLUMNS.keys()))
+        filename = input("Spreadsheet file: ").strip()
+        output = input("Output file (DF = fatigue_results.csv): ").strip() or "fatigue_results.csv"
+        df = evaluate_load_cases(filename, units, output)
+        print("\n" + str(len(df)) + " load cases evaluated. Results were saved in " + output)
+        return
+
+    print("\nMaterial properties:")
+    Sut = Entry_Manager.get_simple_numerical_entry("\tUltimate tensile strength, Sut [" + units + "]", "float", '+')
+    Sy = Entry_Manager.get_simple_numerical_entry("\tYield strength, Sy [" + units + "]", "float", '+')
+    print("\nMarin factors:")
+    print("* Press enter if DF, i.e, default value, is to be used. *\n")
+    surface = Entry_Manager.get_str_input("\tSurface finish", list(SURFACE_FINISH.keys()), "machined")
+    loading = Entry_Manager.get_str_input("\tLoading", list(LOADING.keys()), "bending")
+    d = Entry_Manager.get_simple_numerical_entry("\tDiameter [" + ("in" if units == 'kpsi' else "mm") +
+                                                 "] (DF = not applicable)", "float", '+', np.nan)
+    T = Entry_Manager.get_simple_numerical_entry("\tTemperature [" + ("°F" if units == 'kpsi' else "°C") +
+                                                 "] (DF = room temperature)", "float", '-', np.nan)
+    reliability = Entry_Manager.get_simple_numerical_entry("\tReliability (DF = 0.5)", "float", '+', 0.5)
+    kf = Entry_Manager.get_simple_numerical_entry("\tMiscellaneous-effects factor, kf (DF = 1)", "float", '+', 1)
+    print("\nStresses:")
+    sigma_a = Entry_Manager.get_simple_numerical_entry("\tAlternating stress [" + units + "]", "float", '+')
+    sigma_m = Entry_Manager.get_simple_numerical_entry("\tMean stress [" + units + "] (DF = 0)", "float", '-', 0)
+
+    design = FatigueDesign(Material(Sy, Sut, Sy, units), surface, d, loading, T, reliability, kf)
+    print(design.get_results())
+    print("Life:\n")
+    print("\tN = " + str(design.get_life(sigma_a)) + " cycles\n")
+    print("Safety factors:\n")
+    for criterion in ["goodman", "gerber", "asme-elliptic"]:
+        print("\t" + criterion.capitalize() + ": nf = " + str(design.get_safety_factor(sigma_a, sigma_m, criterion)))
+    print("\tYield: ny = " + str(design.get_yield_safety_factor(sigma_a, sigma_m)))
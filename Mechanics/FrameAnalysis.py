@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from ExceptionHandling import exceptions
+from Mechanics import FailureTheories
+from Mechanics.BucklingCalculator import get_critical_stress, get_euler_critical_stress
+from Mechanics.plotting import get_pyplot
+from os.path import basename
+from timeit import default_timer as timer
+from typing import Dict
+import json
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Degrees of freedom per node of each type of structure: (ux, uy) for trusses, (ux, uy, rz) for frames.
+DOFS_PER_NODE = {"truss": 2, "frame": 3}
+
+# Number of members listed in the summary of each load case.
+REPORTED_MEMBERS = 5
+
+# Smallest pivot of the factorization of the stiffness matrix, relative to the largest one. Smaller
+# pivots are round-off of zero ones, i.e., the structure is a mechanism.
+PIVOT_TOLERANCE = 1e-12
+
+
+def get_section_properties(section: dict) -> dict:
+    """ Area, moment of inertia and section modulus of a section, given directly or from the
+        dimensions of a circular (d) or rectangular (b, h) cross-section.
+
+    Args:
+        section (dict): E [GPa], optionally Sy [MPa] and C (end-condition constant of the members,
+                        Defaults to 1), and either d [m], b and h [m], or A [m^2], I [m^4] and S [m^3].
+
+    Raises:
+        InvalidFileFormatError: If the section has no E or no area.
+
+    Returns:
+        dict: E [Pa], Sy [Pa] (NaN if not given), C, A, I and S (NaN if not available).
+    """
+    if "E" not in section:
+        raise exceptions.InvalidFileFormatError("Every section must have E: " + str(section))
+    if "d" in section:
+        d = section["d"]
+        A, I, S = np.pi/4*d**2, np.pi/64*d**4, np.pi/32*d**3
+    elif "b" in section and "h" in section:
+        b, h = section["b"], section["h"]
+        A, I, S = b*h, b*h**3/12, b*h**2/6
+    elif "A" in section:
+        A, I, S = section["A"], section.get("I", np.nan), section.get("S", np.nan)
+    else:
+        raise exceptions.InvalidFileFormatError("Every section must have d, b and h, or A: " + str(section))
+    return {"E": section["E"]*1e9, "Sy": section.get("Sy", np.nan)*1e6, "C": section.get("C", 1),
+            "A": A, "I": I, "S": S}
+
+
+class FrameModel:
+    """ 2-D truss or frame analyzed by the direct stiffness method.
+
+        Element matrices of all members are built at once as (members, dofs, dofs) arrays and
+        assembled into a sparse global stiffness matrix. The matrix of the free degrees of freedom is
+        factorized once (sparse LU), and every load case is a pair of triangular solves. Member forces
+        are checked for buckling (Euler/Johnson, as in BucklingCalculator) and yielding (DET and MSST,
+        as in FailureTheories).
+
+        A model is a JSON file (or a dict with the same content):
+
+        {"type": "truss" or "frame",
+         "nodes": [[x, y], ...],                                    [m]
+         "sections": [{"E": .., "Sy": .., "d": ..}, ...],           (see get_section_properties)
+         "elements": [[node_i, node_j, section], ...],              (section defaults to 0)
+         "supports": [[node, ux, uy, rz], ...],                     (1 if restrained; rz for frames)
+         "load_cases": {"name": [[node, Fx, Fy, Mz], ...], ...}}    [kN, kN*m]
+    """
+
+    def __init__(self, model: dict) -> None:
+        """
+        Args:
+            model (dict): Model (see the class documentation).
+
+        Raises:
+            InvalidFileFormatError: If the model is not valid.
+        """
+        try:
+            self.type = model.get("type", "truss").lower()
+            self.dofs_per_node = DOFS_PER_NODE[self.type]
+            self.nodes = np.asarray(model["nodes"], dtype=float).reshape(-1, 2)
+            elements = np.asarray(model["elements"], dtype=int)
+            self.connectivity = elements[:, :2]
+            self.element_sections = elements[:, 2] if elements.shape[1] > 2 else np.zeros(len(elements), dtype=int)
+            self.sections = [get_section_properties(section) for section in model["sections"]]
+            self.supports = np.asarray(model["supports"], dtype=int).reshape(-1, 1 + self.dofs_per_node)
+            self.load_cases = {name: np.asarray(loads, dtype=float).reshape(-1, 1 + self.dofs_per_node)
+                               for name, loads in model["load_cases"].items()}
+        except (KeyError, ValueError, TypeError, IndexError) as e:
+            raise exceptions.InvalidFileFormatError("Invalid model: " + type(e).__name__ + " " + str(e))
+        if self.connectivity.min() < 0 or self.connectivity.max() >= len(self.nodes) or \
+                self.element_sections.max() >= len(self.sections):
+            raise exceptions.InvalidFileFormatError("Elements refer to nodes or sections which do not exist.")
+
+        # Properties of every member, gathered from its section.
+        self.properties = {name: np.array([section[name] for section in self.sections])[self.element_sections]
+                           for name in ["E", "Sy", "C", "A", "I", "S"]}
+        delta = self.nodes[self.connectivity[:, 1]] - self.nodes[self.connectivity[:, 0]]
+        self.L = np.hypot(delta[:, 0], delta[:, 1])
+        if np.any(self.L == 0):
+            raise exceptions.InvalidFileFormatError("Elements must have non-zero length.")
+        self.cos, self.sin = delta[:, 0]/self.L, delta[:, 1]/self.L
+        if self.type == "frame" and np.any(np.isnan(self.properties["I"])):
+            raise exceptions.InvalidFileFormatError("Every section of a frame must have I.")
+
+        self.n_dofs = self.dofs_per_node*len(self.nodes)
+        self.element_dofs = (self.dofs_per_node*self.connectivity[:, :, None] +
+                             np.arange(self.dofs_per_node)).reshape(len(self.L), -1)
+        restrained = (self.dofs_per_node*self.supports[:, :1] + np.arange(self.dofs_per_node))[self.supports[:, 1:] > 0]
+        self.restrained_dofs = np.unique(restrained)
+        self.free_dofs = np.setdiff1d(np.arange(self.n_dofs), self.restrained_dofs)
+        self.timings = dict()
+        self.K = None
+        self.factorization = None
+        self.member_stiffness = None  # k*T of every frame member, from global displacements to local end forces.
+
+    @classmethod
+    def from_file(cls, filename: str) -> 'FrameModel':
+        """
+        Args:
+            filename (str): JSON file of the model.
+
+        Returns:
+            FrameModel: Model.
+        """
+        with open(filename) as f:
+            return cls(json.load(f))
+
+    def get_transformations(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Rotation matrices from global to local coordinates of every member, with shape
+                        (members, 6, 6). Only used for frames.
+        """
+        T = np.zeros((len(self.L), 6, 6))
+        for offset in (0, 3):
+            T[:, offset, offset] = T[:, offset + 1, offset + 1] = self.cos
+            T[:, offset, offset + 1] = self.sin
+            T[:, offset + 1, offset] = -self.sin
+            T[:, offset + 2, offset + 2] = 1
+        return T
+
+    def get_local_stiffness(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Stiffness matrices of every frame member in local coordinates, with shape
+                        (members, 6, 6).
+        """
+        L, E, A, I = self.L, self.properties["E"], self.properties["A"], self.properties["I"]
+        axial, b1, b2, b3, b4 = E*A/L, 12*E*I/L**3, 6*E*I/L**2, 4*E*I/L, 2*E*I/L
+        k = np.zeros((len(L), 6, 6))
+        k[:, 0, 0] = k[:, 3, 3] = axial
+        k[:, 0, 3] = k[:, 3, 0] = -axial
+        k[:, 1, 1] = k[:, 4, 4] = b1
+        k[:, 1, 4] = k[:, 4, 1] = -b1
+        k[:, 1, 2] = k[:, 2, 1] = k[:, 1, 5] = k[:, 5, 1] = b2
+        k[:, 2, 4] = k[:, 4, 2] = k[:, 4, 5] = k[:, 5, 4] = -b2
+        k[:, 2, 2] = k[:, 5, 5] = b3
+        k[:, 2, 5] = k[:, 5, 2] = b4
+        return k
+
+    def get_element_stiffness(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Stiffness matrices of every member in global coordinates, with shape
+                        (members, dofs per member, dofs per member).
+        """
+        if self.type == "truss":
+            c, s = self.cos, self.sin
+            base = (self.properties["E"]*self.properties["A"]/self.L)[:, None, None] * \
+                np.stack([np.stack([c*c, c*s], -1), np.stack([c*s, s*s], -1)], 1)
+            return np.block([[base, -base], [-base, base]])
+        T = self.get_transformations()
+        return np.transpose(T, (0, 2, 1)) @ self.get_local_stiffness() @ T
+
+    def assemble(self) -> None:
+        """ Assembles the sparse global stiffness matrix and factorizes its free part.
+
+        Raises:
+            InvalidEntryError: If the structure is unstable (singular or nearly singular stiffness matrix).
+        """
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.linalg import splu
+        start = timer()
+        k = self.get_element_stiffness()
+        n = self.element_dofs.shape[1]
+        rows = np.repeat(self.element_dofs, n, axis=1).ravel()
+        columns = np.tile(self.element_dofs, (1, n)).ravel()
+        self.K = coo_matrix((k.ravel(), (rows, columns)), shape=(self.n_dofs, self.n_dofs)).tocsc()
+        self.timings["assembly"] = timer() - start
+
+        start = timer()
+        try:
+            factorization = splu(self.K[self.free_dofs][:, self.free_dofs])
+        except RuntimeError as e:
+            raise exceptions.InvalidEntryError("The structure is unstable (singular stiffness matrix): " + str(e),
+                                               basename(__file__))
+        pivots = np.abs(factorization.U.diagonal())
+        if pivots.size and not pivots.min() > PIVOT_TOLERANCE*pivots.max():
+            raise exceptions.InvalidEntryError("The structure is unstable (singular stiffness matrix): smallest "
+                                               "pivot is {:.3g} times the largest one".format(
+                                                   pivots.min()/pivots.max()), basename(__file__))
+        self.factorization = factorization
+        self.timings["factorization"] = timer() - start
+
+    def get_load_vectors(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Global load vectors [N, N*m] of every load case, with shape (dofs, load cases).
+        """
+        F = np.zeros((self.n_dofs, len(self.load_cases)))
+        for case, loads in enumerate(self.load_cases.values()):
+            dofs = (self.dofs_per_node*loads[:, :1].astype(int) + np.arange(self.dofs_per_node)).ravel()
+            np.add.at(F[:, case], dofs, 1e3*loads[:, 1:].ravel())
+        return F
+
+    def solve(self) -> Dict[str, dict]:
+        """ Solves every load case with the same factorization.
+
+        Raises:
+            InvalidEntryError: If the structure is unstable.
+
+        Returns:
+            Dict[str, dict]: Results of every load case (see get_member_results), with the displacements
+                             [m, rad] and reactions [N, N*m] of every node.
+        """
+        if self.factorization is None:
+            self.assemble()
+        F = self.get_load_vectors()
+        start = timer()
+        U = np.zeros_like(F)
+        U[self.free_dofs] = self.factorization.solve(F[self.free_dofs])
+        self.timings["solve"] = timer() - start
+        if not np.all(np.isfinite(U)):
+            raise exceptions.InvalidEntryError("The structure is unstable (non-finite displacements).",
+                                               basename(__file__))
+
+        start = timer()
+        R = self.K @ U - F
+        results = dict()
+        for case, name in enumerate(self.load_cases):
+            results[name] = {"displacements": U[:, case].reshape(-1, self.dofs_per_node),
+                             "reactions": R[:, case].reshape(-1, self.dofs_per_node)[np.unique(self.supports[:, 0])],
+                             **self.get_member_results(U[:, case])}
+        self.timings["member checks"] = timer() - start
+        return results
+
+    def get_member_results(self, u: np.ndarray) -> dict:
+        """ Member forces and checks of a load case.
+
+            - Axial force N (positive in tension) and, for frames, shear force V and moments M_i and
+              M_j at both ends.
+            - Largest normal stress at the extreme fibers, |N|/A + max(|M_i|, |M_j|)/S.
+            - Safety factor against yielding by DET and MSST, from FailureTheories.
+            - Safety factor against buckling of the members in compression (sigma_cr*A/|N|), by
+              Euler's or Johnson's theory with the C of the section. Infinite for members in tension.
+
+        Args:
+            u (np.ndarray): Global displacements.
+
+        Returns:
+            dict: Arrays of every member.
+        """
+        u_e = u[self.element_dofs]
+        A, I, S, E, Sy, C = (self.properties[name] for name in ["A", "I", "S", "E", "Sy", "C"])
+        if self.type == "truss":
+            du = u_e[:, 2:] - u_e[:, :2]
+            N = E*A/self.L*(self.cos*du[:, 0] + self.sin*du[:, 1])
+            results = {"N": N}
+            stress = np.abs(N)/A
+        else:
+            if self.member_stiffness is None:
+                self.member_stiffness = self.get_local_stiffness() @ self.get_transformations()
+            f = (self.member_stiffness @ u_e[:, :, None])[:, :, 0]
+            N, V, M_i, M_j = f[:, 3], f[:, 1], -f[:, 2], f[:, 5]
+            results = {"N": N, "V": V, "M_i": M_i, "M_j": M_j}
+            with np.errstate(invalid='ignore'):
+                stress = np.abs(N)/A + np.where(np.isnan(S), 0, np.maximum(np.abs(M_i), np.abs(M_j))/S)
+        results["stress"] = stress
+
+        safety_factors = dict()
+        for label, theory in [('DET', FailureTheories.DistortionEnergy), ('MSST', FailureTheories.MaximumShearStress)]:
+            n = np.full(len(N), np.nan)
+            for Sy_value in np.unique(Sy[~np.isnan(Sy)]):
+                members = Sy == Sy_value
+                n[members] = theory(Sy_value, Sy_value, Sy_value, label).safety_factor(stress[members],
+                                                                                      np.zeros(members.sum()))
+            safety_factors[label] = n
+        results["n_DET"], results["n_MSST"] = safety_factors['DET'], safety_factors['MSST']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lk = self.L/np.sqrt(I/A)
+            critical_stress = np.where(np.isnan(Sy), get_euler_critical_stress(C, E, lk),
+                                       get_critical_stress(C, E, np.where(np.isnan(Sy), 1, Sy), lk))
+            results["n_buckling"] = np.where(N < 0, critical_stress*A/np.abs(N), np.inf)
+        return results
+
+    def get_results(self, results: Dict[str, dict], members: int = REPORTED_MEMBERS) -> str:
+        """
+        Args:
+            results (Dict[str, dict]): Results of solve.
+            members (int, optional): Number of critical members listed. Defaults to REPORTED_MEMBERS.
+
+        Returns:
+            str: String which contains a report with all the results.
+        """
+        s = "\nModel:\n"
+        s += "\tType = " + self.type + '\n'
+        s += "\tNodes = " + str(len(self.nodes)) + ", members = " + str(len(self.L)) + \
+            ", free degrees of freedom = " + str(len(self.free_dofs)) + '\n'
+        s += "\tStiffness matrix: " + str(self.K.nnz) + " non-zeros, factor: " + \
+            str(self.factorization.L.nnz + self.factorization.U.nnz) + " non-zeros\n"
+        s += "\tTimes: " + ", ".join(name + " = {:.4g} s".format(seconds) for name, seconds in self.timings.items()) + '\n'
+        for name, result in results.items():
+            s += "\nLoad case " + name + ":\n"
+            s += "\tLargest displacement = {:.6g} m\n".format(np.max(np.hypot(*result["displacements"][:, :2].T)))
+            s += "\tReactions (sum) = " + ", ".join("{:.6g}".format(r/1e3) for r in result["reactions"].sum(0)) + \
+                " kN" + (", kN*m" if self.type == "frame" else "") + '\n'
+            n = np.fmin(np.fmin(result["n_DET"], result["n_MSST"]), result["n_buckling"])
+            s += "\tCritical members (member: N [kN], stress [MPa], n_DET, n_MSST, n_buckling):\n"
+            for member in np.argsort(np.where(np.isnan(n), np.inf, n))[:members]:
+                s += "\t\t{}: {:.6g}, {:.6g}, {:.4g}, {:.4g}, {:.4g}\n".format(
+                    member, result["N"][member]/1e3, result["stress"][member]/1e6, result["n_DET"][member],
+                    result["n_MSST"][member], result["n_buckling"][member])
+        return s
+
+    def plot(self, result: dict, scale: float = None) -> None:
+        """ Plots the structure, undeformed and deformed, with members colored by axial force.
+
+        Args:
+            result (dict): Results of a load case.
+            scale (float, optional): Scale of the displacements. Defaults to None, i.e, the largest
+                                     displacement is drawn as 5% of the size of the structure.
+        """
+        plt = get_pyplot()
+        from matplotlib.collections import LineCollection
+        displacements = result["displacements"][:, :2]
+        size = np.ptp(self.nodes, axis=0).max()
+        if scale is None:
+            largest = np.max(np.hypot(*displacements.T))
+            scale = 0.05*size/largest if largest > 0 else 1
+        deformed = self.nodes + scale*displacements
+
+        fig, ax = plt.subplots(figsize=(8, 6), dpi=80)
+        ax.add_collection(LineCollection(self.nodes[self.connectivity], colors='k', linewidths=0.5, alpha=0.3))
+        lines = LineCollection(deformed[self.connectivity], cmap='coolwarm', linewidths=1.5)
+        lines.set_array(result["N"]/1e3)
+        limit = np.max(np.abs(result["N"]))/1e3 or 1
+        lines.set_clim(-limit, limit)
+        ax.add_collection(lines)
+        fig.colorbar(lines, ax=ax, label='N [kN]')
+        ax.autoscale()
+        ax.set_aspect('equal')
+        ax.set_xlabel('x [m]')
+        ax.set_ylabel('y [m]')
+        ax.set_title('Deformed shape (x{:.3g})'.format(scale))
+        plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+        plt.savefig('Grafica.jpg', dpi=1200)
+        plt.show()
+
+
+def calculate(nodes: list, elements: list, sections: list, supports: list, load_cases: dict,
+              type: str = "truss") -> dict:
+    """ Non-interactive analysis of a 2-D truss or frame (see FrameModel for the format of every
+        parameter).
+
+    Args:
+        nodes (list): Coordinates of the nodes [m].
+        elements (list): [node_i, node_j, section] of every member.
+        sections (list): Sections.
+        supports (list): [node, ux, uy(, rz)] of every support.
+        load_cases (dict): Loads [kN, kN*m] of every load case, by name.
+        type (str, optional): truss or frame. Defaults to "truss".
+
+    Returns:
+        dict: Displacements [m, rad], reactions [N, N*m] and member results of every load case, and the
+              times taken.
+    """
+    model = FrameModel({"type": type, "nodes": nodes, "elements": elements, "sections": sections,
+                        "supports": supports, "load_cases": load_cases})
+    results = model.solve()
+    return {"load_cases": {name: {key: value.tolist() for key, value in result.items()}
+                           for name, result in results.items()},
+            "timings": model.timings}
+
+
+def main():
+    """ Analysis of a 2-D truss or frame read from a JSON file.
+    """
+    print("* Please, input valid data at all times! *\n")
+    print("Models are JSON files with the type of structure (truss or frame), nodes, sections, elements, supports and "
+          "load cases. Refer to the documentation of FrameModel for the format.\n")
+    while True:
+        filename = input("Model file: ").strip()
+        try:
+            start = timer()
+            model = FrameModel.from_file(filename)
+            read_time = timer() - start
+            results = model.solve()
+            break
+        except OSError as e:
+            print("Could not read " + filename + ": " + str(e))
+        except exceptions.ParentException.ParentException as e:
+            print(e.message)
+
+    model.timings = {"read": read_time, **model.timings}
+    print(model.get_results(results))
+
+    output = input("CSV file for the results of every member (DF = none): ").strip()
+    if output:
+        columns = [key for key in next(iter(results.values())) if key not in ("displacements", "reactions")]
+        with open(output, "w") as f:
+            f.write("load_case,member," + ",".join(columns) + "\n")
+            for name, result in results.items():
+                data = np.column_stack([result[column] for column in columns])
+                for member, row in enumerate(data):
+                    f.write(name + "," + str(member) + "," + ",".join("{:.8g}".format(value) for value in row) + "\n")
+        print("Results saved in " + basename(output) + ".")
+
+    if Entry_Manager.get_str_input("Plot the deformed structure?", ["y", "n"], "n") == "y":
+        names = list(results)
+        case = 1
+        if len(names) > 1:
+            case = Entry_Manager.get_menu_option("Load cases", "\n".join(str(i) + ". " + name for i, name in
+                                                                           enumerate(names, 1)),
+                                                 list(range(1, len(names) + 1)))
+        model.plot(results[names[case - 1]])
+        print("\nYour plot was saved inside the current directory. Go check it out!")
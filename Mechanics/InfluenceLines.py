@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from Mechanics.plotting import get_pyplot
+from EntryManager import EntryManager
+from timeit import default_timer as timer
+from typing import List, Tuple
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Maximum number of axles for which the envelope is built by shifting and adding the influence
+# lines. Longer trains (i.e, discretized distributed loads) are convolved through FFT instead.
+MAX_AXLES_DIRECT_SUPERPOSITION = 32
+
+# Largest number of responses (sections times positions of the train) computed at once. Sections are
+# processed in blocks of rows, so memory does not grow with the square of the number of grid points.
+RESPONSE_BLOCK_SIZE = 2**20
+
+
+class InfluenceLines:
+    """ Influence lines of shear and bending moment of a simply supported beam on a uniform grid,
+        and the envelopes produced by a load train rolling across the beam.
+
+        The response of a section to a unit load at every grid point has a closed form. The response
+        to a train of axles is then the superposition of the shifted influence lines, i.e, a
+        convolution of each influence line with the train, which avoids solving the beam again for
+        every position of the train. Influence lines are built for a block of sections at a time,
+        and only the extremes of their responses are kept.
+    """
+
+    def __init__(self, L: float, n: int) -> None:
+        """
+        Args:
+            L (float): Span of the beam. Supports are at x = 0 (pinned) and x = L (roller).
+            n (int): Number of grid intervals. Sections and load positions are x_i = i*L/n.
+        """
+        self.L = L
+        self.n = n
+        self.dx = L/n
+        self.x = np.linspace(0, L, n + 1)
+
+    def build_influence_lines(self, start: int = 0, stop: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """ Builds the influence lines of a block of sections for a unit load at every grid point.
+
+        Row i corresponds to the section x_(start + i) and column j to the unit load at a_j.
+
+        V(x; a) = 1 - a/L - 1 if a <= x else 1 - a/L
+        M(x; a) = a*(L - x)/L if a <= x else x*(L - a)/L
+
+        Args:
+            start (int, optional): First section of the block. Defaults to 0.
+            stop (int, optional): Section after the last one of the block. Defaults to None, i.e, n + 1.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Shear and moment influence matrices of shape
+                                           (stop - start, n + 1).
+        """
+        sections = self.x[start:stop, np.newaxis]
+        loads = self.x[np.newaxis, :]
+        load_at_left = loads <= sections
+
+        shear = (1 - loads/self.L) - load_at_left
+        moment = np.where(load_at_left, loads*(self.L - sections), sections*(self.L - loads))/self.L
+        return shear, moment
+
+    def discretize_train(self, axles: List[Tuple[float, float]]) -> np.ndarray:
+        """ Turns a load train into a kernel on the grid. Offsets are rounded to the nearest grid
+            point, so the error in the position of each axle is at most dx/2.
+
+        Args:
+            axles (List[Tuple[float, float]]): List of (offset, magnitude) of each axle. The offset is
+                                               measured from the leading axle, backwards, and must
+                                               not be negative.
+
+        Returns:
+            np.ndarray: Kernel whose k-th element is the load located k grid points behind the
+                        leading axle.
+        """
+        offsets, magnitudes = (np.asarray(values, dtype=float) for values in zip(*axles))
+        indices = np.rint(offsets/self.dx).astype(int)
+        kernel = np.zeros(indices.max() + 1)
+        np.add.at(kernel, indices, magnitudes)
+        return kernel
+
+    def response(self, influence: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+        """ Response of every section for every position of the leading axle, from the moment the
+            train enters the beam until it leaves it.
+
+        Args:
+            influence (np.ndarray): Influence matrix of shape (sections, n + 1).
+            kernel (np.ndarray): Load train on the grid (see discretize_train).
+
+        Returns:
+            np.ndarray: Matrix of shape (sections, n + len(kernel)). Column j corresponds to the leading
+                        axle at x_j.
+        """
+        axles = np.flatnonzero(kernel)
+        if len(axles) <= MAX_AXLES_DIRECT_SUPERPOSITION:
+            result = np.zeros((influence.shape[0], influence.shape[1] + len(kernel) - 1))
+            for k in axles:
+                result[:, k:k + influence.shape[1]] += kernel[k]*influence
+            return result
+        else:
+            from scipy.signal import fftconvolve
+            return fftconvolve(influence, kernel[np.newaxis, :], mode='full', axes=1)
+
+    def envelopes(self, axles: List[Tuple[float, float]]) -> dict:
+        """ Maximum and minimum shear and bending moment of every section produced by the load train.
+
+        Args:
+            axles (List[Tuple[float, float]]): List of (offset, magnitude) of each axle.
+
+        Returns:
+            dict: 'V_max', 'V_min', 'M_max' and 'M_min' arrays of length n + 1, one per section,
+                  plus the position of the leading axle that produces each of them ('*_at').
+        """
+        kernel = self.discretize_train(axles)
+        lead_positions = np.arange(self.n + len(kernel))*self.dx
+        results = {name + suffix: np.empty(self.n + 1) for name in ('V', 'M')
+                   for suffix in ('_max', '_min', '_max_at', '_min_at')}
+        block = max(1, RESPONSE_BLOCK_SIZE//len(lead_positions))
+        for start in range(0, self.n + 1, block):
+            stop = min(start + block, self.n + 1)
+            for name, influence in zip(('V', 'M'), self.build_influence_lines(start, stop)):
+                response = self.response(influence, kernel)
+                i_max, i_min = response.argmax(axis=1), response.argmin(axis=1)
+                rows = np.arange(response.shape[0])
+                results[name + '_max'][start:stop] = response[rows, i_max]
+                results[name + '_min'][start:stop] = response[rows, i_min]
+                results[name + '_max_at'][start:stop] = lead_positions[i_max]
+                results[name + '_min_at'][start:stop] = lead_positions[i_min]
+        return results
+
+    def envelopes_by_statics(self, axles: List[Tuple[float, float]]) -> dict:
+        """ Same as envelopes, but solving the beam by statics for every position of the leading axle.
+            It is kept as a reference to validate and time the influence-line approach.
+
+        Args:
+            axles (List[Tuple[float, float]]): List of (offset, magnitude) of each axle.
+
+        Returns:
+            dict: 'V_max', 'V_min', 'M_max' and 'M_min' arrays of length n + 1, one per section.
+        """
+        kernel = self.discretize_train(axles)
+        offsets = np.flatnonzero(kernel)*self.dx
+        magnitudes = kernel[kernel != 0]
+        results = {'V_max': np.full(self.n + 1, -np.inf), 'V_min': np.full(self.n + 1, np.inf),
+                   'M_max': np.full(self.n + 1, -np.inf), 'M_min': np.full(self.n + 1, np.inf)}
+        for lead in np.arange(self.n + len(kernel))*self.dx:
+            positions = lead - offsets
+            on_beam = (positions >= -1e-9*self.L) & (positions <= self.L*(1 + 1e-9))
+            a, P = positions[on_beam], magnitudes[on_beam]
+            R_A = np.sum(P*(self.L - a))/self.L
+            load_at_left = a[np.newaxis, :] <= self.x[:, np.newaxis] + 1e-9*self.L
+            V = R_A - load_at_left @ P
+            M = R_A*self.x - (load_at_left*(self.x[:, np.newaxis] - a[np.newaxis, :])) @ P
+            np.maximum(results['V_max'], V, out=results['V_max'])
+            np.minimum(results['V_min'], V, out=results['V_min'])
+            np.maximum(results['M_max'], M, out=results['M_max'])
+            np.minimum(results['M_min'], M, out=results['M_min'])
+        return results
+
+    def plot(self, envelopes: dict, units_x: str, units_f: str) -> None:
+        """ Plots the shear and bending moment envelopes.
+
+        Args:
+            envelopes (dict): Envelopes as returned by envelopes().
+            units_x (str): Unit of distance.
+            units_f (str): Unit of force.
+        """
+        plt = get_pyplot()
+        fig, (ax_V, ax_M) = plt.subplots(2, 1, sharex=True, figsize=(8, 8), dpi=80)
+        ax_V.fill_between(self.x, envelopes['V_min'], envelopes['V_max'], color='k', alpha=0.15)
+        ax_V.plot(self.x, envelopes['V_max'], 'k-')
+        ax_V.plot(self.x, envelopes['V_min'], 'k--')
+        ax_V.set_ylabel('V [' + units_f + ']')
+        ax_M.fill_between(self.x, envelopes['M_min'], envelopes['M_max'], color='k', alpha=0.15)
+        ax_M.plot(self.x, envelopes['M_max'], 'k-')
+        ax_M.plot(self.x, envelopes['M_min'], 'k--')
+        ax_M.set_ylabel('M [' + units_f + '·' + units_x + ']')
+        ax_M.set_xlabel('x [' + units_x + ']')
+        for ax in (ax_V, ax_M):
+            ax.set_xlim(0, self.L)
+            ax.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+            ax.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
+            ax.minorticks_on()
+        plt.savefig('Grafica.jpg', dpi=1200)
+        plt.show()
+
+    @classmethod
+    def get_axles(cls) -> List[Tuple[float, float]]:
+        """ Gets the axles of the load train.
+
+        Returns:
+            List[Tuple[float, float]]: List of tuples which corresponds to the offset from the leading
+                                       axle and the magnitude of each axle.
+        """
+        print("")
+        n = Entry_Manager.get_simple_numerical_entry("Number of axles", "int", '+')
+        print("")
+        print("Separate each value by a comma, semicolon or space, i.e, 4.3, 145 (or type @<file> to read every row from a file): ")
+        axles = Entry_Manager.get_list_of_tuples("Offset from leading axle and magnitude of axle", n, "float")
+        return axles
+
+
+def calculate(L: float, axles: list, n: int = 1000) -> dict:
+    """ Non-interactive calculation of the extreme shear and bending moment produced by a load train.
+
+    Args:
+        L (float): Span of the beam.
+        axles (list): List of [offset from leading axle, magnitude] of each axle.
+        n (int, optional): Number of grid intervals. Defaults to 1000.
+
+    Returns:
+        dict: Maximum absolute shear and maximum bending moment, and where they occur.
+    """
+    IL = InfluenceLines(L, n)
+    envelopes = IL.envelopes([tuple(axle) for axle in axles])
+    V = np.maximum(envelopes['V_max'], -envelopes['V_min'])
+    i_V, i_M = int(np.argmax(V)), int(np.argmax(envelopes['M_max']))
+    return {"V_max": float(V[i_V]), "V_max_x": float(IL.x[i_V]),
+            "M_max": float(envelopes['M_max'][i_M]), "M_max_x": float(IL.x[i_M]),
+            "M_max_lead_axle_x": float(envelopes['M_max_at'][i_M])}
+
+
+def main():
+    """ Computes the shear and bending moment envelopes of a simply supported beam under a moving
+        load train. It reports the running time of the influence-line approach and, for small
+        grids, of solving the beam for every position of the train.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units_f = input("Unit of force (N, kN, lbf): ")
+    units_x = input("Unit of distance (m, in): ")
+    L = Entry_Manager.get_simple_numerical_entry("Span of the beam, L", "float", '+')
+    n = Entry_Manager.get_simple_numerical_entry("Number of grid intervals (DF = 1000)", "int", '+', 1000)
+    axles = InfluenceLines.get_axles()
+
+    IL = InfluenceLines(L, n)
+    start = timer()
+    envelopes = IL.envelopes(axles)
+    envelope_time = (timer() - start)*1000
+
+    i_V = np.argmax(np.maximum(envelopes['V_max'], -envelopes['V_min']))
+    i_M = np.argmax(envelopes['M_max'])
+    print("\nResults:\n")
+    print("\tMaximum absolute shear = " + str(max(envelopes['V_max'][i_V], -envelopes['V_min'][i_V])) + ' ' +
+          units_f + " at x = " + str(IL.x[i_V]) + ' ' + units_x)
+    print("\tMaximum bending moment = " + str(envelopes['M_max'][i_M]) + ' ' + units_f + '·' + units_x +
+          " at x = " + str(IL.x[i_M]) + ' ' + units_x + " (leading axle at x = " +
+          str(envelopes['M_max_at'][i_M]) + ' ' + units_x + ")")
+
+    print("\nRunning time estimates:\n")
+    print("\tTime taken to build the influence lines and the envelopes: {:.6} ms".format(envelope_time))
+    if n <= 2000:
+        start = timer()
+        IL.envelopes_by_statics(axles)
+        statics_time = (timer() - start)*1000
+        print("\tTime taken solving the beam for every position: {:.6} ms".format(statics_time))
+
+    print("\nPlotting the envelopes...")
+    IL.plot(envelopes, units_x, units_f)
+    print("\nYour plot was saved inside the current directory. Go check it out!")
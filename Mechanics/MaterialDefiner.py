@@ -4,8 +4,90 @@ Created on April 18, 2020
 
 @author: Camilo Martínez
 """
-from scipy import interpolate
+from typing import Union
 from warnings import warn
+import numpy as np
+
+# Fatigue strength fraction, f, as a function of Sut [kpsi] (Figure 6-18 of Shigley's Mechanical
+# Engineering Design).
+SUT_TABLE_KPSI = [70, 80, 90, 100, 110, 120, 130, 140, 150, 160, 170, 184, 190, 200]
+F_TABLE = [0.9, 0.875, 0.8575, 0.844, 0.83, 0.82, 0.816, 0.805, 0.7975, 0.791, 0.787, 0.78, 0.7775, 0.774]
+
+# kpsi to MPa.
+KPSI_TO_MPA = 6.89476
+
+# Cubic interpolants of the f table, built on first use and cached per unit system.
+_INTERPOLANTS = dict()
+
+
+def get_conversion_factor(units: str) -> float:
+    """
+    Args:
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        float: Factor that converts kpsi to the given units.
+    """
+    return 1 if units == 'kpsi' else KPSI_TO_MPA
+
+
+def get_interpolant(units: str):
+    """ Returns the cubic interpolant of the fatigue strength fraction table for the given units.
+        It is only built the first time each unit system is requested.
+
+    Args:
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        scipy.interpolate.BSpline: Cubic interpolating spline of f(Sut), extrapolated outside the table.
+    """
+    conversion_factor = get_conversion_factor(units)
+    if conversion_factor not in _INTERPOLANTS:
+        from scipy import interpolate
+        x = [i*conversion_factor for i in SUT_TABLE_KPSI]
+        _INTERPOLANTS[conversion_factor] = interpolate.make_interp_spline(x, F_TABLE, k=3)
+    return _INTERPOLANTS[conversion_factor]
+
+
+def get_fatigue_strength_factor(Sut: Union[float, np.ndarray], units: str) -> Union[float, np.ndarray]:
+    """ Fatigue strength fraction, f, for one or many ultimate tensile strengths.
+
+    Args:
+        Sut (Union[float, np.ndarray]): Ultimate tensile strength(s).
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        Union[float, np.ndarray]: f, with the same shape as Sut. A float if Sut is a scalar.
+    """
+    conversion_factor = get_conversion_factor(units)
+    if np.ndim(Sut) == 0:
+        # Scalars skip the array machinery, since materials are usually constructed one by one.
+        if Sut > 200*conversion_factor:
+            warn("Sut is greater than 200 kpsi. An aproximate fatigue strength factor will be extrapolated.")
+        return 0.9 if Sut < 70*conversion_factor else float(get_interpolant(units)(Sut))
+
+    Sut = np.asarray(Sut, dtype=float)
+    if np.any(Sut > 200*conversion_factor):
+        warn("Sut is greater than 200 kpsi. An aproximate fatigue strength factor will be extrapolated.")
+
+    return np.where(Sut < 70*conversion_factor, 0.9, get_interpolant(units)(Sut))
+
+
+def get_Se_prime(Sut: Union[float, np.ndarray], units: str) -> Union[float, np.ndarray]:
+    """ Rotary-beam test specimen endurance limit, Se', for one or many ultimate tensile strengths.
+
+    Args:
+        Sut (Union[float, np.ndarray]): Ultimate tensile strength(s).
+        units (str): 'kpsi' or 'MPa'.
+
+    Returns:
+        Union[float, np.ndarray]: Se', with the same shape as Sut. A float if Sut is a scalar.
+    """
+    limit = 200 if units == 'kpsi' else 1400
+    if np.ndim(Sut) == 0:
+        return 0.5*Sut if Sut <= limit else 0.5*limit
+    return np.where(np.asarray(Sut) <= limit, 0.5*np.asarray(Sut, dtype=float), 0.5*limit)
+
 
 class Material:
 
@@ -16,18 +98,10 @@ class Material:
         self.units = units
         self.Se = self.get_Se_prime()
         self.f = FatigueStrengthFactor(self.Sut, self.units).value
-        
+
     def get_Se_prime(self) -> float:
-        if self.units == 'kpsi':
-            if self.Sut <= 200:
-                return 0.5*self.Sut
-            else:
-                return 100
-        else: # MPa
-            if self.Sut <= 1400:
-                return 0.5*self.Sut
-            else:
-                return 700
+        return get_Se_prime(self.Sut, self.units)
+
 
 class FatigueStrengthFactor:
 
@@ -35,25 +109,10 @@ class FatigueStrengthFactor:
         self.Sut = Sut
         self.units = units
         self.value = self.get_value()
-        
+
+    @property
+    def interpolating_function(self):
+        return get_interpolant(self.units)
+
     def get_value(self):
-        conversion_factor = 1
-        
-        if self.units != 'kpsi': # MPa
-            conversion_factor = 6.89476
-            
-        self.x = [70, 80, 90, 100, 110, 120, 130, 140, 150, 160,  170, 184, 190, 200]
-        self.x = [i*conversion_factor for i in self.x]
-        self.y = [0.9, 0.875,0.8575, 0.844, 0.83, 0.82, 0.816, 0.805, 0.7975, 0.791, 0.787, 0.78, 0.7775, 0.774]
-        
-        self.interpolating_function = interpolate.interp1d(self.x, self.y, kind=3, fill_value='extrapolate')
-
-        if self.Sut < 70*conversion_factor:
-            value = 0.9
-        else:
-            value = self.interpolating_function(self.Sut).tolist()    
-        
-        if self.Sut > 200*conversion_factor:
-            warn("Sut is greater than 200 kpsi. An aproximate fatigue strength factor will be extrapolated.")
-            
-        return value
\ No newline at end of file
+        return get_fatigue_strength_factor(self.Sut, self.units)
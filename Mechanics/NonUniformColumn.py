@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from ExceptionHandling import exceptions
+from Mechanics.plotting import get_pyplot
+from typing import List, Tuple
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Default number of beam elements along the column. The error of the critical loads decreases as
+# 1/elements^4, but beyond a few hundred elements round-off grows, since K scales as elements^3.
+ELEMENTS = 100
+
+# Default number of critical loads (buckling modes) computed.
+MODES = 3
+
+# Gauss-Legendre points (on [0, 1]) and weights used to integrate EI(x) over each element.
+GAUSS_POINTS = (1 + np.array([-np.sqrt(3/5), 0, np.sqrt(3/5)]))/2
+GAUSS_WEIGHTS = np.array([5/18, 8/18, 5/18])
+
+# Degrees of freedom (deflection, rotation) restrained by each boundary condition.
+RESTRAINTS = {"fixed": [0, 1], "pinned": [0], "free": []}
+
+
+def get_inertia(segment: List[float], xi: np.ndarray) -> np.ndarray:
+    """ Second moment of area along a segment, whose dimensions vary linearly from one end to the other.
+
+    Args:
+        segment (List[float]): [length, d_start, d_end] for a circular cross-section, or
+                               [length, b_start, h_start, b_end, h_end] for a rectangular one, which
+                               bends about its weaker axis [m].
+        xi (np.ndarray): Positions along the segment, from 0 (start) to 1 (end).
+
+    Returns:
+        np.ndarray: Moment of inertia at every position [m^4].
+    """
+    if len(segment) == 3:
+        d = segment[1] + (segment[2] - segment[1])*xi
+        return np.pi/64*d**4
+    b = segment[1] + (segment[3] - segment[1])*xi
+    h = segment[2] + (segment[4] - segment[2])*xi
+    return np.maximum(b, h)*np.minimum(b, h)**3/12
+
+
+class NonUniformColumn:
+    """ Critical loads of columns whose cross-section changes along their length (stepped or tapered),
+        by the finite element method. The column is discretized into Euler-Bernoulli beam elements,
+        and the sparse stiffness matrix K and geometric stiffness matrix K_G (per unit axial load)
+        give the generalized eigenproblem K*phi = P*K_G*phi, whose lowest eigenvalues are the critical
+        loads.
+
+        For prismatic columns, it reproduces Euler's formula (Chapter 4-12 of Shigley's Mechanical
+        Engineering Design, pags. 176-178).
+    """
+
+    def __init__(self, segments: List[List[float]], E: float, inf_bdry_condition: str = "pinned",
+                 sup_bdry_condition: str = "pinned", elements: int = ELEMENTS) -> None:
+        """
+        Args:
+            segments (List[List[float]]): Segments of the column, from bottom to top (see get_inertia).
+            E (float): Young's modulus of material [GPa].
+            inf_bdry_condition (str, optional): Fixed, Pinned or Free. Defaults to "pinned".
+            sup_bdry_condition (str, optional): Fixed, Pinned or Free. Defaults to "pinned".
+            elements (int, optional): Approximate number of elements. Every segment gets a share
+                                      proportional to its length, and at least 2. Defaults to ELEMENTS.
+
+        Raises:
+            InvalidEntryError: If a segment or a boundary condition is not valid, or the column is
+                               not restrained.
+        """
+        self.E = E*1e9
+        self.inf_bdry_condition = inf_bdry_condition.strip().lower()
+        self.sup_bdry_condition = sup_bdry_condition.strip().lower()
+        if any(condition not in RESTRAINTS for condition in (self.inf_bdry_condition, self.sup_bdry_condition)):
+            raise exceptions.InvalidEntryError("Boundary conditions must be any of: " + str(list(RESTRAINTS)))
+        if len(RESTRAINTS[self.inf_bdry_condition]) + len(RESTRAINTS[self.sup_bdry_condition]) < 2:
+            raise exceptions.InvalidEntryError("The column is not restrained: " + self.inf_bdry_condition + "-" +
+                                               self.sup_bdry_condition)
+        if any(len(segment) not in (3, 5) or min(segment) <= 0 for segment in segments):
+            raise exceptions.InvalidEntryError("Segments must be [length, d_start, d_end] or "
+                                               "[length, b_start, h_start, b_end, h_end], with positive values.")
+
+        self.segments = [list(map(float, segment)) for segment in segments]
+        self.l = sum(segment[0] for segment in self.segments)
+        self.x, self.element_EI = self.build_mesh(elements)
+        self.K, self.KG = self.assemble()
+
+    def build_mesh(self, elements: int) -> Tuple[np.ndarray, np.ndarray]:
+        """ Divides every segment into elements, so that steps fall on nodes.
+
+        Args:
+            elements (int): Approximate number of elements.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Coordinates of the nodes, and EI of every element at its
+                                           Gauss points, with shape (elements, 3).
+        """
+        x, EI = [np.zeros(1)], list()
+        start = 0.0
+        for segment in self.segments:
+            n = max(2, int(round(elements*segment[0]/self.l)))
+            nodes = np.linspace(0, 1, n + 1)
+            x.append(start + segment[0]*nodes[1:])
+            xi = nodes[:-1, None] + (nodes[1] - nodes[0])*GAUSS_POINTS[None, :]
+            EI.append(self.E*get_inertia(segment, xi))
+            start += segment[0]
+        return np.concatenate(x), np.concatenate(EI)
+
+    def assemble(self):
+        """ Assembles the sparse stiffness and geometric stiffness matrices, all elements at once.
+
+            K_e = integral of EI(x)*B^T*B dx (3-point Gauss), with B the second derivatives of the
+            Hermite shape functions, and K_G,e = 1/(30L)*[[36, 3L, -36, 3L], [3L, 4L^2, -3L, -L^2],
+            [-36, -3L, 36, -3L], [3L, -L^2, -3L, 4L^2]].
+
+        Returns:
+            Tuple[scipy.sparse.csc_matrix, scipy.sparse.csc_matrix]: K and K_G, with the restrained
+                                                                     degrees of freedom removed.
+        """
+        from scipy.sparse import coo_matrix
+        L = np.diff(self.x)[:, None]
+        ones = np.ones_like(L)
+        xi = GAUSS_POINTS[None, :]
+
+        # Second derivatives of the shape functions at the Gauss points: shape (elements, 3, 4).
+        B = np.stack([(12*xi - 6)/L**2, (6*xi - 4)/L, (6 - 12*xi)/L**2, (6*xi - 2)/L], axis=-1)
+        K = np.einsum('eg,egi,egj->eij', L*self.element_EI*GAUSS_WEIGHTS, B, B)
+        KG = np.stack([np.concatenate([36*ones, 3*L, -36*ones, 3*L], 1),
+                       np.concatenate([3*L, 4*L**2, -3*L, -L**2], 1),
+                       np.concatenate([-36*ones, -3*L, 36*ones, -3*L], 1),
+                       np.concatenate([3*L, -L**2, -3*L, 4*L**2], 1)], axis=1)/(30*L[:, :, None])
+
+        n_elements = len(L)
+        dofs = 2*np.arange(n_elements)[:, None] + np.arange(4)[None, :]
+        rows = np.repeat(dofs, 4, axis=1).ravel()
+        columns = np.tile(dofs, (1, 4)).ravel()
+        n = 2*(n_elements + 1)
+
+        restrained = RESTRAINTS[self.inf_bdry_condition] + [n - 2 + dof for dof in RESTRAINTS[self.sup_bdry_condition]]
+        self.free_dofs = np.setdiff1d(np.arange(n), restrained)
+        matrices = []
+        for values in (K, KG):
+            matrix = coo_matrix((values.ravel(), (rows, columns)), shape=(n, n)).tocsc()
+            matrices.append(matrix[self.free_dofs][:, self.free_dofs])
+        return tuple(matrices)
+
+    def get_minimum_EI(self) -> float:
+        return float(self.element_EI.min())
+
+    def solve(self, modes: int = MODES) -> Tuple[np.ndarray, np.ndarray]:
+        """ Solves K*phi = P*K_G*phi for the lowest critical loads with ARPACK in buckling mode, a
+            shift-invert transformation for this kind of problem (K positive definite, K_G indefinite).
+            The shift is a lower bound of the first critical load (a fixed-free column of the smallest
+            EI), so the eigenvalues nearest to it are the lowest ones.
+
+        Args:
+            modes (int, optional): Number of critical loads. Defaults to MODES.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Critical loads [N] in ascending order, and the deflection of
+                                           every mode at the nodes, with shape (modes, nodes),
+                                           normalized to a largest deflection of 1.
+        """
+        from scipy.sparse.linalg import eigsh
+        modes = min(modes, self.K.shape[0] - 1)
+        shift = 0.5*np.pi**2*self.get_minimum_EI()/(4*self.l**2)
+        loads, vectors = eigsh(self.K, k=modes, M=self.KG, sigma=shift, mode='buckling', which='LM')
+        order = np.argsort(loads)
+        loads, vectors = loads[order], vectors[:, order]
+
+        shapes = np.zeros((2*len(self.x), modes))
+        shapes[self.free_dofs] = vectors
+        shapes = shapes[0::2].T
+        peaks = shapes[np.arange(modes), np.argmax(np.abs(shapes), axis=1)]
+        return loads, shapes/peaks[:, None]
+
+    def get_results(self, loads: np.ndarray) -> str:
+        """
+        Args:
+            loads (np.ndarray): Critical loads [N].
+
+        Returns:
+            str: String which contains a report with all the results.
+        """
+        s = "\nColumn:\n"
+        s += "\tLength = " + str(self.l) + ' m\n'
+        s += "\tBoundary conditions = " + self.inf_bdry_condition + "-" + self.sup_bdry_condition + '\n'
+        s += "\tElements = " + str(len(self.x) - 1) + '\n'
+        s += "\tMinimum EI = " + str(self.get_minimum_EI()) + ' N*m^2\n'
+        s += "\nCritical loads:\n"
+        for i, load in enumerate(loads, 1):
+            s += "\tMode " + str(i) + ": P_cr = " + str(load/1000) + ' kN\n'
+        s += "\nEquivalent C of the first mode with the minimum EI, P_cr*l^2/(pi^2*EI_min) = " + \
+            str(loads[0]*self.l**2/(np.pi**2*self.get_minimum_EI())) + '\n'
+        return s
+
+
+def plot_modes(x: np.ndarray, shapes: np.ndarray, loads: np.ndarray) -> None:
+    """ Plots the buckling modes along the column.
+
+    Args:
+        x (np.ndarray): Coordinates of the nodes [m].
+        shapes (np.ndarray): Deflection of every mode at the nodes.
+        loads (np.ndarray): Critical loads [N].
+    """
+    plt = get_pyplot()
+    plt.figure(figsize=(5, 8), dpi=80)
+    for i, (shape, load) in enumerate(zip(shapes, loads), 1):
+        plt.plot(shape, x, label="Mode {}: {:.4g} kN".format(i, load/1000))
+    plt.axvline(0, color='k', linewidth=0.8)
+    plt.xlabel('Normalized deflection')
+    plt.ylabel('x [m]')
+    plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+    plt.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
+    plt.minorticks_on()
+    plt.legend(loc='upper right')
+    plt.savefig('Grafica.jpg', dpi=1200)
+    plt.show()
+
+
+def calculate(segments: list, E: float, inf_bdry_condition: str = "pinned", sup_bdry_condition: str = "pinned",
+              elements: int = ELEMENTS, modes: int = MODES, include_shapes: bool = False) -> dict:
+    """ Non-interactive calculation of the critical loads of a stepped or tapered column.
+
+    Args:
+        segments (list): Segments from bottom to top, as [length, d_start, d_end] (circular) or
+                         [length, b_start, h_start, b_end, h_end] (rectangular) [m].
+        E (float): Young's modulus of material [GPa].
+        inf_bdry_condition (str, optional): Fixed, Pinned or Free. Defaults to "pinned".
+        sup_bdry_condition (str, optional): Fixed, Pinned or Free. Defaults to "pinned".
+        elements (int, optional): Number of elements. Defaults to ELEMENTS.
+        modes (int, optional): Number of critical loads. Defaults to MODES.
+        include_shapes (bool, optional): True to include the coordinates of the nodes and the mode
+                                         shapes. Defaults to False.
+
+    Returns:
+        dict: Critical loads [N], length [m] and minimum EI [N*m^2] (and mode shapes).
+    """
+    column = NonUniformColumn(segments, E, inf_bdry_condition, sup_bdry_condition, elements)
+    loads, shapes = column.solve(modes)
+    result = {"critical_loads": loads.tolist(), "l": column.l, "EI_min": column.get_minimum_EI()}
+    if include_shapes:
+        result["x"] = column.x.tolist()
+        result["shapes"] = shapes.tolist()
+    return result
+
+
+def main():
+    """ Critical loads and buckling modes of a stepped or tapered column.
+    """
+    print("* Please, input valid data at all times! *\n")
+    cross_section_type = Entry_Manager.get_menu_option("", "Type of cross-sectional area:\n1. Circular.\n2. Rectangular.",
+                                                       [1, 2], False)
+    if cross_section_type == 1:
+        segments = Entry_Manager.get_array("Segments, from bottom to top, as length [m], d_start [m], d_end [m]", 3)
+    else:
+        segments = Entry_Manager.get_array("Segments, from bottom to top, as length [m], b_start [m], h_start [m], "
+                                           "b_end [m], h_end [m]", 5)
+    E = Entry_Manager.get_simple_numerical_entry("Young's modulus, E [GPa]", "float")
+    inf_cond = Entry_Manager.get_str_input("Inferior boundary condition", ["fixed", "pinned", "free"], "pinned")
+    sup_cond = Entry_Manager.get_str_input("Superior boundary condition", ["fixed", "pinned", "free"], "pinned")
+    elements = Entry_Manager.get_simple_numerical_entry("Number of elements (DF = " + str(ELEMENTS) + ")", "int", '+',
+                                                        ELEMENTS)
+    modes = Entry_Manager.get_simple_numerical_entry("Number of modes (DF = " + str(MODES) + ")", "int", '+', MODES)
+
+    column = NonUniformColumn(segments.tolist(), E, inf_cond, sup_cond, elements)
+    loads, shapes = column.solve(modes)
+    print(column.get_results(loads))
+
+    if Entry_Manager.get_str_input("Plot the buckling modes?", ["y", "n"], "n") == "y":
+        plot_modes(column.x, shapes, loads)
+        print("\nYour plot was saved inside the current directory. Go check it out!")
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from Mechanics.plotting import get_pyplot
+from os.path import splitext
+from timeit import default_timer as timer
+from typing import Iterator, Tuple
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Number of stress tensors read from disk and processed at once.
+CHUNK_SIZE = 500000
+
+# Components of each stress tensor, in the order they are stored in a file.
+COMPONENTS = ['sx', 'sy', 'sz', 'txy', 'tyz', 'tzx']
+
+# Columns written for every stress tensor by process_file.
+OUTPUT_COLUMNS = ['s1', 's2', 's3', 'von_mises', 'tau_12', 'tau_23', 'tau_13', 'I1', 'I2', 'I3']
+
+# Largest number of stress states drawn in the failure theories diagram.
+MAX_PLOTTED_STATES = 50000
+
+
+def get_invariants(sx, sy, sz, txy, tyz, tzx) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Stress invariants of one or many stress tensors.
+
+        I1 = sx + sy + sz
+        I2 = sx*sy + sy*sz + sz*sx - txy^2 - tyz^2 - tzx^2
+        I3 = sx*sy*sz + 2*txy*tyz*tzx - sx*tyz^2 - sy*tzx^2 - sz*txy^2
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: I1, I2 and I3.
+    """
+    I1 = sx + sy + sz
+    I2 = sx*sy + sy*sz + sz*sx - txy**2 - tyz**2 - tzx**2
+    I3 = sx*sy*sz + 2*txy*tyz*tzx - sx*tyz**2 - sy*tzx**2 - sz*txy**2
+    return I1, I2, I3
+
+
+def get_principal_stresses(sx, sy, sz, txy, tyz, tzx) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Principal stresses of one or many symmetric stress tensors, in closed form.
+
+        The eigenvalues are computed from the deviatoric stress s = sigma - p*I, with the mean stress
+        p = I1/3, as sigma_k = p + 2*sqrt(J2/3)*cos(theta - 2*pi*k/3), where the Lode angle is
+        theta = arccos(J3/2*(3/J2)^(3/2))/3. Working with the deviator keeps the hydrostatic part out
+        of the cancellations. Every operation is vectorized, so millions of tensors take about as
+        long as a few passes over the arrays.
+
+    Args:
+        sx, sy, sz (float, np.ndarray): Normal stresses.
+        txy, tyz, tzx (float, np.ndarray): Shear stresses.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: sigma_1 >= sigma_2 >= sigma_3.
+    """
+    sx, sy, sz, txy, tyz, tzx = (np.asarray(s, dtype=float) for s in (sx, sy, sz, txy, tyz, tzx))
+    p = (sx + sy + sz)/3
+    dx, dy, dz = sx - p, sy - p, sz - p
+    shear = txy**2 + tyz**2 + tzx**2
+    J2 = (dx**2 + dy**2 + dz**2)/2 + shear
+    J3 = dx*dy*dz + 2*txy*tyz*tzx - dx*tyz**2 - dy*tzx**2 - dz*txy**2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = np.where(J2 > 0, J3/2*(3/J2)**1.5, 0)
+    theta = np.arccos(np.clip(r, -1, 1))/3
+    radius = 2*np.sqrt(J2/3)
+
+    s1 = p + radius*np.cos(theta)
+    s3 = p + radius*np.cos(theta + 2*np.pi/3)
+    s2 = 3*p - s1 - s3
+    return s1, s2, s3
+
+
+def get_mohr_circles(s1, s2, s3) -> Tuple[np.ndarray, np.ndarray]:
+    """ Mohr's circles of one or many 3-D stress states.
+
+    Args:
+        s1, s2, s3 (float, np.ndarray): Principal stresses, s1 >= s2 >= s3.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Centers and radii of the circles through (s1, s2), (s2, s3)
+                                       and (s1, s3), with shape (..., 3). The radii are the principal
+                                       shear stresses tau_12, tau_23 and tau_13 = tau_max.
+    """
+    s1, s2, s3 = (np.asarray(s, dtype=float) for s in (s1, s2, s3))
+    centers = np.stack([(s1 + s2)/2, (s2 + s3)/2, (s1 + s3)/2], axis=-1)
+    radii = np.stack([(s1 - s2)/2, (s2 - s3)/2, (s1 - s3)/2], axis=-1)
+    return centers, radii
+
+
+def get_von_mises(s1, s2, s3) -> np.ndarray:
+    """ sigma' = ((s1 - s2)^2 + (s2 - s3)^2 + (s3 - s1)^2)/2)^(1/2)
+    """
+    return np.sqrt(((s1 - s2)**2 + (s2 - s3)**2 + (s3 - s1)**2)/2)
+
+
+def to_plane(s1, s2, s3) -> Tuple[np.ndarray, np.ndarray]:
+    """ The two principal stresses of largest magnitude, which are the ones drawn in the plane stress
+        failure theories diagram. For plane stress states, the dropped one is zero.
+
+    Args:
+        s1, s2, s3 (np.ndarray): Principal stresses, s1 >= s2 >= s3.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: sigma_A and sigma_B.
+    """
+    s1, s2, s3 = (np.asarray(s, dtype=float) for s in (s1, s2, s3))
+    # The smallest magnitude is always one of the ends or s2, so only that choice has to be made.
+    drop_1 = (np.abs(s1) <= np.abs(s2)) & (np.abs(s1) <= np.abs(s3))
+    drop_3 = ~drop_1 & (np.abs(s3) <= np.abs(s2))
+    sigma_A = np.where(drop_1, s2, s1)
+    sigma_B = np.where(drop_1 | drop_3, np.where(drop_3, s2, s3), s3)
+    return sigma_A, sigma_B
+
+
+def analyze(tensors: np.ndarray) -> dict:
+    """ Principal stresses, Mohr's circles, von Mises stress and invariants of many stress tensors.
+
+    Args:
+        tensors (np.ndarray): Array of shape (n, 6) with sx, sy, sz, txy, tyz and tzx of each tensor.
+
+    Returns:
+        dict: Array of length n of every name in OUTPUT_COLUMNS.
+    """
+    tensors = np.asarray(tensors, dtype=float).reshape(-1, 6)
+    components = tensors.T
+    s1, s2, s3 = get_principal_stresses(*components)
+    I1, I2, I3 = get_invariants(*components)
+    _, radii = get_mohr_circles(s1, s2, s3)
+    return {'s1': s1, 's2': s2, 's3': s3, 'von_mises': get_von_mises(s1, s2, s3),
+            'tau_12': radii[:, 0], 'tau_23': radii[:, 1], 'tau_13': radii[:, 2], 'I1': I1, 'I2': I2, 'I3': I3}
+
+
+def read_tensors(filename: str, first_column: int = 0, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """ Reads stress tensors from disk in chunks, so that the number of tensors is not limited by
+        memory.
+
+    Args:
+        filename (str): .npy file (memory-mapped) or a text/csv file with one tensor per row, as
+                        sx, sy, sz, txy, tyz, tzx. Values may be separated by commas, semicolons or
+                        whitespace. A header row is skipped.
+        first_column (int, optional): Column of sx. The other components follow it. Defaults to 0,
+                                      so node ids or coordinates can come before the tensor.
+        chunk_size (int, optional): Number of tensors per chunk. Defaults to CHUNK_SIZE.
+
+    Yields:
+        np.ndarray: Consecutive chunks of shape (chunk_size, 6).
+    """
+    columns = list(range(first_column, first_column + 6))
+    if splitext(filename)[1] == ".npy":
+        data = np.load(filename, mmap_mode='r')
+        for start in range(0, len(data), chunk_size):
+            yield np.asarray(data[start:start + chunk_size, columns], dtype=float)
+        return
+
+    import pandas as pd
+    with open(filename) as f:
+        first_line = f.readline()
+    # The delimiter is detected from the first line, so that pandas can use its fast C parser.
+    sep = ',' if ',' in first_line else ';' if ';' in first_line else r'\s+'
+    try:
+        [float(value) for value in first_line.replace(',', ' ').replace(';', ' ').split()]
+        header = None
+    except ValueError:
+        header = 0
+    reader = pd.read_csv(filename, sep=sep, header=header, usecols=columns, chunksize=chunk_size,
+                         engine='c', skipinitialspace=True)
+    for chunk in reader:
+        yield chunk.to_numpy(float)
+
+
+class PrincipalStressPipeline:
+    """ Streams stress tensors, from memory or from disk, into principal stresses, keeping a summary
+        of the whole set: extreme stresses, the governing point and, if a yield strength is given,
+        the safety factors by the maximum shear stress and distortion energy theories.
+    """
+
+    def __init__(self, Sy: float = None, keep_plane_states: int = MAX_PLOTTED_STATES, seed: int = 0) -> None:
+        """
+        Args:
+            Sy (float, optional): Yield strength of material. Defaults to None (no safety factors).
+            keep_plane_states (int, optional): Number of (sigma_A, sigma_B) states kept, as a uniform
+                                               random sample of all of them, for the failure
+                                               theories diagram. Defaults to MAX_PLOTTED_STATES.
+            seed (int, optional): Seed of the sample. Defaults to 0.
+        """
+        self.Sy = Sy
+        self.keep_plane_states = keep_plane_states
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.extremes = dict()
+        self.failing = {'MSST': 0, 'DET': 0}
+        self.plane_states = np.empty((0, 2))
+        self.plane_keys = np.empty(0)
+
+    def update_extreme(self, name: str, values: np.ndarray, results: dict, largest: bool = True) -> None:
+        """ Keeps the largest (or smallest) value of a result and the principal stresses where it
+            happens.
+        """
+        i = int(np.argmax(values) if largest else np.argmin(values))
+        current = self.extremes.get(name)
+        if current is None or (values[i] > current['value'] if largest else values[i] < current['value']):
+            self.extremes[name] = {'value': float(values[i]), 'index': self.count + i,
+                                   'principal_stresses': [float(results[s][i]) for s in ('s1', 's2', 's3')]}
+
+    def process(self, tensors: np.ndarray) -> dict:
+        """ Processes a chunk of tensors.
+
+        Args:
+            tensors (np.ndarray): Array of shape (n, 6).
+
+        Returns:
+            dict: Results of the chunk (see analyze).
+        """
+        results = analyze(tensors)
+        n = len(results['s1'])
+        if n == 0:
+            return results
+
+        self.update_extreme('s1_max', results['s1'], results)
+        self.update_extreme('s3_min', results['s3'], results, largest=False)
+        self.update_extreme('von_mises_max', results['von_mises'], results)
+        self.update_extreme('tau_max', results['tau_13'], results)
+        if self.Sy is not None:
+            self.failing['MSST'] += int(np.count_nonzero(2*results['tau_13'] > self.Sy))
+            self.failing['DET'] += int(np.count_nonzero(results['von_mises'] > self.Sy))
+
+        # Reservoir sample of the plane states: every state gets a random key and the states with
+        # the smallest keys are kept, which is a uniform sample of everything seen so far.
+        if self.keep_plane_states > 0:
+            keys = self.rng.random(n)
+            plane = np.stack(to_plane(results['s1'], results['s2'], results['s3']), axis=1)
+            self.plane_states = np.concatenate([self.plane_states, plane])
+            self.plane_keys = np.concatenate([self.plane_keys, keys])
+            if len(self.plane_keys) > self.keep_plane_states:
+                keep = np.argpartition(self.plane_keys, self.keep_plane_states)[:self.keep_plane_states]
+                self.plane_states, self.plane_keys = self.plane_states[keep], self.plane_keys[keep]
+
+        self.count += n
+        return results
+
+    def process_file(self, filename: str, first_column: int = 0, output: str = None,
+                     chunk_size: int = CHUNK_SIZE) -> None:
+        """ Processes every tensor of a file, chunk by chunk.
+
+        Args:
+            filename (str): File with the tensors (see read_tensors).
+            first_column (int, optional): Column of sx. Defaults to 0.
+            output (str, optional): CSV file where OUTPUT_COLUMNS of every tensor are written.
+                                    Defaults to None (nothing is written).
+            chunk_size (int, optional): Number of tensors per chunk. Defaults to CHUNK_SIZE.
+        """
+        f = open(output, 'w') if output is not None else None
+        try:
+            if f is not None:
+                f.write(','.join(OUTPUT_COLUMNS) + '\n')
+            for tensors in read_tensors(filename, first_column, chunk_size):
+                results = self.process(tensors)
+                if f is not None:
+                    np.savetxt(f, np.column_stack([results[c] for c in OUTPUT_COLUMNS]), delimiter=',', fmt='%.8g')
+        finally:
+            if f is not None:
+                f.close()
+
+    def get_summary(self) -> dict:
+        """
+        Returns:
+            dict: Number of tensors, extreme values with their index and principal stresses, Mohr's
+                  circles of the point with the largest von Mises stress and, if Sy was given, the
+                  smallest safety factors and the number of failing points by MSST and DET.
+        """
+        summary = {'count': self.count, **self.extremes}
+        if 'von_mises_max' in self.extremes:
+            centers, radii = get_mohr_circles(*self.extremes['von_mises_max']['principal_stresses'])
+            summary['governing_mohr_circles'] = {'centers': centers.tolist(), 'radii': radii.tolist()}
+        if self.Sy is not None and self.count:
+            summary['safety_factor'] = {'MSST': self.Sy/(2*self.extremes['tau_max']['value']),
+                                        'DET': self.Sy/self.extremes['von_mises_max']['value']}
+            summary['failing_points'] = dict(self.failing)
+        return summary
+
+
+def plot_mohr_circles(s1: float, s2: float, s3: float, units: str) -> None:
+    """ Plots the three Mohr's circles of a stress state.
+
+    Args:
+        s1, s2, s3 (float): Principal stresses, s1 >= s2 >= s3.
+        units (str): Units of stress.
+    """
+    plt = get_pyplot()
+    centers, radii = get_mohr_circles(s1, s2, s3)
+    t = np.linspace(0, 2*np.pi, 361)
+    plt.figure(figsize=(8, 6), dpi=80)
+    for center, radius, color, label in zip(centers, radii, ['r', 'b', 'k'], ['1-2', '2-3', '1-3']):
+        plt.plot(center + radius*np.cos(t), radius*np.sin(t), color=color, label=label)
+    plt.scatter([s1, s2, s3], [0, 0, 0], color='k', zorder=3)
+    plt.gca().set_aspect('equal')
+    plt.xlabel('$\\sigma$ [' + units + ']')
+    plt.ylabel('$\\tau$ [' + units + ']')
+    plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+    plt.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
+    plt.minorticks_on()
+    plt.legend(loc='upper left')
+    plt.savefig('Grafica.jpg', dpi=1200)
+    plt.show()
+
+
+def calculate(tensors: list, Sy: float = None) -> dict:
+    """ Non-interactive calculation of principal stresses.
+
+    Args:
+        tensors (list): List of [sx, sy, sz, txy, tyz, tzx] of each stress tensor.
+        Sy (float, optional): Yield strength of material. Defaults to None (no safety factors).
+
+    Returns:
+        dict: Principal stresses, von Mises stress, principal shear stresses and invariants of each
+              tensor, and the summary of all of them.
+    """
+    pipeline = PrincipalStressPipeline(Sy, keep_plane_states=0)
+    results = pipeline.process(np.asarray(tensors, dtype=float))
+    return {**{name: values.tolist() for name, values in results.items()}, 'summary': pipeline.get_summary()}
+
+
+def main():
+    """ Converts stress tensors (i.e, exported by a FEA program) into principal stresses, reporting
+        the governing point and, optionally, drawing the states in the failure theories diagram and
+        the Mohr's circles of the governing point.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units = input("Units (MPa, psi, ksi, etc.): ")
+    print("\nStress tensors, as sx, sy, sz, txy, tyz, tzx:")
+    option = Entry_Manager.get_menu_option("", "1. Type or paste them.\n2. Read them from a file (.npy, .csv, .txt).",
+                                           [1, 2], False)
+    Sy = Entry_Manager.get_simple_numerical_entry("Yield strength, Sy [" + units + "] (DF = no safety factors)",
+                                                  "float", '-', 0)
+    pipeline = PrincipalStressPipeline(Sy if Sy > 0 else None)
+
+    start = timer()
+    if option == 1:
+        tensors = Entry_Manager.get_array("Stress tensors", 6)
+        pipeline.process(tensors)
+    else:
+        filename = input("File with the tensors: ").strip()
+        first_column = Entry_Manager.get_simple_numerical_entry("Column of sx (DF = 0)", "int", '-', 0)
+        output = input("CSV file for the principal stresses of every tensor (DF = none): ").strip()
+        pipeline.process_file(filename, first_column, output or None)
+    elapsed = timer() - start
+
+    summary = pipeline.get_summary()
+    print("\nResults:\n")
+    print("\tTensors processed: " + str(summary['count']) + " in {:.4} s".format(elapsed))
+    if summary['count'] == 0:
+        return
+    for name, label in [('s1_max', 'Largest principal stress'), ('s3_min', 'Smallest principal stress'),
+                        ('von_mises_max', 'Largest von Mises stress'), ('tau_max', 'Largest shear stress')]:
+        extreme = summary[name]
+        print("\t" + label + " = {:.6g} ".format(extreme['value']) + units + " at tensor " + str(extreme['index']) +
+              " (s1, s2, s3 = " + ", ".join("{:.6g}".format(s) for s in extreme['principal_stresses']) + ")")
+    if 'safety_factor' in summary:
+        print("\tSafety factor by MSST = {:.4g}, by DET = {:.4g}".format(summary['safety_factor']['MSST'],
+                                                                          summary['safety_factor']['DET']))
+        print("\tFailing points by MSST = {}, by DET = {}".format(summary['failing_points']['MSST'],
+                                                                     summary['failing_points']['DET']))
+
+    if Entry_Manager.get_str_input("\nPlot Mohr's circles of the governing point?", ["y", "n"], "n") == "y":
+        plot_mohr_circles(*summary['von_mises_max']['principal_stresses'], units)
+    if pipeline.Sy is not None and \
+            Entry_Manager.get_str_input("Plot the states in the failure theories diagram?", ["y", "n"], "n") == "y":
+        from Mechanics.FailureTheoriesPlotter import FailureTheoriesPlotter
+        FailureTheoriesPlotter(pipeline.Sy, pipeline.plane_states, pipeline.Sy, pipeline.Sy, units, None).plot()
+        print("\nYour plot was saved inside the current directory. Go check it out!")
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from Mechanics.FatigueDesign import FatigueDesign, SURFACE_FINISH, LOADING
+from Mechanics.MaterialDefiner import Material
+from EntryManager import EntryManager
+from os.path import splitext
+from typing import Iterator, Tuple
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Default number of samples read from disk at once.
+CHUNK_SIZE = 1000000
+
+
+def read_history(filename: str, column: int = 0, chunk_size: int = CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """ Reads a load history from disk in chunks, so that its length is not limited by memory.
+
+    Args:
+        filename (str): .npy file (memory-mapped) or a text/csv file with one sample per row.
+        column (int, optional): Column of the text file which has the history. Defaults to 0.
+        chunk_size (int, optional): Number of samples per chunk. Defaults to CHUNK_SIZE.
+
+    Yields:
+        np.ndarray: Consecutive chunks of the history.
+    """
+    if splitext(filename)[1] == ".npy":
+        history = np.load(filename, mmap_mode='r')
+        for start in range(0, len(history), chunk_size):
+            yield np.asarray(history[start:start + chunk_size], dtype=float)
+    else:
+        import pandas as pd
+        reader = pd.read_csv(filename, sep=r'[,;\s]+', engine='python', header=None, usecols=[column],
+                             chunksize=chunk_size)
+        for chunk in reader:
+            yield chunk.iloc[:, 0].to_numpy(float)
+
+
+class RainflowCounter:
+    """ Streaming rainflow cycle counter (ASTM E1049-85, section 5.4.4) with Miner's rule damage.
+
+        The history is processed chunk by chunk in a single pass. Only the reversals that have not
+        closed a cycle yet are kept in a stack between chunks, so memory does not grow with the
+        length of the history. Counted cycles are binned by range and mean and, if a fatigue design
+        is given, their damage is accumulated as they are counted.
+    """
+
+    def __init__(self, range_bin_width: float, mean_bin_width: float = None, design: FatigueDesign = None,
+                 mean_stress_correction: bool = True) -> None:
+        """
+        Args:
+            range_bin_width (float): Width of the range bins.
+            mean_bin_width (float, optional): Width of the mean bins. Defaults to range_bin_width.
+            design (FatigueDesign, optional): S-N curve used to compute Miner's damage. The history
+                                              must be in its units. Defaults to None (no damage).
+            mean_stress_correction (bool, optional): True if amplitudes are corrected for the mean
+                                                     stress with the Goodman line,
+                                                     Sa_rev = Sa/(1 - Sm/Sut), before computing the
+                                                     life. Defaults to True.
+        """
+        self.range_bin_width = range_bin_width
+        self.mean_bin_width = mean_bin_width if mean_bin_width is not None else range_bin_width
+        self.design = design
+        self.mean_stress_correction = mean_stress_correction
+        self.damage = 0.0
+        self.number_of_samples = 0
+        self.number_of_cycles = 0.0
+        self.bins = dict()
+
+        # Reversals which have not closed a cycle yet.
+        self.stack = list()
+
+        # Last point of the history, which is not known to be a reversal until the next one arrives,
+        # and the direction (+1 or -1) of the history when it got there.
+        self.last_point = None
+        self.last_direction = 0
+
+    def extract_reversals(self, chunk: np.ndarray) -> np.ndarray:
+        """ Peaks and valleys of a chunk, taking into account the end of the previous chunk.
+
+        Args:
+            chunk (np.ndarray): Samples of the history.
+
+        Returns:
+            np.ndarray: Confirmed reversals, in order. The last point of the chunk is held back.
+        """
+        if self.last_point is not None:
+            chunk = np.concatenate(([self.last_point], chunk))
+
+        # Plateaus are collapsed into a single point.
+        keep = np.concatenate(([True], np.diff(chunk) != 0))
+        x = chunk[keep]
+        direction = np.sign(np.diff(x))
+        if len(direction) == 0:
+            self.last_point = x[-1]
+            return x[:0]
+
+        previous_direction = np.concatenate(([self.last_direction], direction[:-1]))
+        is_reversal = direction != previous_direction
+        self.last_point = x[-1]
+        self.last_direction = direction[-1]
+        return x[:-1][is_reversal]
+
+    def count(self, reversals: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Runs the rainflow stack over new reversals.
+
+        Args:
+            reversals (np.ndarray): Peaks and valleys, in order.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Ranges, means and counts (1 or 0.5) of the
+                                                       cycles closed by these reversals.
+        """
+        stack = self.stack
+        ranges, means, counts = list(), list(), list()
+        for point in reversals.tolist():
+            stack.append(point)
+            while len(stack) >= 3:
+                X = abs(stack[-1] - stack[-2])
+                Y = abs(stack[-2] - stack[-3])
+                if X < Y:
+                    break
+                ranges.append(Y)
+                means.append((stack[-2] + stack[-3])/2)
+                if len(stack) == 3:
+                    # Y contains the starting point: half cycle, and the start moves to the next point.
+                    counts.append(0.5)
+                    del stack[0]
+                else:
+                    counts.append(1.0)
+                    del stack[-3:-1]
+        return np.array(ranges), np.array(means), np.array(counts)
+
+    def accumulate(self, ranges: np.ndarray, means: np.ndarray, counts: np.ndarray) -> None:
+        """ Adds counted cycles to the bins and to the damage.
+        """
+        if len(counts) == 0:
+            return
+
+        self.number_of_cycles += counts.sum()
+        keys = np.stack((np.floor(ranges/self.range_bin_width), np.floor(means/self.mean_bin_width)), axis=1)
+        unique_keys, inverse = np.unique(keys.astype(np.int64), axis=0, return_inverse=True)
+        totals = np.bincount(inverse.ravel(), weights=counts)
+        for (i, j), total in zip(unique_keys.tolist(), totals.tolist()):
+            self.bins[(i, j)] = self.bins.get((i, j), 0) + total
+
+        if self.design is not None:
+            self.damage += float(np.sum(counts/self.get_life(ranges/2, means)))
+
+    def get_life(self, amplitudes: np.ndarray, means: np.ndarray) -> np.ndarray:
+        """ Cycles to failure of each cycle according to the S-N curve of the design.
+        """
+        if self.mean_stress_correction:
+            Sut = np.asarray(self.design.material.Sut)
+            with np.errstate(divide='ignore'):
+                amplitudes = np.where(means > 0, amplitudes/(1 - means/Sut), amplitudes)
+            # Cycles whose mean stress reaches Sut fail at once.
+            amplitudes = np.where(means >= Sut, np.inf, amplitudes)
+        return np.where(np.isinf(amplitudes), 1, self.design.get_life(amplitudes))
+
+    def process(self, chunk: np.ndarray) -> None:
+        """ Processes the next chunk of the history.
+        """
+        if len(chunk) == 0:
+            return
+        self.number_of_samples += len(chunk)
+        self.accumulate(*self.count(self.extract_reversals(np.asarray(chunk, dtype=float))))
+
+    def finish(self) -> None:
+        """ Ends the history: the last point is a reversal, and every range left in the stack is
+            counted as a half cycle (step 6 of the algorithm).
+        """
+        if self.last_point is not None:
+            self.accumulate(*self.count(np.array([self.last_point])))
+            self.last_point = None
+
+        residue = np.array(self.stack)
+        if len(residue) > 1:
+            self.accumulate(np.abs(np.diff(residue)), (residue[1:] + residue[:-1])/2, np.full(len(residue) - 1, 0.5))
+        self.stack = list()
+
+    def process_file(self, filename: str, column: int = 0, chunk_size: int = CHUNK_SIZE) -> None:
+        """ Processes a whole history stored on disk (see read_history) and finishes it.
+        """
+        for chunk in read_history(filename, column, chunk_size):
+            self.process(chunk)
+        self.finish()
+
+    def get_histogram(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Lower edge of the range bin, lower edge of the
+                                                       mean bin and number of cycles of every
+                                                       non-empty bin, sorted by range and mean.
+        """
+        keys = sorted(self.bins.keys())
+        ranges = np.array([i for i, _ in keys], dtype=float)*self.range_bin_width
+        means = np.array([j for _, j in keys], dtype=float)*self.mean_bin_width
+        return ranges, means, np.array([self.bins[key] for key in keys])
+
+    def get_results(self) -> str:
+        """
+        Returns:
+            str: String which contains a report with the cycle histogram and the damage.
+        """
+        s = "\nSamples processed: " + str(self.number_of_samples) + '\n'
+        s += "Cycles counted: " + str(self.number_of_cycles) + '\n'
+        s += "\n\t{:>14} {:>14} {:>12}\n".format("Range from", "Mean from", "Cycles")
+        for r, m, n in zip(*self.get_histogram()):
+            s += "\t{:>14.6g} {:>14.6g} {:>12g}\n".format(r, m, n)
+
+        if self.design is not None:
+            s += "\nMiner's rule damage: D = " + str(self.damage) + '\n'
+            if self.damage > 0:
+                s += "Number of repetitions of the history to failure: " + str(1/self.damage) + '\n'
+        return s
+
+
+def calculate(filename: str, range_bin_width: float, column: int = 0, Sut: float = None, Sy: float = None,
+              units: str = 'MPa', surface: str = "machined", loading: str = "bending") -> dict:
+    """ Non-interactive cycle counting of a load history stored on disk.
+
+    Args:
+        filename (str): File with the history (see read_history).
+        range_bin_width (float): Width of the range bins.
+        column (int, optional): Column of the history. Defaults to 0.
+        Sut (float, optional): Ultimate tensile strength. If given, Miner's damage is computed.
+        Sy (float, optional): Yield strength. Defaults to Sut.
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'MPa'.
+        surface (str, optional): Surface finish. Defaults to "machined".
+        loading (str, optional): bending, axial or torsion. Defaults to "bending".
+
+    Returns:
+        dict: Number of samples, cycles and the damage (None if Sut is not given).
+    """
+    design = None
+    if Sut is not None:
+        Sy = Sy if Sy is not None else Sut
+        design = FatigueDesign(Material(Sy, Sut, Sy, units), surface, loading=loading)
+
+    counter = RainflowCounter(range_bin_width, design=design)
+    counter.process_file(filename, column)
+    return {"samples": counter.number_of_samples, "cycles": float(counter.number_of_cycles),
+            "damage": counter.damage if design is not None else None}
+
+
+def main():
+    """ Counts the cycles of a load history stored on disk and computes its Miner's rule damage.
+    """
+    print("* Please, input valid data at all times! *\n")
+    filename = input("File with the history (.npy, .csv or .txt, one sample per row): ").strip()
+    column = Entry_Manager.get_simple_numerical_entry("Column of the history (DF = 0)", "int", '-', 0)
+    units = Entry_Manager.get_str_input("Units of the history", ["kpsi", "mpa"], "mpa")
+    units = 'kpsi' if units == 'kpsi' else 'MPa'
+    range_bin_width = Entry_Manager.get_simple_numerical_entry("Width of the range bins [" + units + "]", "float", '+')
+
+    design = None
+    if Entry_Manager.get_str_input("Compute Miner's rule damage?", ["y", "n"], "y") == "y":
+        print("\nMaterial properties:")
+        Sut = Entry_Manager.get_simple_numerical_entry("\tUltimate tensile strength, Sut [" + units + "]", "float", '+')
+        Sy = Entry_Manager.get_simple_numerical_entry("\tYield strength, Sy [" + units + "]", "float", '+')
+        surface = Entry_Manager.get_str_input("\tSurface finish", list(SURFACE_FINISH.keys()), "machined")
+        loading = Entry_Manager.get_str_input("\tLoading", list(LOADING.keys()), "bending")
+        design = FatigueDesign(Material(Sy, Sut, Sy, units), surface, loading=loading)
+
+    counter = RainflowCounter(range_bin_width, design=design)
+    print("\nCounting cycles...")
+    counter.process_file(filename, column)
+    print(counter.get_results())
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from Mechanics.FatigueDesign import FatigueDesign, SURFACE_FINISH, ArrayLike
+from Mechanics.MaterialDefiner import Material
+from Mechanics.raizdea import fatigue_stress_concentration_factor
+from os.path import splitext
+from typing import Union
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Fatigue failure criteria combined with the distortion energy theory (Section 7-4 of Shigley's).
+CRITERIA = ["goodman", "gerber", "asme-elliptic"]
+
+# Factor from the units of the moments to those of stress*length^3: kip*in -> kpsi*in^3 and
+# N*m -> MPa*mm^3 (N*mm).
+MOMENT_FACTOR = {'kpsi': 1, 'MPa': 1e3}
+
+# Relative tolerance of the diameter, and maximum number of iterations.
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 100
+
+# Columns of a sections spreadsheet. Optional columns take the default value if missing. Each row is
+# a section under a load case.
+SECTION_COLUMNS = {"section": None, "Sy": None, "Sut": None, "Ma": 0, "Mm": 0, "Ta": 0, "Tm": 0, "Kt": 1,
+                   "Kts": 1, "r_d": 0.02, "surface": "machined", "T": None, "reliability": 0.5, "kf": 1,
+                   "n": 1.5, "d": None}
+
+
+def get_amplitudes(Ma: ArrayLike, Mm: ArrayLike, Ta: ArrayLike, Tm: ArrayLike, Kf: ArrayLike, Kfs: ArrayLike):
+    """ A = (4*(Kf*Ma)^2 + 3*(Kfs*Ta)^2)^(1/2) and B = (4*(Kf*Mm)^2 + 3*(Kfs*Tm)^2)^(1/2), the von Mises
+        combinations of the alternating and mean moments.
+    """
+    A = np.sqrt(4*(Kf*Ma)**2 + 3*(Kfs*Ta)**2)
+    B = np.sqrt(4*(Kf*Mm)**2 + 3*(Kfs*Tm)**2)
+    return A, B
+
+
+def get_required_diameter(criterion: str, A: ArrayLike, B: ArrayLike, Se: ArrayLike, Sut: ArrayLike,
+                          Sy: ArrayLike, n: ArrayLike) -> ArrayLike:
+    """ Diameter of a shaft for a design factor n (Eqs. 7-8, 7-12 and 7-16 of Shigley's).
+
+    DE-Goodman:        d = (16n/pi*(A/Se + B/Sut))^(1/3)
+    DE-Gerber:         d = (8nA/(pi*Se)*(1 + (1 + (2B*Se/(A*Sut))^2)^(1/2)))^(1/3)
+    DE-ASME elliptic:  d = (16n/pi*((A/Se)^2 + (B/Sy)^2)^(1/2))^(1/3)
+
+    Args:
+        criterion (str): goodman, gerber or asme-elliptic.
+        A, B (ArrayLike): Combined alternating and mean moments (see get_amplitudes).
+        Se, Sut, Sy (ArrayLike): Endurance limit, ultimate tensile strength and yield strength.
+        n (ArrayLike): Design factor.
+
+    Returns:
+        ArrayLike: d.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if criterion == "goodman":
+            return np.cbrt(16*n/np.pi*(A/Se + B/Sut))
+        elif criterion == "gerber":
+            gerber = np.cbrt(8*n*A/(np.pi*Se)*(1 + np.sqrt(1 + (2*B*Se/(A*Sut))**2)))
+            return np.where(A == 0, np.cbrt(16*n/np.pi*B/Sut), gerber)
+        elif criterion == "asme-elliptic":
+            return np.cbrt(16*n/np.pi*np.sqrt((A/Se)**2 + (B/Sy)**2))
+    raise ValueError("Unknown fatigue failure criterion: " + criterion)
+
+
+def get_safety_factor(criterion: str, d: ArrayLike, A: ArrayLike, B: ArrayLike, Se: ArrayLike, Sut: ArrayLike,
+                      Sy: ArrayLike) -> ArrayLike:
+    """ Fatigue safety factor of a shaft of diameter d, i.e, the inverse of get_required_diameter.
+        Infinite for unloaded sections.
+    """
+    with np.errstate(divide='ignore'):
+        return (d/get_required_diameter(criterion, A, B, Se, Sut, Sy, 1))**3
+
+
+class ShaftDesign:
+    """ Diameter of a rotating shaft at its critical sections by the DE-Goodman, DE-Gerber and
+        DE-ASME elliptic criteria. The endurance limit depends on the diameter through the size
+        factor kb, and the fatigue stress-concentration factors through the notch radius, which is
+        proportional to the diameter (r/d), so the diameter is found by fixed-point iteration. Every
+        section (or load case) is iterated at once. Unloaded sections need no diameter (d = 0).
+
+        Moments are in kip*in (kpsi, diameters in in) or N*m (MPa, diameters in mm).
+        Refer to Chapter 7-4 of Shigley's Mechanical Engineering Design.
+    """
+
+    def __init__(self, Sut: ArrayLike, Sy: ArrayLike, Ma: ArrayLike = 0, Mm: ArrayLike = 0, Ta: ArrayLike = 0,
+                 Tm: ArrayLike = 0, Kt: ArrayLike = 1, Kts: ArrayLike = 1, r_d: ArrayLike = 0.02,
+                 surface: Union[str, np.ndarray] = "machined", T: ArrayLike = np.nan, reliability: ArrayLike = 0.5,
+                 kf: ArrayLike = 1, n: ArrayLike = 1.5, units: str = 'kpsi') -> None:
+        """
+        Args:
+            Sut (ArrayLike): Ultimate tensile strength.
+            Sy (ArrayLike): Yield strength.
+            Ma, Mm (ArrayLike, optional): Alternating and mean bending moments. Default to 0.
+            Ta, Tm (ArrayLike, optional): Alternating and mean torques. Default to 0.
+            Kt, Kts (ArrayLike, optional): Theoretical stress-concentration factors in bending and
+                                           torsion. Default to 1.
+            r_d (ArrayLike, optional): Notch radius/diameter. Defaults to 0.02 (sharp shoulder fillet).
+            surface (Union[str, np.ndarray], optional): Surface finish. Defaults to "machined".
+            T (ArrayLike, optional): Operating temperature [°F or °C]. Defaults to NaN, i.e, kd = 1.
+            reliability (ArrayLike, optional): Defaults to 0.5, i.e, ke = 1.
+            kf (ArrayLike, optional): Miscellaneous-effects factor. Defaults to 1.
+            n (ArrayLike, optional): Design factor. Defaults to 1.5.
+            units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+        """
+        self.units = units
+        self.material = Material(np.asarray(Sy, dtype=float), np.asarray(Sut, dtype=float), np.nan, units)
+        factor = MOMENT_FACTOR[units]
+        self.Ma, self.Mm, self.Ta, self.Tm = (factor*np.asarray(M, dtype=float) for M in (Ma, Mm, Ta, Tm))
+        self.Kt, self.Kts, self.r_d = (np.asarray(value, dtype=float) for value in (Kt, Kts, r_d))
+        self.surface, self.T, self.reliability, self.kf = surface, T, reliability, kf
+        self.n = np.asarray(n, dtype=float)
+        self.shape = np.broadcast_shapes(*(np.shape(value) for value in (Sut, Sy, Ma, Mm, Ta, Tm, Kt, Kts, r_d,
+                                                                        surface, T, reliability, kf, n)))
+        # Sections without moments, whose size factor and fatigue stress-concentration factors are
+        # not evaluated (kb = 1, Kf = Kt, Kfs = Kts).
+        self.unloaded = np.broadcast_to((self.Ma == 0) & (self.Mm == 0) & (self.Ta == 0) & (self.Tm == 0), self.shape)
+
+    def evaluate(self, d: ArrayLike) -> dict:
+        """ Endurance limit, fatigue stress-concentration factors and combined moments for a diameter.
+
+        Args:
+            d (ArrayLike): Diameter.
+
+        Returns:
+            dict: Se, Kf, Kfs, A and B.
+        """
+        d = np.where(self.unloaded, np.nan, d)
+        design = FatigueDesign(self.material, self.surface, d, "bending", self.T, self.reliability, self.kf)
+        r = self.r_d*d
+        Kf = np.where(self.unloaded, self.Kt,
+                      fatigue_stress_concentration_factor(self.Kt, self.material.Sut, r, "bending", self.units))
+        Kfs = np.where(self.unloaded, self.Kts,
+                       fatigue_stress_concentration_factor(self.Kts, self.material.Sut, r, "torsion", self.units))
+        A, B = get_amplitudes(self.Ma, self.Mm, self.Ta, self.Tm, Kf, Kfs)
+        return {"Se": np.broadcast_to(design.Se, self.shape), "Kf": Kf, "Kfs": Kfs, "A": A, "B": B,
+                "kb": np.broadcast_to(design.kb, self.shape)}
+
+    def solve(self, criterion: str = "goodman", tolerance: float = TOLERANCE, max_iterations: int = MAX_ITERATIONS) -> dict:
+        """ Iterates the diameter of every section until it is consistent with its own size factor and
+            fatigue stress-concentration factors. The first guess uses kb = 1 and Kf = Kt.
+
+        Args:
+            criterion (str, optional): goodman, gerber or asme-elliptic. Defaults to "goodman".
+            tolerance (float, optional): Relative tolerance of the diameter. Defaults to TOLERANCE.
+            max_iterations (int, optional): Maximum number of iterations. Defaults to MAX_ITERATIONS.
+
+        Returns:
+            dict: Diameter d, Se, kb, Kf, Kfs, the first-cycle yield safety factor with that diameter,
+                  the number of iterations and whether every section converged.
+        """
+        Sut, Sy = self.material.Sut, self.material.Sy
+        Se = FatigueDesign(self.material, self.surface, np.nan, "bending", self.T, self.reliability, self.kf).Se
+        A, B = get_amplitudes(self.Ma, self.Mm, self.Ta, self.Tm, self.Kt, self.Kts)
+        d = np.broadcast_to(get_required_diameter(criterion, A, B, Se, Sut, Sy, self.n), self.shape)
+
+        converged = False
+        for iteration in range(1, max_iterations + 1):
+            state = self.evaluate(d)
+            d_next = get_required_diameter(criterion, state["A"], state["B"], state["Se"], Sut, Sy, self.n)
+            converged = bool(np.all(np.abs(d_next - d) <= tolerance*np.abs(d_next)))
+            d = d_next
+            if converged:
+                break
+
+        state = self.evaluate(d)
+        return {"d": d, **state, "ny": self.get_yield_safety_factor(d, state["Kf"], state["Kfs"]),
+                "iterations": iteration, "converged": converged}
+
+    def get_yield_safety_factor(self, d: ArrayLike, Kf: ArrayLike, Kfs: ArrayLike) -> ArrayLike:
+        """ First-cycle yield safety factor, ny = Sy/sigma'_max, with the von Mises maximum stress
+            sigma'_max = ((32*Kf*(Mm + Ma)/(pi*d^3))^2 + 3*(16*Kfs*(Tm + Ta)/(pi*d^3))^2)^(1/2) (Eq. 7-15).
+            Infinite for unloaded sections.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = 32*Kf*(self.Mm + self.Ma)/(np.pi*d**3)
+            tau = 16*Kfs*(self.Tm + self.Ta)/(np.pi*d**3)
+            return np.where(self.unloaded, np.inf, self.material.Sy/np.sqrt(sigma**2 + 3*tau**2))
+
+    def check(self, d: ArrayLike, criterion: str = "goodman") -> dict:
+        """ Safety factors of existing diameters.
+
+        Args:
+            d (ArrayLike): Diameter of every section.
+            criterion (str, optional): goodman, gerber or asme-elliptic. Defaults to "goodman".
+
+        Returns:
+            dict: Fatigue (nf) and first-cycle yield (ny) safety factors, Se, kb, Kf and Kfs.
+        """
+        d = np.asarray(d, dtype=float)
+        state = self.evaluate(d)
+        return {"nf": get_safety_factor(criterion, d, state["A"], state["B"], state["Se"], self.material.Sut,
+                                        self.material.Sy),
+                "ny": self.get_yield_safety_factor(d, state["Kf"], state["Kfs"]), **state}
+
+
+def get_governing(d_required: np.ndarray, d: np.ndarray = None) -> int:
+    """
+    Args:
+        d_required (np.ndarray): Required diameter of every section.
+        d (np.ndarray, optional): Actual diameter of every section (NaN if unknown). Defaults to None.
+
+    Returns:
+        int: Governing section: the one whose actual diameter is smallest relative to the required one,
+             or the one which requires the largest diameter, if actual diameters are not known.
+    """
+    if d is not None and not np.all(np.isnan(d)):
+        return int(np.nanargmax(d_required/d))
+    return int(np.argmax(d_required))
+
+
+def evaluate_sections(filename: str, units: str, output: str = None):
+    """ Sizes every section of a spreadsheet at once by every criterion. Each row is a section under a
+        load case, with the columns of SECTION_COLUMNS (missing optional columns take their default
+        values). If a diameter d is given, its safety factors are also computed.
+
+    Args:
+        filename (str): xlsx, xls, csv or txt file.
+        units (str): 'kpsi' or 'MPa'.
+        output (str, optional): If given, results are written to this file (xlsx or csv).
+
+    Returns:
+        Tuple[pandas.DataFrame, dict]: Sections with the required diameter, Se, Kf, Kfs and the safety
+                                       factors of every criterion appended, and the governing row of
+                                       every criterion.
+    """
+    import pandas as pd
+    if splitext(filename)[1] in [".xlsx", ".xls"]:
+        df = pd.read_excel(filename)
+    else:
+        df = pd.read_csv(filename, sep=None, engine='python')
+
+    for column, default in SECTION_COLUMNS.items():
+        if column not in df.columns:
+            if default is None and column not in ["section", "d", "T"]:
+                raise KeyError("Column " + column + " is missing in " + filename)
+            df[column] = (np.arange(len(df)) if column == "section" else np.nan) if default is None else default
+
+    shaft = ShaftDesign(*(df[name].to_numpy(float) for name in ["Sut", "Sy", "Ma", "Mm", "Ta", "Tm", "Kt", "Kts", "r_d"]),
+                        df["surface"].to_numpy(str), df["T"].to_numpy(float), df["reliability"].to_numpy(float),
+                        df["kf"].to_numpy(float), df["n"].to_numpy(float), units)
+    d = df["d"].to_numpy(float)
+    governing = dict()
+    for criterion in CRITERIA:
+        result = shaft.solve(criterion)
+        df["d_" + criterion] = result["d"]
+        df["ny_" + criterion] = result["ny"]
+        if criterion == CRITERIA[0]:
+            for name in ["Se", "kb", "Kf", "Kfs"]:
+                df[name] = result[name]
+        if not np.all(np.isnan(d)):
+            df["nf_" + criterion] = shaft.check(d, criterion)["nf"]
+        governing[criterion] = get_governing(result["d"], d)
+
+    if output is not None:
+        if splitext(output)[1] in [".xlsx", ".xls"]:
+            df.to_excel(output, index=False)
+        else:
+            df.to_csv(output, index=False)
+
+    return df, governing
+
+
+def calculate(Sut: float, Sy: float, Ma: float = 0, Mm: float = 0, Ta: float = 0, Tm: float = 0, Kt: float = 1,
+              Kts: float = 1, r_d: float = 0.02, units: str = 'kpsi', surface: str = "machined", T: float = np.nan,
+              reliability: float = 0.5, kf: float = 1, n: float = 1.5, d: float = None) -> dict:
+    """ Non-interactive sizing of a shaft section by every criterion.
+
+    Args:
+        Sut (float): Ultimate tensile strength.
+        Sy (float): Yield strength.
+        Ma, Mm, Ta, Tm, Kt, Kts, r_d, surface, T, reliability, kf, n: See ShaftDesign.
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+        d (float, optional): Actual diameter, whose safety factors are also computed. Defaults to None.
+
+    Returns:
+        dict: Required diameter, Se, Kf, Kfs and yield safety factor by every criterion (and the fatigue
+              safety factors of d).
+    """
+    shaft = ShaftDesign(Sut, Sy, Ma, Mm, Ta, Tm, Kt, Kts, r_d, surface, T, reliability, kf, n, units)
+    result = dict()
+    for criterion in CRITERIA:
+        solution = shaft.solve(criterion)
+        result[criterion] = {name: float(solution[name]) for name in ["d", "Se", "kb", "Kf", "Kfs", "ny"]}
+        result[criterion]["iterations"] = solution["iterations"]
+        if d is not None:
+            result[criterion]["nf"] = float(shaft.check(d, criterion)["nf"])
+    return result
+
+
+def main():
+    """ Sizes a shaft section, or every section of a spreadsheet, by the DE-Goodman, DE-Gerber and
+        DE-ASME elliptic criteria.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units = Entry_Manager.get_str_input("Units", ["kpsi", "mpa"], "kpsi")
+    units = 'kpsi' if units == 'kpsi' else 'MPa'
+    length, moment = ("in", "kip*in") if units == 'kpsi' else ("mm", "N*m")
+    title = "Please select one of the following options:"
+    options = "\t1. I want to input a single section manually.\n\t2. I have a spreadsheet with sections and load cases."
+    option = Entry_Manager.get_menu_option(title, options, [1, 2])
+
+    if option == 2:
+        print("\nColumns: " + ", ".join(SECTION_COLUMNS.keys()) + " (moments in " + moment + ", d in " + length + ")")
+        filename = input("Spreadsheet file: ").strip()
+        output = input("Output file (DF = shaft_results.csv): ").strip() or "shaft_results.csv"
+        df, governing = evaluate_sections(filename, units, output)
+        print("\n" + str(len(df)) + " sections evaluated. Results were saved in " + output + "\n")
+        print("Governing sections:\n")
+        for criterion, row in governing.items():
+            print("\tDE-" + criterion.capitalize() + ": section " + str(df["section"].iloc[row]) + " (row " + str(row) +
+                  "), d = {:.4f} ".format(df["d_" + criterion].iloc[row]) + length)
+        return
+
+    print("\nMaterial properties:")
+    Sut = Entry_Manager.get_simple_numerical_entry("\tUltimate tensile strength, Sut [" + units + "]", "float", '+')
+    Sy = Entry_Manager.get_simple_numerical_entry("\tYield strength, Sy [" + units + "]", "float", '+')
+    print("\nLoads [" + moment + "]:")
+    print("* Press enter if DF, i.e, default value, is to be used. *\n")
+    Ma = Entry_Manager.get_simple_numerical_entry("\tAlternating bending moment, Ma (DF = 0)", "float", '-', 0)
+    Mm = Entry_Manager.get_simple_numerical_entry("\tMean bending moment, Mm (DF = 0)", "float", '-', 0)
+    Ta = Entry_Manager.get_simple_numerical_entry("\tAlternating torque, Ta (DF = 0)", "float", '-', 0)
+    Tm = Entry_Manager.get_simple_numerical_entry("\tMean torque, Tm (DF = 0)", "float", '-', 0)
+    print("\nStress concentration and Marin factors:")
+    Kt = Entry_Manager.get_simple_numerical_entry("\tKt (DF = 1)", "float", '+', 1)
+    Kts = Entry_Manager.get_simple_numerical_entry("\tKts (DF = 1)", "float", '+', 1)
+    r_d = Entry_Manager.get_simple_numerical_entry("\tNotch radius/diameter, r/d (DF = 0.02)", "float", '+', 0.02)
+    surface = Entry_Manager.get_str_input("\tSurface finish", list(SURFACE_FINISH.keys()), "machined")
+    reliability = Entry_Manager.get_simple_numerical_entry("\tReliability (DF = 0.5)", "float", '+', 0.5)
+    n = Entry_Manager.get_simple_numerical_entry("\tDesign factor, n (DF = 1.5)", "float", '+', 1.5)
+
+    result = calculate(Sut, Sy, Ma, Mm, Ta, Tm, Kt, Kts, r_d, units, surface, np.nan, reliability, 1, n)
+    print("\nResults:\n")
+    for criterion, solution in result.items():
+        print("\tDE-" + criterion.capitalize() + ": d = {:.4f} ".format(solution["d"]) + length +
+              " (Se = {:.4g} ".format(solution["Se"]) + units + ", kb = {:.4f}, Kf = {:.4f}, Kfs = {:.4f}, ny = {:.3f}, "
+              "{} iterations)".format(solution["kb"], solution["Kf"], solution["Kfs"], solution["ny"],
+                                      solution["iterations"]))
@@ -8,17 +8,9 @@ from os.path import basename, isfile, splitext
 from os import getcwd, listdir
 from ExceptionHandling import exceptions
 from EntryManager import EntryManager
+from Mechanics.plotting import get_pyplot
 from typing import List, Tuple, Union
-from adjustText import adjust_text
-from matplotlib import rcParams
-import matplotlib.pyplot as plt
-import pandas as pd
-import numpy as np
 
-rcParams['font.family'] = "cmr10"
-rcParams['axes.unicode_minus'] = False
-rcParams.update({'font.size': 13})
-    
 # Entry manager. Required to handle user input.
 Entry_Manager = EntryManager(__file__)
 
@@ -50,6 +42,7 @@ class ShearAndMomentsPlotter:
     def plot(self):
         """ Plots the diagram of failure theories.
         """
+        plt = get_pyplot()
         color = 'k'
         plt.figure(figsize=(8, 6), dpi=80)
         for eqn in self.equations:        
@@ -65,8 +58,8 @@ class ShearAndMomentsPlotter:
         # plt.yticks(yticks)
         plt.xlabel('x [' + self.units_x + ']')
         plt.ylabel('F [' + self.units_f + ']')
-        plt.grid(b=True, which='major', color='k', linestyle='-', alpha=0.2)
-        plt.grid(b=True, which='minor', color='k', linestyle='--', alpha=0.1)
+        plt.grid(visible=True, which='major', color='k', linestyle='-', alpha=0.2)
+        plt.grid(visible=True, which='minor', color='k', linestyle='--', alpha=0.1)
         plt.minorticks_on()
         plt.savefig('Grafica.jpg', dpi=1200)
         plt.show()
@@ -81,7 +74,7 @@ class ShearAndMomentsPlotter:
         print("")
         n = Entry_Manager.get_simple_numerical_entry("Number of forces", "int", '+', __file__)
         print("")
-        print("Separate each value by a comma (,) and a space, i.e, 24.52, 3.4: ")
+        print("Separate each value by a comma, semicolon or space, i.e, 24.52, 3.4 (or type @<file> to read every row from a file): ")
         forces = Entry_Manager.get_list_of_tuples("Position and magnitude of force", n, "float")
         return forces
 
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Theoretical stress-concentration factors, Kt, of common geometries from digitized charts.
+
+Charts of round shafts with a shoulder fillet or a groove are stored as power-law fits, Kt = A*(r/d)^b,
+at each tabulated D/d (Appendix C of Norton's Machine Design, after Peterson). Since log(Kt) is linear in
+log(r/d), every chart is interpolated by a bivariate spline of log(Kt) over (log(D/d - 1), log(r/d)),
+whose coefficients are computed once per chart and cached, so that Kt (and Kf) of any number of
+geometries is found in a single vectorized evaluation.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+from EntryManager import EntryManager
+from ExceptionHandling import exceptions
+from Mechanics.raizdea import ArrayLike, fatigue_stress_concentration_factor
+from Memoization import memoize
+from os.path import basename
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Coefficients (A, b) of Kt = A*(r/d)^b by geometry, loading and D/d.
+CHARTS = {"shoulder": {"bending": {2.00: (0.90879, -0.28598), 1.50: (0.93836, -0.25759), 1.30: (0.95120, -0.23757),
+                                   1.20: (0.97098, -0.21796), 1.15: (0.98137, -0.18381), 1.12: (0.98061, -0.18139),
+                                   1.10: (0.98450, -0.16529), 1.07: (0.98561, -0.15285), 1.05: (0.98316, -0.13240),
+                                   1.03: (0.98236, -0.10486), 1.02: (0.96543, -0.08784), 1.01: (0.91982, -0.04903)},
+                       "axial": {2.00: (1.01470, -0.30035), 1.50: (0.99957, -0.28221), 1.30: (0.99682, -0.25751),
+                                 1.20: (0.96272, -0.25527), 1.15: (0.98084, -0.22485), 1.10: (0.98450, -0.20818),
+                                 1.07: (0.98498, -0.19548), 1.05: (1.00480, -0.17076), 1.02: (1.01220, -0.12474),
+                                 1.01: (0.98413, -0.10474)},
+                       "torsion": {2.00: (0.86331, -0.23865), 1.33: (0.84897, -0.23161), 1.20: (0.83425, -0.21649),
+                                   1.09: (0.90337, -0.12692)}},
+          "groove": {"bending": {2.00: (0.93619, -0.33066), 1.50: (0.93894, -0.32380), 1.30: (0.94299, -0.31880),
+                                 1.20: (0.94681, -0.31071), 1.15: (0.95311, -0.30194), 1.12: (0.95340, -0.29750),
+                                 1.10: (0.95441, -0.29206), 1.07: (0.96477, -0.27544), 1.05: (0.97369, -0.25750),
+                                 1.03: (0.98568, -0.22597), 1.02: (0.99183, -0.20113), 1.01: (1.00200, -0.14963)},
+                     "axial": {2.00: (0.99383, -0.38231), 1.50: (0.99808, -0.36955), 1.30: (1.00490, -0.35545),
+                               1.20: (1.01070, -0.33765), 1.15: (1.02040, -0.32032), 1.10: (1.02900, -0.29937),
+                               1.07: (1.03890, -0.28289), 1.05: (1.04710, -0.26151), 1.03: (1.06060, -0.23011),
+                               1.02: (1.07460, -0.20125), 1.01: (1.09920, -0.13226)},
+                     "torsion": {2.00: (0.89246, -0.24821), 1.30: (0.89770, -0.24619), 1.20: (0.89981, -0.24424),
+                                 1.10: (0.90230, -0.23886), 1.05: (0.90581, -0.23200), 1.02: (0.91226, -0.21771),
+                                 1.01: (0.92187, -0.20057)}}}
+
+# Coefficients of Kt of a finite-width plate with a central hole under axial load, as a cubic polynomial
+# of d/w from the constant term up (Heywood's fit, nominal stress on the net section).
+HOLE_COEFFICIENTS = (3, -3.14, 3.667, -1.527)
+
+# Geometries and their loadings.
+GEOMETRIES = {**{geometry: list(charts.keys()) for geometry, charts in CHARTS.items()}, "hole": ["axial"]}
+
+# Range of r/d covered by the charts (d/w for a hole). Ratios outside of it are clipped.
+RATIO_RANGE = {"shoulder": (0.01, 0.3), "groove": (0.01, 0.3), "hole": (0, 0.65)}
+
+# Number of r/d at which the charts are sampled to fit their splines.
+SAMPLES = 16
+
+
+@memoize()
+def get_chart_spline(geometry: str, loading: str):
+    """ Bivariate spline of log(Kt) over (log(D/d - 1), log(r/d)) of a chart. It is cubic in D/d where
+        the chart has enough curves, and linear in r/d, where it is exact.
+
+    Args:
+        geometry (str): shoulder or groove.
+        loading (str): bending, axial or torsion.
+
+    Returns:
+        scipy.interpolate.RectBivariateSpline: Spline of the chart.
+    """
+    from scipy.interpolate import RectBivariateSpline
+    D_d = np.array(sorted(CHARTS[geometry][loading].keys()))
+    A, b = np.array([CHARTS[geometry][loading][ratio] for ratio in D_d]).T
+    v = np.linspace(*np.log(RATIO_RANGE[geometry]), SAMPLES)
+    log_Kt = np.log(A)[:, None] + b[:, None]*v[None, :]
+    return RectBivariateSpline(np.log(D_d - 1), v, log_Kt, kx=min(3, len(D_d) - 1), ky=1)
+
+
+def get_stress_concentration_factor(geometry: str, loading: str, r_d: ArrayLike, D_d: ArrayLike = None) -> ArrayLike:
+    """ Kt of any number of geometries of the same kind. D/d and r/d outside of the chart are clipped
+        to it, and Kt is never less than 1.
+
+    Args:
+        geometry (str): shoulder, groove or hole.
+        loading (str): bending, axial or torsion (Kts).
+        r_d (ArrayLike): Notch radius/minor diameter, r/d. For a hole, hole diameter/plate width, d/w.
+        D_d (ArrayLike, optional): Major diameter/minor diameter, D/d. Not used for a hole.
+
+    Returns:
+        ArrayLike: Kt, with the broadcast shape of r_d and D_d.
+
+    Raises:
+        InvalidEntryError: If there is no chart of the geometry under the loading.
+    """
+    if loading not in GEOMETRIES.get(geometry, []):
+        raise exceptions.InvalidEntryError("There is no chart of a " + geometry + " under " + loading + " loading",
+                                           basename(__file__))
+
+    ratio = np.clip(np.asarray(r_d, dtype=float), *RATIO_RANGE[geometry])
+    if geometry == "hole":
+        c0, c1, c2, c3 = HOLE_COEFFICIENTS
+        return c0 + ratio*(c1 + ratio*(c2 + ratio*c3))
+
+    u = np.log(np.clip(np.asarray(D_d, dtype=float) - 1, min(CHARTS[geometry][loading]) - 1,
+                       max(CHARTS[geometry][loading]) - 1))
+    u, v = np.broadcast_arrays(u, np.log(ratio))
+    log_Kt = get_chart_spline(geometry, loading)(u.ravel(), v.ravel(), grid=False).reshape(u.shape)
+    return np.maximum(np.exp(log_Kt), 1)
+
+
+def get_fatigue_factor(geometry: str, loading: str, Sut: ArrayLike, r: ArrayLike, d: ArrayLike, D: ArrayLike = None,
+                       units: str = 'kpsi') -> ArrayLike:
+    """ Kf (or Kfs) of any number of geometries, from Kt of the chart and the notch sensitivity.
+
+    Args:
+        geometry (str): shoulder, groove or hole.
+        loading (str): bending, axial or torsion.
+        Sut (ArrayLike): Ultimate tensile strength.
+        r (ArrayLike): Notch radius [in if units is 'kpsi', mm otherwise]. Hole radius for a hole.
+        d (ArrayLike): Minor diameter. Plate width for a hole.
+        D (ArrayLike, optional): Major diameter. Not used for a hole.
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+
+    Returns:
+        ArrayLike: Kf.
+
+    Raises:
+        InvalidEntryError: If D is not given for a shoulder or a groove, or there is no chart of the
+                           geometry under the loading.
+    """
+    if geometry != "hole" and D is None:
+        raise exceptions.InvalidEntryError("D is required for a " + geometry, basename(__file__))
+    r, d = np.asarray(r, dtype=float), np.asarray(d, dtype=float)
+    if geometry == "hole":
+        Kt = get_stress_concentration_factor(geometry, loading, 2*r/d)
+    else:
+        Kt = get_stress_concentration_factor(geometry, loading, r/d, np.asarray(D, dtype=float)/d)
+    return fatigue_stress_concentration_factor(Kt, Sut, r, loading, units)
+
+
+def calculate(geometry: str, loading: str, r: float, d: float, D: float = None, Sut: float = None,
+              units: str = 'kpsi') -> dict:
+    """ Non-interactive calculation of Kt, and of Kf if Sut is given.
+
+    Args:
+        geometry (str): shoulder, groove or hole.
+        loading (str): bending, axial or torsion.
+        r (float): Notch radius (hole radius for a hole).
+        d (float): Minor diameter (plate width for a hole).
+        D (float, optional): Major diameter. Not used for a hole.
+        Sut (float, optional): Ultimate tensile strength. Defaults to None.
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+
+    Returns:
+        dict: Kt and, if Sut is given, Kf.
+
+    Raises:
+        InvalidEntryError: If D is not given for a shoulder or a groove, or there is no chart of the
+                           geometry under the loading.
+    """
+    if geometry != "hole" and D is None:
+        raise exceptions.InvalidEntryError("D is required for a " + geometry, basename(__file__))
+    if geometry == "hole":
+        result = {"Kt": float(get_stress_concentration_factor(geometry, loading, 2*r/d))}
+    else:
+        result = {"Kt": float(get_stress_concentration_factor(geometry, loading, r/d, D/d))}
+    if Sut is not None:
+        result["Kf"] = float(get_fatigue_factor(geometry, loading, Sut, r, d, D, units))
+    return result
+
+
+def ask_stress_concentration_factor(loading: str, length: str) -> tuple:
+    """ Asks for a geometry and its dimensions, and looks Kt up in its chart.
+
+    Args:
+        loading (str): bending, axial or torsion.
+        length (str): Units of length.
+
+    Returns:
+        tuple: Kt and the notch radius (hole radius for a hole).
+    """
+    geometries = [geometry for geometry, loadings in GEOMETRIES.items() if loading in loadings]
+    geometry = Entry_Manager.get_str_input("Geometry", geometries, geometries[0])
+    if geometry == "hole":
+        r = Entry_Manager.get_simple_numerical_entry("Hole radius, r [" + length + "]", "float", '+')
+        w = Entry_Manager.get_simple_numerical_entry("Plate width, w [" + length + "]", "float", '+')
+        return calculate(geometry, loading, r, w)["Kt"], r
+
+    r = Entry_Manager.get_simple_numerical_entry("Notch radius, r [" + length + "]", "float", '+')
+    d = Entry_Manager.get_simple_numerical_entry("Minor diameter, d [" + length + "]", "float", '+')
+    D = Entry_Manager.get_simple_numerical_entry("Major diameter, D [" + length + "]", "float", '+')
+    return calculate(geometry, loading, r, d, D)["Kt"], r
+
+
+def main():
+    """ Looks Kt of a geometry up in its chart, and computes Kf.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units = Entry_Manager.get_str_input("Units", ["kpsi", "mpa"], "kpsi")
+    units = 'kpsi' if units == 'kpsi' else 'MPa'
+    length = "in" if units == 'kpsi' else "mm"
+    loading = Entry_Manager.get_str_input("Loading", ["bending", "axial", "torsion"], "bending")
+    Kt, r = ask_stress_concentration_factor(loading, length)
+    Sut = Entry_Manager.get_simple_numerical_entry("Ultimate tensile strength, Sut [" + units + "]", "float", '+')
+
+    name = "Kts" if loading == "torsion" else "Kt"
+    print("\nResults:\n")
+    print("\t" + name + " = {:.4f}".format(Kt))
+    print("\t" + name.replace("t", "f") + " = {:.4f}".format(float(fatigue_stress_concentration_factor(
+        Kt, Sut, r, loading, units))))
+
+
+if __name__ == "__main__":
+    main()
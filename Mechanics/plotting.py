@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+
+# matplotlib.pyplot, imported and styled the first time a plot is produced.
+_PYPLOT = None
+
+
+def get_pyplot():
+    """ Imports matplotlib.pyplot and sets the font of the plots. matplotlib is slow to import, so
+        this is only done when a plot is actually produced, and only once.
+
+    Returns:
+        module: matplotlib.pyplot.
+    """
+    global _PYPLOT
+    if _PYPLOT is None:
+        from matplotlib import rcParams
+        import matplotlib.pyplot as plt
+
+        rcParams['font.family'] = "cmr10"
+        rcParams['axes.unicode_minus'] = False
+        rcParams.update({'font.size': 13})
+        _PYPLOT = plt
+    return _PYPLOT
@@ -1,27 +1,132 @@
 # -*- coding: utf-8 -*-
 """
+Notch sensitivity, q, and fatigue stress-concentration factors, Kf and Kfs, from the Neuber constant.
+
 Created on Mon Mar 23 12:35:58 2020
 
 @author: Camilo Martínez
 """
-import math
+from EntryManager import EntryManager
+from typing import Union
+import numpy as np
+
+# Entry manager. Required to handle user input.
+Entry_Manager = EntryManager(__file__)
+
+# Array-like of floats (or a single float).
+ArrayLike = Union[float, np.ndarray]
+
+# Coefficients of the Neuber constant, sqrt(a) [in^(1/2)], as a cubic polynomial of Sut [kpsi]
+# (Eqs. 6-35a and 6-35b of Shigley's Mechanical Engineering Design), from the constant term up.
+NEUBER_COEFFICIENTS = {"bending": (0.246, -3.08e-3, 1.51e-5, -2.67e-8),
+                       "axial": (0.246, -3.08e-3, 1.51e-5, -2.67e-8),
+                       "torsion": (0.190, -2.51e-3, 1.35e-5, -2.67e-8)}
+
+# kpsi to MPa.
+KPSI_TO_MPA = 6.89476
+
+# in to mm.
+IN_TO_MM = 25.4
+
+
+def neuber_constant(Sut: ArrayLike, loading: str = "bending", units: str = 'kpsi') -> ArrayLike:
+    """ Neuber constant, sqrt(a), evaluated by Horner's rule.
+
+    Args:
+        Sut (ArrayLike): Ultimate tensile strength(s).
+        loading (str, optional): bending, axial or torsion. Defaults to "bending".
+        units (str, optional): 'kpsi' (sqrt(a) in in^(1/2)) or 'MPa' (sqrt(a) in mm^(1/2)).
+                               Defaults to 'kpsi'.
+
+    Returns:
+        ArrayLike: sqrt(a), with the same shape as Sut.
+    """
+    Sut = np.asarray(Sut, dtype=float)
+    if units != 'kpsi':
+        Sut = Sut/KPSI_TO_MPA
+
+    c0, c1, c2, c3 = NEUBER_COEFFICIENTS[loading]
+    sqrt_a = c0 + Sut*(c1 + Sut*(c2 + Sut*c3))
+
+    if units != 'kpsi':
+        sqrt_a = sqrt_a*np.sqrt(IN_TO_MM)
+    return sqrt_a
+
+
+def notch_sensitivity(Sut: ArrayLike, r: ArrayLike, loading: str = "bending", units: str = 'kpsi') -> ArrayLike:
+    """ Notch sensitivity, q = 1/(1 + sqrt(a)/sqrt(r)) (Eq. 6-34).
+
+    Args:
+        Sut (ArrayLike): Ultimate tensile strength(s).
+        r (ArrayLike): Notch radius [in if units is 'kpsi', mm otherwise]. Broadcast against Sut.
+        loading (str, optional): bending, axial or torsion. Defaults to "bending".
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+
+    Returns:
+        ArrayLike: q.
+    """
+    return 1/(1 + neuber_constant(Sut, loading, units)/np.sqrt(r))
+
+
+def fatigue_stress_concentration_factor(Kt: ArrayLike, Sut: ArrayLike, r: ArrayLike, loading: str = "bending",
+                                        units: str = 'kpsi') -> ArrayLike:
+    """ Fatigue stress-concentration factor, Kf = 1 + q*(Kt - 1) (Eq. 6-32). For torsion, Kt is Kts
+        and the result is Kfs.
+
+    Args:
+        Kt (ArrayLike): Theoretical stress-concentration factor(s).
+        Sut (ArrayLike): Ultimate tensile strength(s).
+        r (ArrayLike): Notch radius [in if units is 'kpsi', mm otherwise].
+        loading (str, optional): bending, axial or torsion. Defaults to "bending".
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+
+    Returns:
+        ArrayLike: Kf (or Kfs).
+    """
+    return 1 + notch_sensitivity(Sut, r, loading, units)*(np.asarray(Kt) - 1)
+
+
+def calculate(Sut: float, r: float, Kt: float, loading: str = "bending", units: str = 'kpsi') -> dict:
+    """ Non-interactive calculation of sqrt(a), q and Kf (or Kfs) of a notch.
+
+    Args:
+        Sut (float): Ultimate tensile strength.
+        r (float): Notch radius [in if units is 'kpsi', mm otherwise].
+        Kt (float): Theoretical stress-concentration factor (Kts for torsion).
+        loading (str, optional): bending, axial or torsion. Defaults to "bending".
+        units (str, optional): 'kpsi' or 'MPa'. Defaults to 'kpsi'.
+
+    Returns:
+        dict: sqrt(a), q and Kf.
+    """
+    return {"sqrt_a": float(neuber_constant(Sut, loading, units)),
+            "q": float(notch_sensitivity(Sut, r, loading, units)),
+            "Kf": float(fatigue_stress_concentration_factor(Kt, Sut, r, loading, units))}
 
-def calcular_raiz_de_a(modo: str, Sut: float) -> float:
-    if modo == 'f' or modo == 'a':
-        return 0.246 - 3.08*math.pow(10, -3)*Sut + 1.51*math.pow(10, -5)*math.pow(Sut, 2) - 2.67*math.pow(10, -8)*math.pow(Sut, 3)
-    else:
-        return 0.190 - 2.51*math.pow(10, -3)*Sut + 1.35*math.pow(10, -5)*math.pow(Sut, 2) - 2.67*math.pow(10, -8)*math.pow(Sut, 3)
 
 def main():
-    Sut = float(input("Introduzca Sut en kpsi: "))
-    modo = input("Flexión, axial o torsión (f, a, t): ")
-    ra = calcular_raiz_de_a(modo, Sut)
-    print("Raíz de a: " + str(ra))
-    r = float(input("r = "))
-    q = 1/(1 + ra/math.sqrt(r))
-    print("q = " + str(q))
-    Kt = float(input("Kt = "))
-    Kf = 1 + q*(Kt - 1)
-    print("Kf = " + str(Kf))
-
-main()
\ No newline at end of file
+    """ Computes sqrt(a), q and Kf (or Kfs) of a notch.
+    """
+    print("* Please, input valid data at all times! *\n")
+    units = Entry_Manager.get_str_input("Units", ["kpsi", "mpa"], "kpsi")
+    units = 'kpsi' if units == 'kpsi' else 'MPa'
+    length = "in" if units == 'kpsi' else "mm"
+    loading = Entry_Manager.get_str_input("Loading", list(NEUBER_COEFFICIENTS.keys()), "bending")
+    Sut = Entry_Manager.get_simple_numerical_entry("Ultimate tensile strength, Sut [" + units + "]", "float", '+')
+    chart = Entry_Manager.get_str_input("Read Kt from a chart", ["y", "n"], "n")
+    if chart == "y":
+        from Mechanics.StressConcentration import ask_stress_concentration_factor
+        Kt, r = ask_stress_concentration_factor(loading, length)
+    else:
+        r = Entry_Manager.get_simple_numerical_entry("Notch radius, r [" + length + "]", "float", '+')
+        Kt = Entry_Manager.get_simple_numerical_entry("Kts" if loading == "torsion" else "Kt", "float", '+')
+
+    print("\nResults:\n")
+    print("\tsqrt(a) = " + str(neuber_constant(Sut, loading, units)) + ' ' + length + "^(1/2)")
+    print("\tq = " + str(notch_sensitivity(Sut, r, loading, units)))
+    print("\t" + ("Kfs" if loading == "torsion" else "Kf") + " = " +
+          str(fatigue_stress_concentration_factor(Kt, Sut, r, loading, units)))
+
+
+if __name__ == "__main__":
+    main()
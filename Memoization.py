@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Memoization of deterministic calculations.
+
+Functions opt in with the memoize decorator. Results are kept in an in-memory LRU cache bounded in
+size and, optionally, in an on-disk cache shared between processes and runs. Keys are a hash of
+the inputs and of the source code of the module of the function, so changing the code invalidates
+its results. Numbers are keyed by value (2 and 2.0 give the same key), numpy arrays by dtype,
+shape and contents, and lists, tuples and dicts element by element.
+
+The on-disk cache is used by functions memoized with disk=True, and only if DISK_CACHE_DIRECTORY is
+set, either with set_disk_cache_directory() or with the SOLVERS_CACHE_DIR environment variable.
+Each result is saved as <directory>/<first two characters of the key>/<key>.pkl.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from functools import wraps
+from numbers import Integral, Real
+from typing import Callable
+
+# Default number of results kept in memory per function.
+MAX_SIZE = 1024
+
+# Directory of the on-disk cache. None disables it.
+DISK_CACHE_DIRECTORY = os.environ.get("SOLVERS_CACHE_DIR") or None
+
+# Cache of every memoized function, by qualified name.
+CACHES = dict()
+
+# Marker of a missing result, since None is a valid result.
+_MISSING = object()
+
+
+def set_disk_cache_directory(directory: str) -> None:
+    """ Enables the on-disk cache in directory, or disables it if directory is None. The directory is
+        also exported through SOLVERS_CACHE_DIR, so worker processes started later use it too.
+
+    Args:
+        directory (str): Directory of the cache. It is created if it does not exist.
+    """
+    global DISK_CACHE_DIRECTORY
+    DISK_CACHE_DIRECTORY = directory
+    if directory is None:
+        os.environ.pop("SOLVERS_CACHE_DIR", None)
+    else:
+        os.makedirs(directory, exist_ok=True)
+        os.environ["SOLVERS_CACHE_DIR"] = directory
+
+
+def is_array(value) -> bool:
+    """
+    Args:
+        value (Any): Value.
+
+    Returns:
+        bool: True if value is a numpy array. numpy is not imported here, since no value can be an
+              array if numpy has not been imported yet.
+    """
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def make_hashable(value):
+    """ Turns a value into a hashable key, in a canonical way.
+
+    Args:
+        value (Any): Value. Unknown types must be hashable themselves.
+
+    Returns:
+        Any: Key of the value.
+    """
+    value_type = type(value)
+    if value_type is float or value_type is str or value is None:
+        return value
+    if value_type is bool:
+        return ("bool", value)  # Otherwise, True and 1.0 would be the same key.
+    if isinstance(value, Integral) and not is_array(value):
+        # Integers share the key of the equal float only if that float represents them exactly.
+        value = int(value)
+        try:
+            return float(value) if int(float(value)) == value else ("int", value)
+        except OverflowError:
+            return ("int", value)
+    if isinstance(value, Real) and not is_array(value):
+        return float(value)
+    if is_array(value):
+        value = sys.modules["numpy"].ascontiguousarray(value)
+        data = value.tobytes() if value.dtype != object else repr(value.tolist())
+        return ("array", value.dtype.str, value.shape, data)
+    if isinstance(value, (list, tuple)):
+        return tuple(make_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return ("dict",) + tuple(sorted((repr(key), make_hashable(item)) for key, item in value.items()))
+    return value
+
+
+def get_code_version(function: Callable) -> str:
+    """
+    Args:
+        function (Callable): Function.
+
+    Returns:
+        str: Hash of the source file of the module of the function, or of its bytecode if the source
+             is not available.
+    """
+    import inspect
+    try:
+        with open(inspect.getfile(function), "rb") as f:
+            source = f.read()
+    except (TypeError, OSError):
+        source = function.__code__.co_code
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def freeze(result):
+    """ Makes the numpy arrays of a result read-only, so that a cached result cannot be modified by
+        the code which got it.
+
+    Args:
+        result (Any): Result of a function.
+
+    Returns:
+        Any: The same result.
+    """
+    if is_array(result):
+        result.setflags(write=False)
+    elif isinstance(result, dict):
+        for value in result.values():
+            freeze(value)
+    elif isinstance(result, (list, tuple)):
+        for value in result:
+            freeze(value)
+    return result
+
+
+class MemoCache:
+    """ In-memory LRU cache, and optionally on-disk cache, of the results of a function.
+    """
+
+    def __init__(self, name: str, version: str, max_size: int = MAX_SIZE, disk: bool = False) -> None:
+        """
+        Args:
+            name (str): Qualified name of the function.
+            version (str): Code version of the function.
+            max_size (int, optional): Number of results kept in memory. Defaults to MAX_SIZE.
+            disk (bool, optional): True if results are also kept on disk. Defaults to False.
+        """
+        self.name = name
+        self.version = version
+        self.max_size = max_size
+        self.disk = disk
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_path(self, key: tuple) -> str:
+        """
+        Args:
+            key (tuple): Key of the call.
+
+        Returns:
+            str: File of the result in the on-disk cache, named after a hash of the key and of the
+                 code version.
+        """
+        digest = hashlib.sha256(self.name.encode() + b"@" + self.version.encode() +
+                                pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+        return os.path.join(DISK_CACHE_DIRECTORY, digest[:2], digest + ".pkl")
+
+    def get(self, key: tuple):
+        """
+        Args:
+            key (tuple): Key of the call.
+
+        Returns:
+            Any: Cached result, or _MISSING.
+        """
+        with self.lock:
+            result = self.results.get(key, _MISSING)
+            if result is not _MISSING:
+                self.results.move_to_end(key)
+                self.hits += 1
+                return result
+
+        if self.disk and DISK_CACHE_DIRECTORY is not None:
+            try:
+                with open(self.get_path(key), "rb") as f:
+                    result = freeze(pickle.load(f))
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self.put(key, result, to_disk=False)
+                with self.lock:
+                    self.disk_hits += 1
+                return result
+
+        with self.lock:
+            self.misses += 1
+        return _MISSING
+
+    def put(self, key: tuple, result, to_disk: bool = True) -> None:
+        """ Saves a result.
+
+        Args:
+            key (tuple): Key of the call.
+            result (Any): Result.
+            to_disk (bool, optional): True if it is also saved on disk (when enabled). Defaults to True.
+        """
+        with self.lock:
+            self.results[key] = result
+            self.results.move_to_end(key)
+            while len(self.results) > self.max_size:
+                self.results.popitem(last=False)
+                self.evictions += 1
+
+        if to_disk and self.disk and DISK_CACHE_DIRECTORY is not None:
+            path = self.get_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = path + "." + str(os.getpid()) + ".tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)  # Atomic, so other processes never read half a file.
+
+    def clear(self) -> None:
+        """ Clears the in-memory results and the statistics. The on-disk cache is kept.
+        """
+        with self.lock:
+            self.results.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def get_statistics(self) -> dict:
+        """
+        Returns:
+            dict: Hits (in memory and on disk), misses, hit rate, evictions and size of the cache.
+        """
+        with self.lock:
+            calls = self.hits + self.disk_hits + self.misses
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "hit_rate": (self.hits + self.disk_hits)/calls if calls else 0.0,
+                    "evictions": self.evictions, "size": len(self.results), "max_size": self.max_size,
+                    "disk": self.disk and DISK_CACHE_DIRECTORY is not None}
+
+
+def memoize(max_size: int = MAX_SIZE, disk: bool = False) -> Callable:
+    """ Decorator which memoizes a deterministic function. The cache of the function is available as
+        its cache attribute. Dictionaries are copied when they are returned from the cache, and numpy
+        arrays of results are made read-only.
+
+    Args:
+        max_size (int, optional): Number of results kept in memory. Defaults to MAX_SIZE.
+        disk (bool, optional): True if results are also kept in the on-disk cache. Defaults to False.
+
+    Returns:
+        Callable: Decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        import inspect
+        name = function.__module__ + "." + function.__qualname__
+        cache = MemoCache(name, get_code_version(function), max_size, disk)
+        CACHES[name] = cache
+        parameters = list(inspect.signature(function).parameters.values())
+        names = [parameter.name for parameter in parameters]
+        defaults = [parameter.default for parameter in parameters]
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            # Arguments are matched to parameters, so that every way of making the same call gives
+            # the same key. Calls which do not match the signature are left to raise in the function.
+            if len(args) > len(names) or any(name not in names for name in kwargs):
+                return function(*args, **kwargs)
+            key = tuple(make_hashable(value) for value in args) + \
+                tuple(make_hashable(kwargs.get(name, default)) for name, default in
+                      zip(names[len(args):], defaults[len(args):]))
+
+            result = cache.get(key)
+            if result is _MISSING:
+                result = freeze(function(*args, **kwargs))
+                cache.put(key, result)
+            return dict(result) if isinstance(result, dict) else result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def get_statistics() -> dict:
+    """
+    Returns:
+        dict: Statistics of the cache of every memoized function, by qualified name.
+    """
+    return {name: cache.get_statistics() for name, cache in CACHES.items()}
+
+
+def clear_all() -> None:
+    """ Clears the in-memory results and statistics of every memoized function.
+    """
+    for cache in CACHES.values():
+        cache.clear()
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import json
+import threading
+from importlib import import_module
+from importlib.util import find_spec
+from os import stat
+from typing import List, Tuple
+
+from ExceptionHandling import exceptions
+
+# Name of the JSON file which contains all the available options.
+JSON_OPTIONS_FILE = "options.json"
+
+
+class OptionsRegistry:
+    """ Available options of the app, loaded and validated once at startup.
+
+        The options file is only read again if it changes on disk. The menu text and the index of
+        options are built when the file is loaded, and the module of each option is imported at
+        most once. Options marked with "preload": true can be imported in the background while
+        the user reads the menu.
+    """
+
+    def __init__(self, filename: str = JSON_OPTIONS_FILE) -> None:
+        """
+        Args:
+            filename (str, optional): JSON file with the options. Defaults to JSON_OPTIONS_FILE.
+        """
+        self.filename = filename
+        self.mtime = None
+        self.modules = dict()
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """ Loads the options from the JSON file, validates them and builds the index and the menu.
+
+            Each option is a string, which is a key of the dictionary, and each
+            key contains the following attributes:
+
+            id : float
+                An id to identify every function/option inside the key.
+            name : string
+                The user-friendly name of the function/option.
+            function : string
+                The name of the module of the option, inside the package of the key.
+            preload : bool, optional
+                True if the module is imported in the background at startup.
+
+        Raises:
+            InvalidFileFormatError: If the file is not valid, with every problem found.
+        """
+        self.mtime = stat(self.filename).st_mtime
+        try:
+            with open(self.filename) as f:
+                options = json.load(f)['options']
+        except (ValueError, KeyError, TypeError) as e:
+            raise exceptions.InvalidFileFormatError(self.filename + " is not valid: " + str(e), self.filename)
+
+        # Nothing is replaced until the new options are known to be valid.
+        index, menu = self.build(options)
+        self.options, self.index, self.menu = options, index, menu
+
+    def build(self, options: dict) -> Tuple[dict, str]:
+        """ Validates the options and builds the index of options and the menu text.
+
+        Args:
+            options (dict): Options in the format of the JSON file.
+
+        Raises:
+            InvalidFileFormatError: If there are duplicate ids, missing attributes or options whose
+                                    module does not exist.
+
+        Returns:
+            Tuple[dict, str]: Index in the following format:
+                {"[Real_ID]": {"Area": key, "Name": option['name'], "Function": option['function']}}
+                where Real_ID takes into account the number of the upper level where the nested
+                option is, and the menu text.
+        """
+        index = dict()
+        menu = list()
+        problems = list()
+        for cont, area in enumerate(options.keys(), 1):
+            menu.append(str(cont) + ". " + area + ".")
+            for option in options[area]:
+                if not all(attribute in option for attribute in ['id', 'name', 'function']):
+                    problems.append("Option " + str(option) + " of " + area + " must have an id, name and function.")
+                    continue
+
+                real_id = str(cont + option['id'])
+                if real_id in index:
+                    problems.append("Duplicate id " + str(option['id']) + " in " + area + ".")
+                elif find_spec(area + '.' + option['function']) is None:
+                    problems.append("Module " + area + '.' + option['function'] + " does not exist.")
+
+                menu.append("\t" + real_id + ". " + option['name'] + ".")
+                index[real_id] = {"Area": area, "Name": option['name'], "Function": option['function'],
+                                  "Preload": option.get('preload', False)}
+
+        if problems:
+            raise exceptions.InvalidFileFormatError(self.filename + " is not valid: " + " ".join(problems),
+                                                    self.filename)
+
+        menu.append("Q. Quit.")
+        return index, "\n".join(menu)
+
+    def reload_if_changed(self) -> bool:
+        """ Reloads the options if the file was modified since it was loaded. If the modified file
+            cannot be read or is not valid, the error is logged and the previous options are kept
+            until the file changes again.
+
+        Returns:
+            bool: True if the options were reloaded.
+        """
+        try:
+            if stat(self.filename).st_mtime == self.mtime:
+                return False
+            self.load()
+        except OSError as e:
+            exceptions.InvalidFileFormatError("Could not reload " + self.filename + ": " + str(e), self.filename)
+            return False
+        except exceptions.InvalidFileFormatError:
+            return False
+        return True
+
+    def look_up(self, option: str) -> Tuple[str, str, str]:
+        """ Looks up an option by the number shown in the menu.
+
+        Args:
+            option (str): Option the user asked for.
+
+        Raises:
+            OptionNotFoundError: If the option is not one of the available options.
+
+        Returns:
+            Tuple[str, str, str]: Area, name and function of the option.
+        """
+        if option not in self.index:
+            raise exceptions.OptionNotFoundError("Picked option " + str(option) + " not found.")
+
+        entry = self.index[option]
+        return entry['Area'], entry['Name'], entry['Function']
+
+    def get_module(self, area: str, function: str):
+        """ Gets the module of an option, which is imported the first time.
+
+        Args:
+            area (str): Area (package) of the option.
+            function (str): Function (module) of the option.
+
+        Returns:
+            module: Module of the option.
+        """
+        name = area + '.' + function
+        if name not in self.modules:
+            with self.lock:
+                if name not in self.modules:
+                    self.modules[name] = import_module(name)
+        return self.modules[name]
+
+    def get_preloaded_options(self) -> List[Tuple[str, str]]:
+        """
+        Returns:
+            List[Tuple[str, str]]: Area and function of the options marked with "preload": true.
+        """
+        return [(entry['Area'], entry['Function']) for entry in self.index.values() if entry['Preload']]
+
+    def preload(self) -> None:
+        """ Imports the modules of the options marked with "preload": true. Errors are ignored here,
+            so they show up when the option is actually picked.
+        """
+        for area, function in self.get_preloaded_options():
+            try:
+                self.get_module(area, function)
+            except Exception:
+                pass
+
+    def preload_in_background(self) -> threading.Thread:
+        """ Runs preload() in a background thread.
+
+        Returns:
+            threading.Thread: The thread, which is a daemon.
+        """
+        thread = threading.Thread(target=self.preload, name="Preloader", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Non-interactive command-line interface.
+
+Usage (from the root of the repository):
+    python -m cli list
+    python -m cli <job> --<parameter> <value> ...      i.e, python -m cli buckling --l 2 --d 0.05 --E 207 --Sy 300
+    python -m cli <job> --help
+    python -m cli batch <job file> [--output results.jsonl] [--workers 4] [--cache-dir DIR]
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import inspect
+import json
+import sys
+from timeit import default_timer as timer
+from typing import List
+
+import jobs
+import Memoization
+from ExceptionHandling import exceptions
+
+
+def run_single_job(job: str, args: List[str]) -> int:
+    """ Runs a job with parameters given as --<parameter> <value> and prints its result as JSON.
+    """
+    function = jobs.get_function(job)
+    parser = argparse.ArgumentParser(prog="python -m cli " + job, description=inspect.getdoc(function).split("\n")[0])
+    for name, (value_type, default) in jobs.get_parameter_types(function).items():
+        required = default is inspect.Parameter.empty
+        parser.add_argument("--" + name, required=required,
+                            help=getattr(value_type, "__name__", str(value_type)) +
+                            ("" if required else " (default: " + str(default) + ")"))
+    parameters = {k: v for k, v in vars(parser.parse_args(args)).items() if v is not None}
+
+    output = jobs.run_job(dict(job=job, **parameters))
+    if "error" in output:
+        print("Error: " + output["error"], file=sys.stderr)
+        return 1
+
+    print(json.dumps(output["result"], default=jobs.to_json, indent=2))
+    print("Time: {:.6} s".format(output["seconds"]), file=sys.stderr)
+    return 0
+
+
+def run_batch(args: List[str]) -> int:
+    """ Runs every job of a job file across a process pool and writes all results to a single file.
+    """
+    parser = argparse.ArgumentParser(prog="python -m cli batch")
+    parser.add_argument("file", help="Job file (.yaml, .json or .csv).")
+    parser.add_argument("--output", default="results.jsonl", help="Output file (.jsonl, .json or .csv).")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes. Defaults to the CPUs.")
+    parser.add_argument("--cache-dir", default=None, help="Directory of the on-disk cache of results.")
+    options = parser.parse_args(args)
+    if options.cache_dir is not None:
+        Memoization.set_disk_cache_directory(options.cache_dir)
+
+    job_list = jobs.read_job_file(options.file)
+    start = timer()
+    failed = jobs.write_results(jobs.run_batch(job_list, options.workers), options.output)
+    elapsed = timer() - start
+
+    print(str(len(job_list)) + " jobs run in {:.6} s ({} failed). Results were saved in {}".format(
+        elapsed, failed, options.output))
+    return 1 if failed else 0
+
+
+def main(args: List[str] = None) -> int:
+    args = sys.argv[1:] if args is None else args
+    if not args or args[0] in ["-h", "--help"]:
+        print(__doc__.strip().split("\n\nCreated")[0])
+        return 0
+
+    if args[0] == "list":
+        for job, module in jobs.JOBS.items():
+            print("{:<20} {}".format(job, module))
+        return 0
+
+    if args[0] == "batch":
+        return run_batch(args[1:])
+
+    try:
+        return run_single_job(args[0], args[1:])
+    except exceptions.FunctionNotFoundError as e:
+        print("Error: " + e.message, file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
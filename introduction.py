@@ -6,19 +6,24 @@ Created on December 13, 2019.
 """
 
 from ExceptionHandling import exceptions
+from OptionsRegistry import OptionsRegistry
 from typing import Tuple
 import give_console_width
 
-# Console width of the current/active console.
-CONSOLE_WIDTH = give_console_width.main()
+# Console width of the current/active console. It is only queried when the menu is first shown.
+CONSOLE_WIDTH = None
 
-# Dictionary of available options in the following format:
-# {"[Real_ID]": {"Area": key,
-#                "Name": option['name'],
-#                "Function": option['function']}
-# Where Real_ID takes into account the number of the
-# upper level where the nested option is.
-AVAILABLE_OPTIONS = dict()
+
+def get_console_width() -> int:
+    """ Gets the console width, which is only queried the first time.
+    
+    Returns:
+        int: Console width.
+    """
+    global CONSOLE_WIDTH
+    if CONSOLE_WIDTH is None:
+        CONSOLE_WIDTH = give_console_width.main()
+    return CONSOLE_WIDTH
 
 
 def create_title(title: str) -> None:
@@ -27,25 +32,14 @@ def create_title(title: str) -> None:
     Args:
         title (str): Title of the program.
     """
-    print("~" * CONSOLE_WIDTH)
-    print(" " * int(str((CONSOLE_WIDTH - len(title))//2)) +
-          title + " " * int(str((CONSOLE_WIDTH - len(title))//2)))
-    print("~" * CONSOLE_WIDTH)
+    width = get_console_width()
+    print("~" * width)
+    print(" " * int(str((width - len(title))//2)) +
+          title + " " * int(str((width - len(title))//2)))
+    print("~" * width)
     print("")
 
 
-def show_option(cont: int, id_: int, name: str) -> None:
-    """ Show the option in an user-friendly way.
-    
-    Args:
-        cont (int): Number of the upper menu, i.e, area of the option.
-        Example: Calculus, Linear Algebra.description]
-        id_ (int): Number of the lower menu, i.e, specific function.
-        name (str): Name of the function.
-    """
-    print("\t" + str(cont + id_) + ". " + name + ".")
-
-
 def take_option() -> str:
     """ Algorithm that takes the option of the user.
     
@@ -56,86 +50,25 @@ def take_option() -> str:
     return option
 
 
-def look_up_option(option: float) -> Tuple[str, str, str]:
-    """ Looks up the option given by parameter.
-
-        This method looks for the option given by parameter inside
-        the list of available options.    
+def main(registry: OptionsRegistry) -> Tuple[str, str, str]:
+    """ Shows the available options of the program and takes the option of the user.
     
     Args:
-        option (float): Option the user asked for.
-    
-    Raises:
-        e (OptionNotFoundError): This method raises this error when the option was not found,
-        i.e, it is not one of the available options.
-    
-    Returns:
-        Tuple[str, str, str]: Tuple of 3 strs, which are:
-            Area : str
-                Area of the picked option.
-            Name : str
-                Name of the option.
-            Function : str
-                Actual name of the function, which gets called to
-                execute what the user wants. 
-    """
-    if str(option) in AVAILABLE_OPTIONS.keys():
-        return (AVAILABLE_OPTIONS[str(option)]['Area'],
-                AVAILABLE_OPTIONS[str(option)]['Name'],
-                AVAILABLE_OPTIONS[str(option)]['Function'])
-    else:
-        e = exceptions.OptionNotFoundError(
-            "Picked option " + str(option) + " not found.")
-        raise e
-
-
-def main(options: dict) -> None:
-    """ Shows the available options of the program.
-    
-    Args:
-        options (dict): Available options to show the user. Options must be
-        in the following dictionary format:
+        registry (OptionsRegistry): Available options to show the user.
 
-        {
-            "[name of area 1]": [
-                {
-                    "id": _, 
-                    "name": _, 
-                    "function": _
-                },
-                {
-                    ...
-                }
-            ],
-            "[name of area 2]": [
-                {
-                    ...
-                }
-            ], 
-            ...
-        }
+    Returns:
+        Tuple[str, str, str]: Area, name and function of the picked option.
     """
     title = "University tools and solvers, by Camilo Martínez"
 
     create_title(title)
 
-    cont = 1
-    for key in options.keys():
-        print(str(cont) + ". " + key + ".")
-        for option in options[key]:
-            show_option(cont, option['id'], option['name'])
-            AVAILABLE_OPTIONS[str(cont + option['id'])] = {"Area": key,
-                                                           "Name": option['name'],
-                                                           "Function": option['function']}
-
-        cont += 1
-        
-    print("Q. Quit.")
+    print(registry.menu)
     print("")
-    print("~" * CONSOLE_WIDTH)
+    print("~" * get_console_width())
 
     while True:
-        picked_option = take_option().lower()
+        picked_option = take_option().lower().strip()
         
         if picked_option in ['quit', 'q']: # Exits the program.
             import sys
@@ -143,7 +76,7 @@ def main(options: dict) -> None:
             sys.exit(0)
         
         try:
-            area, name, function = look_up_option(picked_option)
+            area, name, function = registry.look_up(picked_option)
             return area, name, function
         except exceptions.OptionNotFoundError:
             print("[*] That option does not exist. Please, try again.")
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Non-interactive jobs: the calculation function of every tool, and a batch runner which dispatches
+many jobs across a process pool.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import inspect
+import json
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from os.path import splitext
+from timeit import default_timer as timer
+from typing import Callable, Iterator, List
+
+from ExceptionHandling import exceptions
+
+# Name of every job and the module whose calculate() function runs it.
+JOBS = {"determinant": "LinearAlgebra.find_determinant_matrix",
+        "root": "Calculus.find_root_equations",
+        "nonlinear-system": "Calculus.solve_nonlinear_system",
+        "buckling": "Mechanics.BucklingCalculator",
+        "buckling-reliability": "Mechanics.BucklingReliability",
+        "eccentric-column": "Mechanics.EccentricColumn",
+        "non-uniform-column": "Mechanics.NonUniformColumn",
+        "frame": "Mechanics.FrameAnalysis",
+        "failure-theories": "Mechanics.FailureTheories",
+        "principal-stresses": "Mechanics.PrincipalStresses",
+        "influence-lines": "Mechanics.InfluenceLines",
+        "fatigue": "Mechanics.FatigueDesign",
+        "notch": "Mechanics.raizdea",
+        "stress-concentration": "Mechanics.StressConcentration",
+        "shaft": "Mechanics.ShaftDesign",
+        "rainflow": "Mechanics.RainflowCounter"}
+
+
+def get_function(job: str) -> Callable:
+    """ Gets the calculation function of a job. The module is only imported here.
+
+    Args:
+        job (str): Name of the job (a key of JOBS).
+
+    Raises:
+        FunctionNotFoundError: If the job does not exist.
+
+    Returns:
+        Callable: calculate() function of the module of the job.
+    """
+    if job not in JOBS:
+        raise exceptions.FunctionNotFoundError("Job " + str(job) + " does not exist. Available jobs: " +
+                                               ", ".join(JOBS.keys()))
+    return import_module(JOBS[job]).calculate
+
+
+def get_parameter_types(function: Callable) -> dict:
+    """
+    Args:
+        function (Callable): Calculation function.
+
+    Returns:
+        dict: {name: (type, default)} of every parameter. default is inspect.Parameter.empty if
+              the parameter is required.
+    """
+    hints = typing.get_type_hints(function)
+    return {name: (hints.get(name, str), parameter.default)
+            for name, parameter in inspect.signature(function).parameters.items()}
+
+
+def parse_value(value, value_type: type):
+    """ Converts a value read from the command line or from a CSV file to the type of its parameter.
+        Lists and dictionaries are written in JSON, i.e, [[1, 2], [3, 4]] or {"a": [1, 2]}.
+    """
+    if not isinstance(value, str):
+        return value
+    if value_type in (list, dict, typing.List, typing.Dict) or typing.get_origin(value_type) in (list, dict):
+        return json.loads(value)
+    if value_type is bool:
+        return value.strip().lower() in ["true", "yes", "y", "1"]
+    if value_type in (int, float):
+        return value_type(value)
+    return value
+
+
+def parse_parameters(function: Callable, parameters: dict) -> dict:
+    """ Converts and checks the parameters of a job.
+
+    Args:
+        function (Callable): Calculation function of the job.
+        parameters (dict): Raw parameters. Empty strings and None are treated as missing.
+
+    Raises:
+        InvalidEntryError: If a parameter is unknown, missing or cannot be converted.
+
+    Returns:
+        dict: Keyword arguments of the function.
+    """
+    types = get_parameter_types(function)
+    kwargs = dict()
+    for name, value in parameters.items():
+        if value is None or value == "":
+            continue
+        if name not in types:
+            raise exceptions.InvalidEntryError("Unknown parameter " + name + ". Expected any of: " + str(list(types)))
+        try:
+            kwargs[name] = parse_value(value, types[name][0])
+        except ValueError:
+            raise exceptions.InvalidEntryError("Invalid value of " + name + ": " + str(value))
+
+    missing = [name for name, (_, default) in types.items() if default is inspect.Parameter.empty and name not in kwargs]
+    if missing:
+        raise exceptions.InvalidEntryError("Missing parameters: " + ", ".join(missing))
+    return kwargs
+
+
+def to_json(value):
+    """ Default of json.dumps for numpy values.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(str(type(value)) + " is not JSON serializable")
+
+
+def run_job(job: dict) -> dict:
+    """ Runs a single job. Errors are reported in the result instead of being raised, so that one bad
+        job does not stop a batch.
+
+    Args:
+        job (dict): {"job": name of the job, **parameters}.
+
+    Returns:
+        dict: job, parameters, result (or error) and the time taken in seconds.
+    """
+    parameters = {key: value for key, value in job.items() if key != "job"}
+    output = {"job": job.get("job"), "parameters": parameters}
+    start = timer()
+    try:
+        function = get_function(job.get("job"))
+        output["result"] = function(**parse_parameters(function, parameters))
+    except exceptions.ParentException.ParentException as e:
+        output["error"] = e.message
+    except Exception as e:
+        output["error"] = type(e).__name__ + ": " + str(e)
+    output["seconds"] = timer() - start
+    return output
+
+
+def read_job_file(filename: str) -> List[dict]:
+    """ Reads a job file. Every job is a mapping with the name of the job under "job" and its parameters.
+
+        - .json: a list of jobs, or {"jobs": [...]}.
+        - .yaml/.yml: same as JSON. Requires PyYAML.
+        - .csv: one job per row, with a "job" column and one column per parameter. Empty cells are
+          treated as missing parameters.
+
+    Args:
+        filename (str): Job file.
+
+    Raises:
+        InvalidFileExtensionError: If the extension is not supported (or PyYAML is not installed).
+
+    Returns:
+        List[dict]: Jobs.
+    """
+    extension = splitext(filename)[1].lower()
+    if extension == ".json":
+        with open(filename) as f:
+            jobs = json.load(f)
+    elif extension in [".yaml", ".yml"]:
+        try:
+            import yaml
+        except ImportError:
+            raise exceptions.InvalidFileExtensionError("PyYAML is required to read " + filename, filename)
+        with open(filename) as f:
+            jobs = yaml.safe_load(f)
+    elif extension == ".csv":
+        import csv
+        with open(filename, newline="") as f:
+            jobs = [dict(row) for row in csv.DictReader(f)]
+    else:
+        raise exceptions.InvalidFileExtensionError("Unsupported job file extension: " + extension, filename)
+
+    if isinstance(jobs, dict):
+        jobs = jobs["jobs"]
+    return jobs
+
+
+def run_batch(jobs: List[dict], workers: int = None) -> Iterator[dict]:
+    """ Runs jobs across a process pool.
+
+    Args:
+        jobs (List[dict]): Jobs.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs. With 1, jobs
+                                 run in this process.
+
+    Yields:
+        dict: Output of every job (see run_job), in the same order as jobs, with its index.
+    """
+    executor = None
+    if workers == 1:
+        outputs = map(run_job, jobs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        outputs = executor.map(run_job, jobs, chunksize=max(1, len(jobs)//(4*(workers or 4))))
+
+    # The pool is shut down even if the caller stops consuming the outputs early (or fails while
+    # doing so), and the jobs which have not started are cancelled.
+    try:
+        for index, output in enumerate(outputs):
+            output["index"] = index
+            yield output
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def write_results(outputs: Iterator[dict], filename: str) -> int:
+    """ Writes the outputs of a batch to a single file: JSON lines (.jsonl), a JSON list (.json) or a
+        CSV file (.csv) with one column per parameter and result.
+
+    Args:
+        outputs (Iterator[dict]): Outputs of the jobs.
+        filename (str): Output file.
+
+    Returns:
+        int: Number of failed jobs.
+    """
+    extension = splitext(filename)[1].lower()
+    failed = 0
+    outputs = list(outputs) if extension != ".jsonl" else outputs
+    with open(filename, "w", newline="") as f:
+        if extension == ".csv":
+            import csv
+            rows = [dict([("index", o["index"]), ("job", o["job"]), ("seconds", o["seconds"]),
+                          ("error", o.get("error"))] +
+                         [("parameters." + k, v) for k, v in o["parameters"].items()] +
+                         [("result." + k, v) for k, v in (o.get("result") or dict()).items()]) for o in outputs]
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        elif extension == ".json":
+            json.dump(outputs, f, default=to_json, indent=2)
+        else:
+            for output in outputs:
+                f.write(json.dumps(output, default=to_json) + "\n")
+                failed += "error" in output
+            return failed
+
+    return sum("error" in output for output in outputs)
@@ -5,19 +5,13 @@ Created on December 13, 2019.
 @author: Camilo Martínez
 """
 
-import json
 from ExceptionHandling import exceptions
-from importlib import import_module
+from OptionsRegistry import OptionsRegistry, JSON_OPTIONS_FILE
 from os import name, system
 
+import InputSource
 import introduction
 
-# True if the title of the log file has already been written.
-TITLE_EXISTS = False
-
-# Name of the JSON file which contains all the available options.
-JSON_OPTIONS_FILE = "options.json"
-
 
 def clear() -> None:
     """ Clears the console.
@@ -28,56 +22,64 @@ def clear() -> None:
         _ = system('clear')  # For mac and linux (here, os.name is 'posix').
 
 
-def load_options() -> dict:
-    """ Loads the options from a JSON file.
-
-        The options are loaded into a dictionary thanks to the json module.
-        Each option is a string, which is a key of the dictionary, and each
-        key contains the following attributes:
-
-        id : string
-            An id to identify every function/option inside the key.
-        name : string
-            The user-friendly name of the function/option.
-        function : string
-            The name of the actual function, which can be a .cpp or .py name
-            of file.
-    
-    Returns:
-        dict: Contains the available options in dictionary format.
-    """
-    with open(JSON_OPTIONS_FILE) as f:
-        data = json.load(f)
-
-    return data
-
-
 def main():
     """ Executes the app.
 
         Shows the available options the user has access to.
-        The available options are loaded from a JSON file.
+        The available options are loaded from a JSON file once, and
+        reloaded only if the file changes.
     """
 
+    registry = OptionsRegistry(JSON_OPTIONS_FILE)
+    registry.preload_in_background()
+
     while True:
         clear()
 
-        data = load_options()
+        registry.reload_if_changed()
 
-        area, name, function = introduction.main(data['options'])
+        area, name, function = introduction.main(registry)
 
         clear()
 
         introduction.create_title(area + " -> " + name)
 
-        import_module(area + '.' + function).main()
+        registry.get_module(area, function).main()
 
         print("")
         input("Press any key to continue...")
         clear()
     
 
+def run(args: list = None) -> None:
+    """ Executes the app, reading the answers from the terminal, or from a recorded session.
+
+        python main.py                       Answers are typed in the terminal.
+        python main.py --record session.txt  Answers are typed in the terminal and saved.
+        python main.py --replay session.txt  Answers are read from the session file.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="University tools and solvers.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="FILE", help="Save every answer to FILE, one per line.")
+    group.add_argument("--replay", metavar="FILE", help="Read every answer from FILE, one per line.")
+    options = parser.parse_args(args)
+
+    if options.replay is not None:
+        source = InputSource.FileInput(options.replay, echo=True)
+    elif options.record is not None:
+        source = InputSource.RecordingInput(options.record)
+    else:
+        source = InputSource.ACTIVE_SOURCE
+
+    with InputSource.use_source(source):
+        try:
+            main()
+        except EOFError:
+            print("\nThe session ended before the app was closed.")
+
+
 print("")
 
 if __name__ == "__main__":
-    main()
+    run()
@@ -0,0 +1,458 @@
+# -*- coding: utf-8 -*-
+"""
+Local HTTP/JSON service which exposes the calculation function of every job (see jobs.JOBS).
+
+Run from the root of the repository with:
+    python -m server [--host 127.0.0.1] [--port 8765] [--workers N] [--cache-dir DIR]
+
+Endpoints:
+    GET  /health              {"status": "ok"}
+    GET  /jobs                Schema of every job: {job: {"module": ..., "parameters": {name:
+                              {"type": ..., "required": bool, "default": ...}}}}
+    POST /jobs/<job>          Body: {parameter: value, ...}. Responds with the output of the job:
+                              {"job", "parameters", "result" (or "error"), "seconds"}. The status
+                              is 200, or 422 if the job failed.
+    POST /batch               Body: [{"job": <job>, parameter: value, ...}, ...] or {"jobs": [...]}.
+                              Responds with the list of outputs, in order, each one with its index.
+    GET  /metrics             Requests, errors, latency percentiles and throughput, per job and
+                              in total, and memoization statistics of the workers.
+
+Calculations run in a process pool, so they do not block the event loop. Jobs that arrive at about
+the same time, from single requests or from batches, are grouped and sent to the pool together,
+which amortizes the cost of sending each job to another process.
+
+Created on October 19, 2026.
+
+@author: Camilo Martínez
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from timeit import default_timer as timer
+from typing import List, Tuple
+
+import jobs
+import Memoization
+
+# Address of the service. It only listens on the local machine by default.
+HOST = "127.0.0.1"
+PORT = 8765
+
+# Jobs are grouped till there are MAX_BATCH_SIZE of them or BATCH_WINDOW seconds have passed since
+# the first one arrived.
+MAX_BATCH_SIZE = 64
+BATCH_WINDOW = 0.002
+
+# Largest accepted request body, in bytes.
+MAX_BODY_SIZE = 16*1024*1024
+
+# Number of latest latencies kept per job to compute percentiles.
+LATENCY_WINDOW = 10000
+
+# Reason phrase of every status code used.
+STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+          413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+def preload_jobs() -> None:
+    """ Imports the module of every job. It runs once in every worker process, so that the first
+        request does not pay for the imports.
+    """
+    for module in jobs.JOBS.values():
+        import_module(module)
+
+
+def run_jobs(batch: List[dict]) -> Tuple[List[dict], int, dict]:
+    """ Runs a group of jobs in a worker process.
+
+    Args:
+        batch (List[dict]): Jobs (see jobs.run_job).
+
+    Returns:
+        Tuple[List[dict], int, dict]: Outputs of the jobs, in order, and the process id and
+                                      memoization statistics of the worker.
+    """
+    return [jobs.run_job(job) for job in batch], os.getpid(), Memoization.get_statistics()
+
+
+def get_schema() -> dict:
+    """
+    Returns:
+        dict: Module and parameters of every job.
+    """
+    import inspect
+    schema = dict()
+    for job, module in jobs.JOBS.items():
+        parameters = dict()
+        for name, (value_type, default) in jobs.get_parameter_types(jobs.get_function(job)).items():
+            required = default is inspect.Parameter.empty
+            parameters[name] = {"type": getattr(value_type, "__name__", str(value_type)), "required": required}
+            if not required:
+                parameters[name]["default"] = default
+        schema[job] = {"module": module, "parameters": parameters}
+    return schema
+
+
+class Metrics:
+    """ Number of requests, errors and latencies of every job, and throughput of the service.
+    """
+
+    def __init__(self) -> None:
+        self.started = timer()
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        self.finished = deque(maxlen=LATENCY_WINDOW)
+        self.batches = 0
+        self.batched_jobs = 0
+        self.caches = dict()
+
+    def record(self, job: str, latency: float, failed: bool) -> None:
+        """ Records a finished job.
+
+        Args:
+            job (str): Name of the job.
+            latency (float): Time since the job arrived until it finished, in seconds.
+            failed (bool): True if the job failed.
+        """
+        job = str(job)
+        self.requests[job] += 1
+        self.errors[job] += failed
+        self.latencies[job].append(latency)
+        self.finished.append(timer())
+
+    def summarize(self, latencies) -> dict:
+        """
+        Args:
+            latencies (Iterable[float]): Latencies in seconds.
+
+        Returns:
+            dict: Mean, 50th, 95th and 99th percentiles and maximum latency, in milliseconds.
+        """
+        import numpy as np
+        latencies = 1000*np.fromiter(latencies, dtype=float)
+        if latencies.size == 0:
+            return dict()
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {"mean_ms": float(latencies.mean()), "p50_ms": float(p50), "p95_ms": float(p95),
+                "p99_ms": float(p99), "max_ms": float(latencies.max())}
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: Current metrics. Throughput is computed over the whole uptime and over the last
+                  LATENCY_WINDOW jobs.
+        """
+        uptime = timer() - self.started
+        total = sum(self.requests.values())
+        recent = len(self.finished)
+        recent_span = self.finished[-1] - self.finished[0] if recent > 1 else 0
+        return {"uptime_s": uptime, "jobs": total, "errors": sum(self.errors.values()),
+                "throughput_per_s": total/uptime if uptime > 0 else 0,
+                "recent_throughput_per_s": (recent - 1)/recent_span if recent_span > 0 else 0,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_jobs/self.batches if self.batches else 0,
+                "latency": self.summarize(latency for values in self.latencies.values() for latency in values),
+                "per_job": {job: dict(requests=self.requests[job], errors=self.errors[job],
+                                      latency=self.summarize(self.latencies[job])) for job in self.requests},
+                "caches": self.summarize_caches()}
+
+    def summarize_caches(self) -> dict:
+        """
+        Returns:
+            dict: Memoization statistics of every memoized function, added up over the workers.
+        """
+        totals = dict()
+        for caches in self.caches.values():
+            for name, statistics in caches.items():
+                total = totals.setdefault(name, dict(hits=0, disk_hits=0, misses=0, evictions=0, size=0))
+                for key in total:
+                    total[key] += statistics[key]
+        for total in totals.values():
+            calls = total["hits"] + total["disk_hits"] + total["misses"]
+            total["hit_rate"] = (total["hits"] + total["disk_hits"])/calls if calls else 0.0
+        return totals
+
+
+class JobBatcher:
+    """ Groups jobs which arrive at about the same time and runs each group in the process pool.
+    """
+
+    def __init__(self, executor, metrics: Metrics, max_batch_size: int = MAX_BATCH_SIZE,
+                 window: float = BATCH_WINDOW) -> None:
+        """
+        Args:
+            executor (Executor): Pool where the jobs run.
+            metrics (Metrics): Metrics of the service.
+            max_batch_size (int, optional): Largest group of jobs. Defaults to MAX_BATCH_SIZE.
+            window (float, optional): Longest wait for more jobs, in seconds. Defaults to BATCH_WINDOW.
+        """
+        self.executor = executor
+        self.metrics = metrics
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self.pending = list()
+        self.flush_handle = None
+
+    async def submit(self, job: dict) -> dict:
+        """ Runs a job.
+
+        Args:
+            job (dict): {"job": name of the job, **parameters}.
+
+        Returns:
+            dict: Output of the job (see jobs.run_job).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((job, future, timer()))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """ Sends the pending jobs to the pool.
+        """
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, list()
+        self.metrics.batches += 1
+        self.metrics.batched_jobs += len(batch)
+        loop = asyncio.get_running_loop()
+        try:
+            task = loop.run_in_executor(self.executor, run_jobs, [job for job, _, _ in batch])
+        except Exception as e:
+            # The pool could not take the jobs (e.g. it is broken), so their requests fail right away.
+            task = loop.create_future()
+            task.set_exception(e)
+        task.add_done_callback(lambda done: self.resolve(batch, done))
+
+    def resolve(self, batch: List[tuple], done: asyncio.Future) -> None:
+        """ Hands the outputs of a group of jobs to the requests that are waiting for them.
+
+        Args:
+            batch (List[tuple]): (job, future, arrival time) of every job of the group.
+            done (asyncio.Future): Outputs of the group.
+        """
+        error = done.exception()
+        if error is None:
+            outputs, pid, caches = done.result()
+            self.metrics.caches[pid] = caches
+        else:
+            outputs = [None]*len(batch)
+        now = timer()
+        for (job, future, arrived), output in zip(batch, outputs):
+            if output is None:
+                output = {"job": job.get("job"), "error": type(error).__name__ + ": " + str(error)}
+            self.metrics.record(job.get("job"), now - arrived, "error" in output)
+            if not future.done():
+                future.set_result(output)
+
+
+class JobServer:
+    """ HTTP/1.1 server, with keep-alive, over asyncio streams.
+    """
+
+    def __init__(self, host: str = HOST, port: int = PORT, workers: int = None,
+                 max_batch_size: int = MAX_BATCH_SIZE, window: float = BATCH_WINDOW) -> None:
+        """
+        Args:
+            host (str, optional): Address to listen on. Defaults to HOST.
+            port (int, optional): Port to listen on. 0 picks a free port. Defaults to PORT.
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            max_batch_size (int, optional): Largest group of jobs. Defaults to MAX_BATCH_SIZE.
+            window (float, optional): Longest wait for more jobs, in seconds. Defaults to BATCH_WINDOW.
+        """
+        self.host = host
+        self.port = port
+        # Workers are started lazily, after the server is listening. Forked workers would inherit the
+        # listening socket and the sockets of open connections, so that closing a connection would not
+        # send EOF to its client. The forkserver starts them from a clean process instead.
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=preload_jobs,
+                                            mp_context=multiprocessing.get_context("forkserver"))
+        self.metrics = Metrics()
+        self.batcher = JobBatcher(self.executor, self.metrics, max_batch_size, window)
+        self.schema = None
+        self.server = None
+
+    async def start(self) -> int:
+        """ Starts listening.
+
+        Returns:
+            int: Port the server listens on.
+        """
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """ Stops listening and shuts the worker processes down.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Serves every request of a connection.
+        """
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                if isinstance(body, int):
+                    status, response = body, {"error": STATUS[body]}
+                else:
+                    try:
+                        status, response = await self.route(method, path, body)
+                    except Exception as e:
+                        status, response = 500, {"error": type(e).__name__ + ": " + str(e)}
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.write_response(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, dict, object]:
+        """ Reads a request.
+
+        Returns:
+            Tuple[str, str, dict, object]: Method, path, headers (lower-case names) and body, which is
+                                           the raw bytes, or an error status if it could not be read.
+                                           None if the connection was closed.
+        """
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, path, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return "", "", {"connection": "close"}, 400
+
+        headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            headers["connection"] = "close"
+            return method, path, headers, 400
+        if length > MAX_BODY_SIZE:
+            headers["connection"] = "close"
+            return method, path, headers, 413
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), path.split("?")[0], headers, body
+
+    async def write_response(self, writer: asyncio.StreamWriter, status: int, response, keep_alive: bool) -> None:
+        body = json.dumps(response, default=jobs.to_json).encode()
+        head = ("HTTP/1.1 " + str(status) + " " + STATUS[status] + "\r\n" +
+                "Content-Type: application/json\r\n" +
+                "Content-Length: " + str(len(body)) + "\r\n" +
+                "Connection: " + ("keep-alive" if keep_alive else "close") + "\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def route(self, method: str, path: str, body: bytes) -> Tuple[int, object]:
+        """ Dispatches a request to its endpoint.
+
+        Returns:
+            Tuple[int, object]: Status and response, which is serialized to JSON.
+        """
+        path = path.rstrip("/") or "/"
+        if path == "/health":
+            return (200, {"status": "ok"}) if method == "GET" else (405, {"error": STATUS[405]})
+        if path == "/metrics":
+            return (200, self.metrics.snapshot()) if method == "GET" else (405, {"error": STATUS[405]})
+        if path == "/jobs":
+            if method != "GET":
+                return 405, {"error": STATUS[405]}
+            if self.schema is None:
+                self.schema = get_schema()
+            return 200, self.schema
+
+        if path.startswith("/jobs/") or path == "/batch":
+            if method != "POST":
+                return 405, {"error": STATUS[405]}
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError as e:
+                return 400, {"error": "Invalid JSON: " + str(e)}
+
+            if path == "/batch":
+                batch = payload.get("jobs") if isinstance(payload, dict) else payload
+                if not isinstance(batch, list) or not all(isinstance(job, dict) for job in batch):
+                    return 400, {"error": "Expected a list of jobs."}
+                outputs = await asyncio.gather(*(self.batcher.submit(job) for job in batch))
+                for index, output in enumerate(outputs):
+                    output["index"] = index
+                return 200, outputs
+
+            job = path[len("/jobs/"):]
+            if job not in jobs.JOBS:
+                return 404, {"error": "Job " + job + " does not exist. Available jobs: " + ", ".join(jobs.JOBS)}
+            if not isinstance(payload, dict):
+                return 400, {"error": "Expected an object with the parameters of the job."}
+            output = await self.batcher.submit(dict(payload, job=job))
+            return (422 if "error" in output else 200), output
+
+        return 404, {"error": "Unknown endpoint " + path}
+
+
+def main(args: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m server", description="Local HTTP/JSON service of the solvers.")
+    parser.add_argument("--host", default=HOST, help="Address to listen on. Defaults to " + HOST + ".")
+    parser.add_argument("--port", type=int, default=PORT, help="Port to listen on. Defaults to " + str(PORT) + ".")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes. Defaults to the CPUs.")
+    parser.add_argument("--cache-dir", default=None, help="Directory of the on-disk cache of results.")
+    options = parser.parse_args(args)
+    if options.cache_dir is not None:
+        Memoization.set_disk_cache_directory(options.cache_dir)
+
+    async def serve() -> None:
+        server = JobServer(options.host, options.port, options.workers)
+        port = await server.start()
+        print("Serving on http://" + options.host + ":" + str(port) + " with " +
+              str(options.workers or os.cpu_count()) + " workers. Press Ctrl+C to stop.")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()